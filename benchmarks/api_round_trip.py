@@ -0,0 +1,100 @@
+"""
+Measures the per move round trip overhead of the APIPlayer.
+
+Plays the same seeded game twice, once with local bots and once with every colour
+played by an APIPlayer talking to a BotServer hosting the same bot, and reports the
+time per move for both.
+
+usage: python benchmarks/api_round_trip.py [--bot RANDOM] [--unix]
+"""
+# Python Imports
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.bots.bot_enums import BotEnum
+from blokus.game import Game
+from blokus.player.api_server import BotServer
+from blokus.player.player_factory import PlayerFactory
+
+
+def time_local_game(bot_enum: BotEnum, seed: int) -> list[float]:
+    """Plays a game with local bots, timing each move selection"""
+    random.seed(seed)
+    board = Board()
+    players = [PlayerFactory.build_local_player_from_enum(board, c, bot_enum) for c in BoardStatesEnum.get_player_colours()]
+    times = []
+    for player in players:
+        select_best_move = player.select_best_move
+
+        def timed(moves, select_best_move=select_best_move):
+            start = time.perf_counter()
+            move = select_best_move(moves)
+            times.append(time.perf_counter() - start)
+            return move
+
+        player.select_best_move = timed
+    Game(board, players).play_game(display=False)
+    return times
+
+
+def time_api_game(bot_enum: BotEnum, seed: int, address: str) -> list[float]:
+    """Plays a game with api players, returning the round trip of each move"""
+    random.seed(seed)
+    board = Board()
+    players = [PlayerFactory.build_api_player(board, c, address) for c in BoardStatesEnum.get_player_colours()]
+    Game(board, players).play_game(display=False)
+    times = []
+    for player in players:
+        times += player.round_trip_times
+        player.close()
+    return times
+
+
+def summarise(name: str, times: list[float]):
+    """Prints summary statistics of the move times in milliseconds"""
+    times_ms = sorted(t * 1e3 for t in times)
+    p99 = times_ms[min(len(times_ms) - 1, int(len(times_ms) * 0.99))]
+    print(
+        f"{name:>6}: {len(times_ms)} moves, mean {statistics.mean(times_ms):.3f}ms, "
+        f"median {statistics.median(times_ms):.3f}ms, p99 {p99:.3f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bot", default="RANDOM", choices=[b.name for b in BotEnum])
+    parser.add_argument("--unix", action="store_true", help="serve over a unix socket instead of tcp")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    bot_enum = BotEnum[args.bot]
+
+    # run the server on its own event loop thread
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    server = BotServer(bot_enum)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        socket_path = str(Path(tmp_dir) / "bot.sock") if args.unix else None
+        address = asyncio.run_coroutine_threadsafe(server.start(socket_path=socket_path), loop).result()
+
+        local_times = time_local_game(bot_enum, args.seed)
+        api_times = time_api_game(bot_enum, args.seed, address)
+
+        asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+
+    summarise("local", local_times)
+    summarise("api", api_times)
+    overhead = statistics.mean(api_times) - statistics.mean(local_times)
+    print(f"round trip overhead per move: {overhead * 1e3:.3f}ms over {address}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Compares playing random games one `Game` at a time against playing them
+in lockstep with a `BatchSimulator`.
+
+    python benchmarks/batch_simulation.py --games 10000 --sequential-games 5
+"""
+
+# Python Imports
+import argparse
+import random
+import time
+
+# Internal Imports
+from blokus.batch_simulation import BatchPolicyEnum, BatchSimulator
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.bots.bot_enums import BotEnum
+from blokus.game import Game
+from blokus.player.player_factory import PlayerFactory
+
+
+def play_sequential_game(bot: BotEnum):
+    board = Board()
+    players = [PlayerFactory.build_local_player_from_enum(board, colour, bot) for colour in BoardStatesEnum.get_player_colours()]
+    game = Game(board, players)
+    while not game.is_finished:
+        game.play_turn()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=10_000)
+    parser.add_argument("--sequential-games", type=int, default=5)
+    parser.add_argument("--policy", choices=[policy.name for policy in BatchPolicyEnum], default=BatchPolicyEnum.RANDOM.name)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    policy = BatchPolicyEnum[args.policy]
+    random.seed(args.seed)
+    start = time.perf_counter()
+    for _ in range(args.sequential_games):
+        play_sequential_game(BotEnum[policy.name])
+    sequential = (time.perf_counter() - start) / max(args.sequential_games, 1)
+
+    simulator = BatchSimulator(args.games, policy, seed=args.seed)
+    start = time.perf_counter()
+    scores = simulator.run()
+    batch = time.perf_counter() - start
+
+    print(f"sequential: {sequential * 1e3:.1f}ms per game")
+    print(f"batch:      {batch:.2f}s for {args.games} games, {batch / args.games * 1e3:.3f}ms per game over {simulator.turn} steps")
+    print(f"speed up:   {sequential * args.games / batch:.0f}x")
+    print(f"mean scores {dict(zip([colour.str_id for colour in BoardStatesEnum.get_player_colours()], scores.mean(axis=0).round(1).tolist()))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Compares sending positions to worker processes by pickling boards
+against publishing them to a shared memory `BoardArena` and sending slot indexes.
+
+    python benchmarks/shared_board_arena.py --positions 64 --workers 4
+"""
+
+# Python Imports
+import argparse
+import pickle
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_arena import BoardArena
+from blokus.board_states import BoardStatesEnum
+
+_ARENA: BoardArena = None
+
+
+def _attach(name: str):
+    global _ARENA
+    _ARENA = BoardArena.attach(name)
+
+
+def _score_slot(slot: int) -> int:
+    board, colour, _ = _ARENA.read_board(slot)
+    return _score_board(board, colour)
+
+
+def _score_board(board: Board, colour: BoardStatesEnum) -> int:
+    return len(board.get_valid_moves_for_colour(colour))
+
+
+def build_positions(count: int, plies: int) -> list[tuple[Board, BoardStatesEnum]]:
+    positions = []
+    colours = BoardStatesEnum.get_player_colours()
+    for _ in range(count):
+        board = Board()
+        for ply in range(plies):
+            moves = board.get_valid_moves_for_colour(colours[ply % len(colours)])
+            if moves:
+                board.play_move(random.choice(moves))
+        positions.append((board, colours[plies % len(colours)]))
+    return positions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--positions", type=int, default=64)
+    parser.add_argument("--plies", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    positions = build_positions(args.positions, args.plies)
+    pickled_bytes = sum(len(pickle.dumps(position)) for position in positions)
+
+    with ProcessPoolExecutor(args.workers) as executor:
+        start = time.perf_counter()
+        pickled_scores = list(executor.map(_score_board, *zip(*positions)))
+        pickled_elapsed = time.perf_counter() - start
+
+    with BoardArena.create(len(positions)) as arena:
+        for slot, (board, colour) in enumerate(positions):
+            arena.publish(slot, board, colour)
+        slots = list(range(len(positions)))
+        with ProcessPoolExecutor(args.workers, initializer=_attach, initargs=(arena.name,)) as executor:
+            start = time.perf_counter()
+            arena_scores = list(executor.map(_score_slot, slots))
+            arena_elapsed = time.perf_counter() - start
+        slot_bytes = sum(len(pickle.dumps(slot)) for slot in slots)
+
+    assert pickled_scores == arena_scores
+    print(f"pickled boards: {pickled_bytes / len(positions):.0f} bytes per task, {pickled_elapsed:.2f}s")
+    print(f"arena slots:    {slot_bytes / len(positions):.0f} bytes per task, {arena_elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Compares the memory held by the valid moves of boards stored as records of a
+`ValidMoveStore` against the same moves held as lists of `Move` objects.
+Both are measured with tracemalloc, the `nbytes` the stores report is shown alongside.
+
+    python benchmarks/valid_move_memory.py --plies 0 4 8 16 24
+"""
+
+# Python Imports
+import argparse
+import random
+import time
+import tracemalloc
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+
+
+def build_position(plies: int) -> Board:
+    board = Board()
+    colours = BoardStatesEnum.get_player_colours()
+    for ply in range(plies):
+        moves = board.get_valid_moves_for_colour(colours[ply % len(colours)])
+        if moves:
+            board.play_move(random.choice(moves))
+    return board
+
+
+def measure_stores(board: Board) -> int:
+    # everything a copy of the stores allocates, the objects as well as their arrays,
+    # fetched first as fetching derives the moves of colours yet to play
+    stores = [board._get_valid_move_store(colour) for colour in BoardStatesEnum.get_player_colours()]
+    tracemalloc.start()
+    copies = [store.copy() for store in stores]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+
+def measure_move_lists(board: Board) -> int:
+    # the moves are built from the records, including the ids they cache
+    tracemalloc.start()
+    move_lists = {}
+    for colour in BoardStatesEnum.get_player_colours():
+        move_lists[colour] = list(board.get_valid_moves_for_colour(colour))
+        for move in move_lists[colour]:
+            move.move_id
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--plies", type=int, nargs="+", default=[0, 4, 8, 16, 24])
+    parser.add_argument("--copies", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    print(f"{'plies':>5} {'moves':>6} {'nbytes':>10} {'stores':>10} {'moves':>10} {'ratio':>6} {'copy':>9}")
+    for plies in args.plies:
+        board = build_position(plies)
+        # the first colour moves are derived on request, so derive them before measuring
+        for colour in BoardStatesEnum.get_player_colours():
+            board.get_valid_moves_for_colour(colour)
+
+        nbytes = board.valid_move_nbytes
+        stores = measure_stores(board)
+        move_lists = measure_move_lists(board)
+
+        start = time.perf_counter()
+        for _ in range(args.copies):
+            board.copy()
+        copy_time = (time.perf_counter() - start) / args.copies
+
+        print(
+            f"{plies:>5} {board.valid_move_count:>6} {nbytes:>10,} {stores:>10,} {move_lists:>10,} "
+            f"{move_lists / stores:>5.1f}x {copy_time * 1e3:>7.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
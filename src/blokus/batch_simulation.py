@@ -0,0 +1,473 @@
+"""
+Lockstep simulation of many games at once.
+
+Every game is held as rows of stacked arrays rather than a `Board`, the cells, the cells each colour
+is blocked from (covered, or sharing an edge with the colour) and the anchors of each colour (free cells
+diagonal to the colour, and the board corners). The arrays are padded so that every placement near an
+anchor stays within them, the padding is blocked for every colour, so no bounds checks are needed.
+
+A placement is a cell of an orientation put on an anchor, so it always covers an anchor and is legal
+if none of its cells are blocked. Each step gives the colour to move a turn in every unfinished game.
+"""
+
+# Python Imports
+from enum import Enum
+from functools import lru_cache
+
+# External Imports
+import numpy as np
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.move import Move
+from blokus.pieces.catalogue import MAX_PIECE_SIZE, PIECE_ORDER, encode_move_id, get_piece_catalogue
+from blokus.pieces.piece_set import build_full_piece_set
+
+_PLAYER_COLOURS = BoardStatesEnum.get_player_colours()
+_COLOUR_IDS = np.array([colour.int_id for colour in _PLAYER_COLOURS], dtype=np.uint8)
+# cells of a placement are at most 4 rows or cols from its anchor, its edges and corners 5
+_PADDING = MAX_PIECE_SIZE
+# cells of a placement are within this square around its anchor
+_REACH = 2 * MAX_PIECE_SIZE - 1
+# uint64 words holding a bitmask of the square
+_NEIGHBOURHOOD_WORDS = 2
+# every colour passes once it is out of pieces, so no game lasts longer than this
+_MAX_TURNS = len(_PLAYER_COLOURS) * (len(PIECE_ORDER) + 1)
+
+
+class BatchPolicyEnum(Enum):
+    """How the simulator picks the move of each game
+
+    - RANDOM: a random placement, picking an anchor, then a remaining piece, then a placement of it on the anchor
+    - GREEDY: as random but only from the biggest pieces that can be played, as `GreedyBot`
+    """
+
+    RANDOM = "random"
+    GREEDY = "greedy"
+
+
+@lru_cache(maxsize=None)
+def _get_placements(width: int) -> dict[str, np.ndarray]:
+    """Builds every placement of every orientation relative to the anchor it is put on,
+    as steps over the flat padded arrays of the supplied width. Placements are grouped by piece.
+    Shorter pieces are padded with the anchor, which is harmless as it is always covered
+
+    Args:
+        width (int): width of the padded arrays
+
+    Returns:
+        dict[str, np.ndarray]: read only arrays indexed by placement
+    """
+    catalogue = get_piece_catalogue()
+    placements = {"pieces": [], "orientation_ids": [], "sizes": [], "pivots": [], "neighbourhoods": [], "cells": [], "edges": [], "corners": []}
+    for orientation in catalogue.orientations:
+        for pivot in orientation.offsets:
+            steps = {}
+            for key, offsets in (("cells", orientation.offsets), ("edges", orientation.edge_offsets), ("corners", orientation.corner_offsets)):
+                relative = offsets.astype(np.intp) - pivot
+                padded = np.zeros(4 * MAX_PIECE_SIZE, dtype=np.intp)
+                padded[: len(relative)] = relative[:, 0] * width + relative[:, 1]
+                steps[key] = padded
+            placements["pieces"].append(orientation.piece_id)
+            placements["orientation_ids"].append(orientation.orientation_id)
+            placements["sizes"].append(orientation.size)
+            placements["pivots"].append(int(pivot[0]) * width + int(pivot[1]))
+            placements["cells"].append(steps["cells"][:MAX_PIECE_SIZE])
+            placements["edges"].append(steps["edges"])
+            placements["corners"].append(steps["corners"])
+            neighbourhood = np.zeros((_REACH, _REACH), dtype=bool)
+            neighbourhood[tuple((orientation.offsets.astype(np.intp) - pivot + MAX_PIECE_SIZE - 1).T)] = True
+            placements["neighbourhoods"].append(neighbourhood.ravel())
+
+    arrays = {key: np.array(values) for key, values in placements.items()}
+    # bitmasks of the cells within reach of the anchor, bit n is cell n of the flattened neighbourhood
+    neighbourhoods = np.packbits(arrays["neighbourhoods"], axis=1, bitorder="little")
+    arrays["neighbourhoods"] = np.pad(neighbourhoods, [(0, 0), (0, 8 * _NEIGHBOURHOOD_WORDS - neighbourhoods.shape[1])]).view(np.uint64)
+    steps = np.arange(_REACH) - MAX_PIECE_SIZE + 1
+    arrays["neighbourhood_steps"] = (steps[:, None] * width + steps[None, :]).ravel()
+    counts = np.bincount(arrays["pieces"], minlength=len(PIECE_ORDER))
+    arrays["piece_counts"] = counts
+    arrays["piece_starts"] = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    arrays["piece_sizes"] = np.zeros(len(PIECE_ORDER), dtype=np.intp)
+    arrays["piece_sizes"][arrays["pieces"]] = arrays["sizes"]
+    for array in arrays.values():
+        array.setflags(write=False)
+    return arrays
+
+
+class BatchSimulator:
+    """Plays many games in lockstep over stacked arrays, with vectorised legality checks and policies.
+
+    Moves are found by sampling, each unfinished game draws `attempts` placements at once and plays
+    the first legal one. Games where every attempt failed fall back to checking every placement on
+    every anchor, which either finds their moves or shows the colour is unable to play. A colour is
+    out of the game once it is unable to play, a game is retired once every colour is out.
+
+    Move ids are kept per turn, turn t is a turn of the colour `get_player_colours()[t % 4]`,
+    so any game can be replayed on a `Board` with `get_board`.
+    """
+
+    def __init__(
+        self,
+        game_count: int,
+        policy: BatchPolicyEnum = BatchPolicyEnum.RANDOM,
+        dimension: int = 20,
+        attempts: int = 32,
+        seed: int = None,
+    ):
+        """initialiser for the simulator, with every game at the empty board
+
+        Args:
+            game_count (int): number of games to play
+            policy (BatchPolicyEnum, optional): how moves are picked. Defaults to BatchPolicyEnum.RANDOM.
+            dimension (int, optional): dimension of the boards. Defaults to 20.
+            attempts (int, optional): placements drawn per game each step before checking every placement. Defaults to 32.
+            seed (int, optional): seed of the random generator. Defaults to None.
+        """
+        self.policy = policy
+        self.dimension = dimension
+        self.attempts = attempts
+        self._rng = np.random.default_rng(seed)
+        self._width = dimension + 2 * _PADDING
+        self._placements = _get_placements(self._width)
+
+        colour_count = len(_PLAYER_COLOURS)
+        size = self._width**2
+        self._cells = np.zeros((game_count, size), dtype=np.uint8)
+        # the blocked cells and anchors of a colour are contiguous, as each step reads a single colour
+        self._blocked = np.ones((colour_count, game_count, size), dtype=bool)
+        self._unpad(self._blocked)[:] = False
+        # anchors are only held for the board cells, with an extra cell that writes to the padding go to
+        self._padded_cells = np.flatnonzero(~self._blocked[0, 0])
+        self._board_cells = np.full(size, dimension**2)
+        self._board_cells[self._padded_cells] = np.arange(dimension**2)
+        self._anchors = np.zeros((colour_count, game_count, dimension**2 + 1), dtype=bool)
+        for row, col in ((0, 0), (0, dimension - 1), (dimension - 1, 0), (dimension - 1, dimension - 1)):
+            self._anchors[:, :, row * dimension + col] = True
+        self._piece_masks = np.full((game_count, colour_count), build_full_piece_set().to_mask(), dtype=np.uint32)
+        self._eliminated = np.zeros((game_count, colour_count), dtype=bool)
+        self._move_ids = np.full((game_count, _MAX_TURNS), -1, dtype=np.int32)
+        self._turn = 0
+
+    @property
+    def game_count(self) -> int:
+        """Returns the number of games
+
+        Returns:
+            int: number of games
+        """
+        return len(self._cells)
+
+    @property
+    def turn(self) -> int:
+        """Returns the number of steps taken
+
+        Returns:
+            int: turns played in every game
+        """
+        return self._turn
+
+    @property
+    def boards(self) -> np.ndarray:
+        """Returns the boards of the games
+
+        Returns:
+            np.ndarray: (games, dimension, dimension) uint8 view of the int ids of the cells
+        """
+        return self._unpad(self._cells)
+
+    @property
+    def anchors(self) -> np.ndarray:
+        """Returns the anchors of each colour of the games, the cells its next piece can cover a corner with
+
+        Returns:
+            np.ndarray: (games, colours, dimension, dimension) bool view in the order of `get_player_colours`
+        """
+        anchors = self._anchors[..., :-1].reshape(self._anchors.shape[:2] + (self.dimension, self.dimension))
+        return anchors.swapaxes(0, 1)
+
+    @property
+    def piece_masks(self) -> np.ndarray:
+        """Returns the remaining pieces of each colour of the games
+
+        Returns:
+            np.ndarray: (games, colours) uint32 bitmasks, see `PieceSet.to_mask`
+        """
+        return self._piece_masks
+
+    @property
+    def eliminated(self) -> np.ndarray:
+        """Returns which colours of the games are unable to play
+
+        Returns:
+            np.ndarray: (games, colours) bool in the order of `get_player_colours`
+        """
+        return self._eliminated
+
+    @property
+    def finished(self) -> np.ndarray:
+        """Returns which games are over, which is when no colour is able to play
+
+        Returns:
+            np.ndarray: bool per game
+        """
+        return self._eliminated.all(axis=1)
+
+    @property
+    def is_finished(self) -> bool:
+        """Returns if every game is over
+
+        Returns:
+            bool: if every game is over
+        """
+        return bool(self._eliminated.all())
+
+    @property
+    def move_ids(self) -> np.ndarray:
+        """Returns the move played in each turn of the games, -1 if the colour did not play
+
+        Returns:
+            np.ndarray: (games, turns) move ids
+        """
+        return self._move_ids[:, : self._turn]
+
+    def get_scores(self) -> np.ndarray:
+        """Returns the score of every colour of the games, the cells they cover
+
+        Returns:
+            np.ndarray: (games, colours) scores in the order of `get_player_colours`
+        """
+        return (self._cells[:, None, :] == _COLOUR_IDS[None, :, None]).sum(axis=2)
+
+    def get_board(self, game: int) -> Board:
+        """Replays a game on a board, validating every move
+
+        Args:
+            game (int): index of the game
+
+        Returns:
+            Board: board of the game
+        """
+        board = Board(self.dimension)
+        for turn, move_id in enumerate(self.move_ids[game]):
+            if move_id >= 0:
+                board.play_move(Move.from_move_id(_PLAYER_COLOURS[turn % len(_PLAYER_COLOURS)], int(move_id)))
+        return board
+
+    def run(self) -> np.ndarray:
+        """Steps until every game is over
+
+        Returns:
+            np.ndarray: (games, colours) final scores in the order of `get_player_colours`
+        """
+        while not self.is_finished:
+            self.step()
+        return self.get_scores()
+
+    def step(self):
+        """Gives the colour to move a turn in every game where it is still able to play"""
+        colour = self._turn % len(_PLAYER_COLOURS)
+        games = np.flatnonzero(~self._eliminated[:, colour])
+        self._turn += 1
+        if not len(games):
+            return
+
+        # flat list of the anchors of the games, grouped by game, only colours able to play have anchors
+        anchor_games, anchor_cells = np.nonzero(self._anchors[colour])
+        anchor_counts = np.bincount(anchor_games, minlength=self.game_count)[games]
+        anchors = (anchor_counts, np.cumsum(anchor_counts) - anchor_counts, self._padded_cells[anchor_cells])
+        pieces = self._get_playable_pieces(games, colour)
+
+        placed = np.zeros(len(games), dtype=bool)
+        moves = np.zeros((len(games), 2), dtype=np.intp)
+        # games without anchors or pieces are unable to play, the rest draw, then draw more, then search
+        missed = np.flatnonzero((anchor_counts > 0) & pieces.any(axis=1))
+        for attempts in (self.attempts, 4 * self.attempts, None):
+            if not len(missed):
+                break
+            if attempts is None:
+                found, missed_moves = self._search(games, colour, missed, anchors)
+            else:
+                found, missed_moves = self._sample(games, colour, missed, anchors, pieces, attempts)
+            placed[missed[found]] = True
+            moves[missed[found]] = missed_moves
+            missed = missed[~found]
+
+        self._eliminated[games[~placed], colour] = True
+        self._anchors[colour, games[~placed]] = False
+        self._apply(games[placed], colour, moves[placed, 0], moves[placed, 1])
+
+    def _get_playable_pieces(self, games: np.ndarray, colour: int) -> np.ndarray:
+        """Returns the pieces each game draws from, the remaining pieces or for the greedy policy
+        only the biggest of them
+
+        Args:
+            games (np.ndarray): games to move in
+            colour (int): index of the colour to move
+
+        Returns:
+            np.ndarray: (games, pieces) bool
+        """
+        pieces = (self._piece_masks[games, colour, None] >> np.arange(len(PIECE_ORDER), dtype=np.uint32)) & 1 == 1
+        if self.policy is BatchPolicyEnum.GREEDY:
+            sizes = np.where(pieces, self._placements["piece_sizes"], 0)
+            pieces &= sizes == sizes.max(axis=1, keepdims=True)
+        return pieces
+
+    def _sample(
+        self,
+        games: np.ndarray,
+        colour: int,
+        drawing: np.ndarray,
+        anchors: tuple[np.ndarray, np.ndarray, np.ndarray],
+        pieces: np.ndarray,
+        attempts: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Draws placements for games at once and keeps the first legal one of each
+
+        Args:
+            games (np.ndarray): games to move in
+            colour (int): index of the colour to move
+            drawing (np.ndarray): indexes into `games` to draw for
+            anchors (tuple[np.ndarray, np.ndarray, np.ndarray]): count of the anchors of each game,
+                                                                 where they start and the flat list of anchor cells
+            pieces (np.ndarray): (games, pieces) bool of the pieces to draw from
+            attempts (int): placements drawn per game
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: if a placement was found and (anchor cell, placement) of each game found
+        """
+        anchor_counts, anchor_starts, anchor_cells = anchors
+        shape = (len(drawing), attempts)
+        anchor_idxs = anchor_starts[drawing, None] + (self._rng.random(shape) * anchor_counts[drawing, None]).astype(np.intp)
+        drawn_anchors = anchor_cells[anchor_idxs]
+
+        # the nth remaining piece of each game, found from the flat list of remaining pieces
+        piece_counts = pieces[drawing].sum(axis=1)
+        piece_ids = np.nonzero(pieces[drawing])[1]
+        piece_idxs = (np.cumsum(piece_counts) - piece_counts)[:, None] + (self._rng.random(shape) * piece_counts[:, None]).astype(np.intp)
+        drawn_pieces = piece_ids[piece_idxs]
+
+        counts = self._placements["piece_counts"][drawn_pieces]
+        drawn_placements = self._placements["piece_starts"][drawn_pieces] + (self._rng.random(shape) * counts).astype(np.intp)
+
+        cells = drawn_anchors[..., None] + self._placements["cells"][drawn_placements]
+        legal = ~self._get_blocked(games[drawing, None, None], colour, cells).any(axis=2)
+
+        first = legal.argmax(axis=1)
+        found = legal[np.arange(len(drawing)), first]
+        rows, first = np.flatnonzero(found), first[found]
+        return found, np.stack([drawn_anchors[rows, first], drawn_placements[rows, first]], axis=1)
+
+    def _search(
+        self,
+        games: np.ndarray,
+        colour: int,
+        missed: np.ndarray,
+        anchors: tuple[np.ndarray, np.ndarray, np.ndarray],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Checks every placement of every remaining piece on every anchor of the games no draw was legal in,
+        picking a random legal one, or for the greedy policy a random one of the biggest
+
+        Args:
+            games (np.ndarray): games to move in
+            colour (int): index of the colour to move
+            missed (np.ndarray): indexes into `games` to search
+            anchors (tuple[np.ndarray, np.ndarray, np.ndarray]): count of the anchors of each game,
+                                                                 where they start and the flat list of anchor cells
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: if a placement was found and (anchor cell, placement) of each game found
+        """
+        anchor_counts, anchor_starts, anchor_cells = anchors
+        # every anchor of the missed games, grouped by game
+        counts = anchor_counts[missed]
+        owners = np.repeat(np.arange(len(missed)), counts)
+        anchor_cells = anchor_cells[np.repeat(anchor_starts[missed] - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())]
+
+        # a placement is legal on an anchor if its cells miss the blocked cells around the anchor,
+        # checked for every placement of every anchor at once as bitmasks of the neighbourhood
+        around = anchor_cells[:, None] + self._placements["neighbourhood_steps"]
+        blocked = np.packbits(self._get_blocked(games[missed][owners, None], colour, around), axis=1, bitorder="little")
+        blocked = np.pad(blocked, [(0, 0), (0, 8 * _NEIGHBOURHOOD_WORDS - blocked.shape[1])]).view(np.uint64)
+        neighbourhoods = self._placements["neighbourhoods"]
+        remaining = (self._piece_masks[games[missed], colour, None] >> self._placements["pieces"].astype(np.uint32)) & 1 == 1
+        legal = remaining[owners]
+        legal &= (blocked[:, None, 0] & neighbourhoods[None, :, 0]) == 0
+        legal &= (blocked[:, None, 1] & neighbourhoods[None, :, 1]) == 0
+        if self.policy is BatchPolicyEnum.GREEDY:
+            sizes = np.where(legal, self._placements["sizes"], 0).max(axis=1)
+            biggest = np.maximum.reduceat(sizes, np.cumsum(counts) - counts)
+            legal &= self._placements["sizes"] == biggest[owners, None]
+
+        pair_anchors, pair_placements = np.nonzero(legal)
+        pair_owners = owners[pair_anchors]
+        pair_anchors = anchor_cells[pair_anchors]
+
+        # a random legal pair of each game, the pairs are already grouped by game
+        legal_counts = np.bincount(pair_owners, minlength=len(missed))
+        found = legal_counts > 0
+        picks = (np.cumsum(legal_counts) - legal_counts + (self._rng.random(len(missed)) * legal_counts).astype(np.intp))[found]
+        return found, np.stack([pair_anchors[picks], pair_placements[picks]], axis=1)
+
+    def _get_blocked(self, games: np.ndarray, colour: int, cells: np.ndarray) -> np.ndarray:
+        """Looks up the blocked cells of a colour through flat indexes, which is quicker than indexing each axis
+
+        Args:
+            games (np.ndarray): game of each cell, broadcast against the cells
+            colour (int): index of the colour
+            cells (np.ndarray): flat cells
+
+        Returns:
+            np.ndarray: bool per cell
+        """
+        return self._blocked[colour].reshape(-1)[games * self._width**2 + cells]
+
+    def _apply(self, games: np.ndarray, colour: int, anchors: np.ndarray, placements: np.ndarray):
+        """Plays a placement in each game
+
+        Args:
+            games (np.ndarray): games to play in
+            colour (int): index of the colour to move
+            anchors (np.ndarray): anchor cell of each placement
+            placements (np.ndarray): placement of each game
+        """
+        rows, cols = np.divmod(anchors - self._placements["pivots"][placements], self._width)
+        self._move_ids[games, self._turn - 1] = encode_move_id(
+            self._placements["pieces"][placements], self._placements["orientation_ids"][placements], rows - _PADDING, cols - _PADDING
+        )
+        self._piece_masks[games, colour] &= ~(np.uint32(1) << self._placements["pieces"][placements].astype(np.uint32))
+
+        cells = anchors[:, None] + self._placements["cells"][placements]
+        edges = anchors[:, None] + self._placements["edges"][placements]
+        corners = anchors[:, None] + self._placements["corners"][placements]
+        # flat indexes into the padded arrays and the anchors
+        size = self._cells.shape[1]
+        board_size = self._anchors.shape[2]
+        rows = games[:, None]
+        cells, board_cells = rows * size + cells, rows * board_size + self._board_cells[cells]
+        edges, board_edges = rows * size + edges, rows * board_size + self._board_cells[edges]
+        corners, board_corners = rows * size + corners, rows * board_size + self._board_cells[corners]
+        blocked = self._blocked.reshape(len(_PLAYER_COLOURS), -1)
+        anchors = self._anchors.reshape(len(_PLAYER_COLOURS), -1)
+
+        self._cells.reshape(-1)[cells] = _COLOUR_IDS[colour]
+        blocked[:, cells] = True
+        anchors[:, board_cells] = False
+        blocked[colour, edges] = True
+        anchors[colour, board_edges] = False
+        # blocked cells are never anchors
+        anchors[colour, board_corners] |= ~blocked[colour, corners]
+
+    def _unpad(self, array: np.ndarray) -> np.ndarray:
+        """Returns the board cells of flat padded arrays
+
+        Args:
+            array (np.ndarray): arrays with the padded cells on the last axis
+
+        Returns:
+            np.ndarray: view of the board cells
+        """
+        grid = array.reshape(array.shape[:-1] + (self._width, self._width))
+        return grid[..., _PADDING:-_PADDING, _PADDING:-_PADDING]
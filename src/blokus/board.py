@@ -1,6 +1,11 @@
 # Python Imports
 # Extenral Imports
+import json
+import logging
+import random
+import struct
 from copy import deepcopy
+from typing import Iterator
 from typing import Self
 import matplotlib as mpl
 import matplotlib.pyplot as plt
@@ -9,10 +14,17 @@ import numpy as np
 # Intenral Imports
 from blokus.board_states import BoardStatesEnum
 from blokus.exceptions import InvalidMove
+from blokus.masks import ADJACENT_STEPS, DIAGONAL_STEPS, shift_mask
 from blokus.move import Move
+from blokus.move_order import MoveOrderEnum
+from blokus.pattern_cache import get_fitting_piece_masks, get_pattern_cache, get_windows
+from blokus.pieces.catalogue import PIECE_ORDER, encode_move_id, get_piece_catalogue
+from blokus.pieces.piece_names import PieceNameEnum
 from blokus.pieces.piece_set import build_full_piece_set
 
 from blokus.pieces.piece_set import PieceSet
+from blokus.valid_moves import ValidMoves, ValidMoveStore, get_move_ids, get_window_masks
+from blokus.validation import MoveFailureEnum, ValidationPipeline, get_failure_message
 
 
 class Board:
@@ -39,9 +51,158 @@ class Board:
         else:
             self.__piece_sets = self._get_initial_piece_dict()
 
-        self.__valid_moves_dict: dict[BoardStatesEnum, list[Move]] = {colour: [] for colour in BoardStatesEnum.get_player_colours()}
+        # the valid moves of each colour are held as records, moves are only built when asked for
+        self.__valid_move_stores: dict[BoardStatesEnum, ValidMoveStore] = {
+            colour: ValidMoveStore() for colour in BoardStatesEnum.get_player_colours()
+        }
         self.__latest_move = None
         self.__move_list: list[Move] = []
+        self.__valid_moves_released = False
+        self.__undo_stack: list[tuple] = []
+        # verification of the incremental valid moves, see `enable_verification`
+        self.__verification_rate = 0.0
+        self.__verification_random = random.Random()
+        self.__verification_checks = 0
+        self.__verification_failures = 0
+
+        # a position part way through a game has valid moves that were never found incrementally
+        if board_array is not None and (board_array != BoardStatesEnum.EMPTY.int_id).any():
+            self._initialise_valid_moves()
+
+    @classmethod
+    def from_array(
+        cls, board_array: np.ndarray, piece_set: dict[BoardStatesEnum, PieceSet] = None, move_list: list[Move] = None
+    ) -> Self:
+        """Creates a board for any position, such as one loaded from a record, book or dataset.
+        The valid moves of every colour are derived from the array in one vectorised pass
+
+        Args:
+            board_array (np.ndarray): square array of the position
+            piece_set (dict[BoardStatesEnum, PieceSet], optional): unused pieces of each colour. Defaults to all pieces.
+            move_list (list[Move], optional): moves that led to the position, they are not replayed. Defaults to None.
+
+        Returns:
+            Board: board of the position
+        """
+        board = cls(len(board_array), np.asarray(board_array, dtype=int), piece_set)
+        if move_list:
+            board.__move_list = list(move_list)
+            board.__latest_move = board.__move_list[-1]
+        return board
+
+    def to_bytes(self, include_valid_moves: bool = False) -> bytes:
+        """Encodes the board into a compact binary form, see `from_buffer`.
+
+        Layout, little endian:
+         - header: magic, layout version, dimension, flags, number of moves played
+         - the board array, one uint8 per cell
+         - the remaining pieces of each player colour as uint32 bitmasks
+         - the moves played as uint32 move ids, then the uint8 int id of each move's colour
+         - if flagged, the number of valid moves of each player colour as uint32, then their uint32 move ids
+
+        Args:
+            include_valid_moves (bool, optional): if to include the valid moves, otherwise they
+                                                  are derived from the position when loading. Defaults to False.
+
+        Returns:
+            bytes: encoded board
+        """
+        colours = BoardStatesEnum.get_player_colours()
+        flags = _BUFFER_VALID_MOVES_FLAG if include_valid_moves else 0
+        parts = [
+            _BUFFER_HEADER.pack(_BUFFER_MAGIC, _BUFFER_VERSION, self.dimension, flags, len(self.move_list)),
+            self.array.astype(np.uint8).tobytes(),
+            np.array([self.piece_sets[colour].to_mask() for colour in colours], dtype="<u4").tobytes(),
+            np.array([move.move_id for move in self.move_list], dtype="<u4").tobytes(),
+            np.array([move.colour.int_id for move in self.move_list], dtype=np.uint8).tobytes(),
+        ]
+        if include_valid_moves:
+            if self.__valid_moves_released:
+                self._rebuild_valid_moves()
+            valid_ids = [self.__valid_move_stores[colour].move_ids for colour in colours]
+            parts.append(np.array([len(move_ids) for move_ids in valid_ids], dtype="<u4").tobytes())
+            parts += [move_ids.astype("<u4").tobytes() for move_ids in valid_ids]
+        return b"".join(parts)
+
+    @classmethod
+    def from_buffer(cls, buffer: memoryview) -> Self:
+        """Decodes a board encoded by `to_bytes`.
+        If the buffer is writable the board array is a uint8 view onto it rather than a copy,
+        so moves played on the board are written into the buffer. Otherwise the array is copied
+        into the int array of a board built any other way, as it is when unpickling
+
+        Args:
+            buffer (memoryview): encoded board, or any object supporting the buffer protocol
+
+        Raises:
+            ValueError: if the buffer is not an encoded board
+
+        Returns:
+            Board: decoded board
+        """
+        try:
+            magic, version, dimension, flags, move_count = _BUFFER_HEADER.unpack_from(buffer)
+        except struct.error as e:
+            raise ValueError(f"malformed board header: {e}") from e
+        if magic != _BUFFER_MAGIC or version != _BUFFER_VERSION:
+            raise ValueError(f"buffer is not a board of layout version {_BUFFER_VERSION}")
+
+        colours = BoardStatesEnum.get_player_colours()
+        colours_by_id = {colour.int_id: colour for colour in colours}
+        offset = _BUFFER_HEADER.size
+        array = np.frombuffer(buffer, dtype=np.uint8, count=dimension**2, offset=offset).reshape(dimension, dimension)
+        if not array.flags.writeable:
+            array = array.astype(int)
+        offset += dimension**2
+        piece_masks = np.frombuffer(buffer, dtype="<u4", count=len(colours), offset=offset)
+        offset += piece_masks.nbytes
+        move_ids = np.frombuffer(buffer, dtype="<u4", count=move_count, offset=offset)
+        offset += move_ids.nbytes
+        move_colours = np.frombuffer(buffer, dtype=np.uint8, count=move_count, offset=offset)
+        offset += move_colours.nbytes
+
+        piece_sets = {colour: PieceSet.from_mask(int(mask)) for colour, mask in zip(colours, piece_masks)}
+        # the array is set after construction so valid moves are only derived if they were not included
+        board = cls(dimension, piece_set=piece_sets)
+        board.__array = array
+        board.__move_list = [
+            Move.from_move_id(colours_by_id[colour_id], move_id) for move_id, colour_id in zip(move_ids.tolist(), move_colours.tolist())
+        ]
+        board.__latest_move = board.__move_list[-1] if board.__move_list else None
+
+        if not flags & _BUFFER_VALID_MOVES_FLAG:
+            if (array != BoardStatesEnum.EMPTY.int_id).any():
+                board._initialise_valid_moves()
+            return board
+
+        valid_counts = np.frombuffer(buffer, dtype="<u4", count=len(colours), offset=offset)
+        offset += valid_counts.nbytes
+        for colour, count in zip(colours, valid_counts.tolist()):
+            valid_ids = np.frombuffer(buffer, dtype="<u4", count=count, offset=offset)
+            offset += valid_ids.nbytes
+            board.__valid_move_stores[colour] = ValidMoveStore.from_move_ids(valid_ids)
+        return board
+
+    def __reduce__(self) -> tuple:
+        # pickle via the binary form rather than the piece objects and move dataclasses
+        return (Board.from_buffer, (self.to_bytes(include_valid_moves=True),))
+
+    def copy(self) -> Self:
+        """Creates an independent copy of the board including its valid moves
+
+        Returns:
+            Board: copy of the board
+        """
+        piece_sets = {colour: PieceSet(pieces=list(piece_set.pieces)) for colour, piece_set in self.piece_sets.items()}
+        # the array is set after construction so the valid moves are copied rather than derived
+        new_board = Board(self.dimension, piece_set=piece_sets)
+        new_board.__array = self.array.copy()
+        new_board.__valid_move_stores = {colour: store.copy() for colour, store in self.__valid_move_stores.items()}
+        new_board.__latest_move = self.__latest_move
+        new_board.__move_list = list(self.__move_list)
+        new_board.__valid_moves_released = self.__valid_moves_released
+        new_board.__verification_rate = self.__verification_rate
+        return new_board
 
     def create_future_board_from_move(self, move: Move) -> Self:
         """Creates a future board from a move
@@ -74,10 +235,8 @@ class Board:
         Raises:
             InvalidMove: If the move played was invalid
         """
-        move_errors = self.check_move_validity(move)
-
-        if move_errors:
-            raise InvalidMove(f"supplied Move is invalid due to {move_errors}")
+        if self.get_move_failure(move):
+            raise InvalidMove(f"supplied Move is invalid due to {self.check_move_validity(move)}")
         
         for idx_pair in move.idxs:
             row, col = idx_pair
@@ -87,7 +246,46 @@ class Board:
 
         self.__latest_move = move
         self.__move_list.append(move)
-        self._update_valid_moves()
+        # released moves are rebuilt from scratch when next needed
+        if not self.__valid_moves_released:
+            self._update_valid_moves()
+
+    def push_move(self, move: Move):
+        """Plays the move like `play_move`, recording what is needed
+        to take it back with `pop_move`. Used to make and unmake moves during search
+
+        Args:
+            move (Move): move to play on board
+
+        Raises:
+            InvalidMove: If the move played was invalid
+        """
+        if self.__valid_moves_released:
+            self._rebuild_valid_moves()
+        # the stores are updated in place, so copies of their arrays are kept to restore them
+        undo = (
+            self.__latest_move,
+            {colour: store.copy() for colour, store in self.__valid_move_stores.items()},
+            list(self.__piece_sets[move.colour].pieces),
+        )
+        self.play_move(move)
+        self.__undo_stack.append(undo)
+
+    def pop_move(self) -> Move:
+        """Takes back the last move played via `push_move`
+
+        Returns:
+            Move: the move taken back
+        """
+        latest_move, valid_move_stores, pieces = self.__undo_stack.pop()
+        move = self.__move_list.pop()
+        for row, col in move.idxs:
+            self.__array[row][col] = BoardStatesEnum.EMPTY.int_id
+
+        self.__piece_sets[move.colour].pieces = pieces
+        self.__valid_move_stores = valid_move_stores
+        self.__latest_move = latest_move
+        return move
 
     def get_score_for_colour(self, colour: BoardStatesEnum) -> int:
         """For the supplied colour gets the score.
@@ -102,6 +300,15 @@ class Board:
         score = sum([value == colour.int_id for value in self.flat_array])
         return score
 
+    def get_scores(self) -> np.ndarray:
+        """Returns the score of every colour, counted in one pass over the array
+
+        Returns:
+            np.ndarray: score of each colour in the order of `get_player_colours`
+        """
+        counts = np.bincount(self.array.ravel(), minlength=len(BoardStatesEnum))
+        return counts[[colour.int_id for colour in BoardStatesEnum.get_player_colours()]]
+
     def get_score_str(self) -> str:
         """Returns the score str, this has each colour
         and its associated score
@@ -169,30 +376,208 @@ class Board:
         if show:
             plt.show()
 
-    def get_valid_moves_for_colour(self, colour: BoardStatesEnum) -> list[Move]:
+    def get_valid_moves_for_colour(self, colour: BoardStatesEnum) -> ValidMoves:
         """
-        Returns a list of all valid moves for the supplied colour.
+        Returns all valid moves for the supplied colour.
         This takes into the account the board state and the remaining
-        moves pieces of the colour
+        moves pieces of the colour.
+
+        The moves are a read only sequence that builds each `Move` when it is accessed,
+        it is unaffected by moves played afterwards
 
         Args:
             colour (BoardStatesEnum): colour to get valid moves from
 
         Returns:
-            list[Move]: list of valid moves
+            ValidMoves: valid moves
         """
-        # if no moves played yet for colour, use brute force to find allowed moves
-        if not any(value == colour.int_id for value in self.flat_array):
-            valid_moves = self._find_valid_moves_brute_force(colour)
-            self.__valid_moves_dict[colour] = valid_moves
+        return self._get_valid_move_store(colour).view(colour)
+
+    def _get_valid_move_store(self, colour: BoardStatesEnum) -> ValidMoveStore:
+        """Returns the store of the valid moves of the colour, bringing it up to date first
+
+        Args:
+            colour (BoardStatesEnum): colour to get valid moves from
+
+        Returns:
+            ValidMoveStore: store of the valid moves
+        """
+        if self.__valid_moves_released:
+            self._rebuild_valid_moves()
 
-        return self.__valid_moves_dict[colour]
+        # if no moves played yet for colour, derive its moves from the free corners
+        if not (self.array == colour.int_id).any():
+            self._initialise_valid_moves([colour])
+
+        return self.__valid_move_stores[colour]
+
+    def valid_moves(
+        self, colour: BoardStatesEnum, piece: PieceNameEnum = None, size: int = None, touching: list[tuple[int]] = None
+    ) -> ValidMoves:
+        """Returns the valid moves of the colour matching the supplied filters.
+        Piece and size filters read the moves from the store's per piece buckets, so they take time
+        proportional to the result, the touching filter only checks the cell bitmasks of those moves.
+        Only the matching moves are built when accessed
+
+        Args:
+            colour (BoardStatesEnum): colour to get valid moves from
+            piece (PieceNameEnum, optional): only moves of this piece. Defaults to None.
+            size (int, optional): only moves of pieces with this many cells. Defaults to None.
+            touching (list[tuple[int]], optional): only moves covering at least one of these idxs. Defaults to None.
+
+        Returns:
+            ValidMoves: matching valid moves
+        """
+        store = self._get_valid_move_store(colour)
+
+        piece_types = [piece] if piece is not None else None
+        if size is not None:
+            piece_types = [piece_type for piece_type in piece_types or PIECE_ORDER if _get_piece_size(piece_type) == size]
+        piece_ids = None if piece_types is None else [PIECE_ORDER.index(piece_type) for piece_type in piece_types]
+        touching_mask = None if touching is None else self._get_idxs_mask(touching)
+        return store.view(colour, store.select(piece_ids, touching_mask))
+
+    def iter_valid_moves(self, colour: BoardStatesEnum, order: MoveOrderEnum = MoveOrderEnum.FOUND) -> Iterator[Move]:
+        """Yields the valid moves of the colour one at a time.
+        Cached moves are yielded directly, otherwise (before the colour's first move or after the
+        moves were released) placements are generated and yielded as they are found,
+        so stopping early skips the rest of the generation. Generated moves are not cached
+
+        Args:
+            colour (BoardStatesEnum): colour to get valid moves from
+            order (MoveOrderEnum, optional): order to yield the moves in. Defaults to MoveOrderEnum.FOUND.
+
+        Yields:
+            Iterator[Move]: valid moves
+        """
+        colour_has_cells = bool((self.array == colour.int_id).any())
+        if colour_has_cells and not self.__valid_moves_released:
+            yield from self._iter_cached_valid_moves(colour, order)
+            return
+
+        origins = [tuple(idx) for idx in np.argwhere(self.get_anchor_mask(colour)).tolist()]
+        # corner placements stay valid after the colour's first move
+        origins += [corner for corner in self.corner_idxs if not self.array[corner[0]][corner[1]] and corner not in origins]
+        pieces = list(self.__piece_sets[colour].pieces)
+        if order == MoveOrderEnum.RANDOM:
+            random.shuffle(origins)
+            random.shuffle(pieces)
+        elif order == MoveOrderEnum.LARGEST_FIRST:
+            pieces.sort(key=lambda piece: _get_piece_size(piece.name), reverse=True)
+
+        found = set()
+        for piece in pieces:
+            for origin in origins:
+                for piece_rep in piece.all_idx_representations:
+                    move = Move.from_piece_representation(colour, piece.name, piece_rep, origin)
+                    # pieces such as N and Z5 share placements, so moves are told apart by id rather than cells
+                    if move.move_id in found or not self.validate_move(move):
+                        continue
+                    found.add(move.move_id)
+                    yield move
+
+    def has_valid_move(self, colour: BoardStatesEnum) -> bool:
+        """Checks if the colour has any valid move, stopping at the first one found
+
+        Args:
+            colour (BoardStatesEnum): colour to check
+
+        Returns:
+            bool: if the colour is able to move
+        """
+        return next(self.iter_valid_moves(colour), None) is not None
+
+    def _iter_cached_valid_moves(self, colour: BoardStatesEnum, order: MoveOrderEnum) -> Iterator[Move]:
+        """Yields the cached valid moves of the colour in the supplied order
+
+        Args:
+            colour (BoardStatesEnum): colour to get valid moves from
+            order (MoveOrderEnum): order to yield the moves in
+
+        Yields:
+            Iterator[Move]: valid moves
+        """
+        store = self.__valid_move_stores[colour]
+        valid_moves = store.view(colour)
+        if order == MoveOrderEnum.RANDOM:
+            # lazy shuffle, each move is only picked once it is needed
+            idxs = list(range(len(valid_moves)))
+            for position in range(len(idxs)):
+                swap = random.randrange(position, len(idxs))
+                idxs[position], idxs[swap] = idxs[swap], idxs[position]
+                yield valid_moves[idxs[position]]
+        elif order == MoveOrderEnum.LARGEST_FIRST:
+            piece_sizes = np.array([_get_piece_size(piece_type) for piece_type in PIECE_ORDER])
+            sizes = piece_sizes[store.records["piece_id"]]
+            for idx in np.argsort(-sizes, kind="stable").tolist():
+                yield valid_moves[idx]
+        else:
+            yield from valid_moves
+
+    def release_valid_moves(self):
+        """Drops the cached valid moves of every colour to free memory.
+        They are rebuilt from the board the next time they are needed
+        """
+        self.__valid_move_stores = {colour: ValidMoveStore() for colour in BoardStatesEnum.get_player_colours()}
+        self.__valid_moves_released = True
+
+    def _rebuild_valid_moves(self):
+        """Rebuilds the valid moves of every colour from the board state"""
+        self.__valid_moves_released = False
+        self._initialise_valid_moves()
+
+    def _initialise_valid_moves(self, colours: list[BoardStatesEnum] = None):
+        """Derives the valid moves of the colours from the array and piece sets in one pass.
+
+        The cells each colour may cover (empty and not sharing an edge with it) and its origins
+        (cells diagonal to it, and the board corners) are stacked masks built by shifting.
+        Each orientation of the catalogue is then slid over the masks. Matching the moves found from origins,
+        a placement is valid if every cell may be covered and the pivot of one of its piece's variants is on an origin.
+
+        Args:
+            colours (list[BoardStatesEnum], optional): colours to derive the moves of. Defaults to every player colour.
+        """
+        packed = get_piece_catalogue().packed
+        colours = colours or BoardStatesEnum.get_player_colours()
+        own = self.array[None, :, :] == np.array([colour.int_id for colour in colours])[:, None, None]
+        coverable = (self.array == BoardStatesEnum.EMPTY.int_id) & ~shift_mask(own, ADJACENT_STEPS)
+        origins = shift_mask(own, DIAGONAL_STEPS)
+        for row, col in self.corner_idxs:
+            origins[:, row, col] = True
+        pivots = [[] for _ in packed["orientation_pieces"]]
+        for index, pivot in zip(packed["variant_orientations"].tolist(), packed["variant_pivots"].tolist()):
+            pivots[index].append(pivot)
+        available = np.array(
+            [[piece_type in self.__piece_sets[colour].present_types for piece_type in PIECE_ORDER] for colour in colours]
+        )
+
+        move_ids = [[] for _ in colours]
+        for index, piece_id in enumerate(packed["orientation_pieces"]):
+            colour_idxs = np.flatnonzero(available[:, piece_id])
+            if not len(colour_idxs):
+                continue
+            height, width = packed["orientation_dims"][index]
+            rows, cols = self.dimension - height + 1, self.dimension - width + 1
+            fits = np.ones((len(colour_idxs), rows, cols), dtype=bool)
+            for d_row, d_col in packed["orientation_offsets"][index, : packed["orientation_sizes"][index]].tolist():
+                fits &= coverable[colour_idxs, d_row : d_row + rows, d_col : d_col + cols]
+            on_origin = np.zeros_like(fits)
+            for d_row, d_col in pivots[index]:
+                on_origin |= origins[colour_idxs, d_row : d_row + rows, d_col : d_col + cols]
+            orientation_id = int(packed["orientation_ids"][index])
+            for colour_idx, valid in zip(colour_idxs, fits & on_origin):
+                top_rows, left_cols = np.nonzero(valid)
+                move_ids[colour_idx].append(encode_move_id(int(piece_id), orientation_id, top_rows, left_cols))
+
+        for colour, colour_move_ids in zip(colours, move_ids):
+            colour_move_ids = np.concatenate(colour_move_ids) if colour_move_ids else np.zeros(0, dtype=np.int64)
+            self.__valid_move_stores[colour] = ValidMoveStore.from_move_ids(colour_move_ids)
 
     def check_move_validity(
         self, move: Move, return_at_first_fail: bool = True, validation_methods: list[callable] = None
-    ) -> list[str]:
+    ) -> list[InvalidMove]:
         """Checks the move validity, if there are any issues returns the associated
-        erorr strings.
+        errors. This is the diagnostic path, use `get_move_failure` to only check a move.
 
         this checks that
          - the piece has not been use before
@@ -203,41 +588,41 @@ class Board:
         Args:
             move (Move): move to validate
             return_at_first_fail (bool): whether to exit early if an issue is detcted,
-                                         Defaults to False
-            validation_methods (list[callable]): Methods to validate agaist, defaults to None
+                                         Defaults to True
+            validation_methods (list[callable]): Methods to validate agaist, each returning a
+                                                 failure code (see `MoveFailureEnum`), defaults to None
 
         Returns:
-            list[str]: the errors of the move
+            list[InvalidMove]: the errors of the move
         """
-        error_list = []
+        if validation_methods:
+            failures = []
+            for validation_method in validation_methods:
+                failure = validation_method(move)
+                if failure:
+                    failures.append(failure)
+                if failures and (return_at_first_fail or validation_method == self._validate_in_bounds):
+                    break
+        else:
+            # diagnostics follow the documented order of the checks, not the adaptive order of the pipeline
+            failures = _VALIDATION_PIPELINE.check_all(self, move)
+            if return_at_first_fail:
+                failures = failures[:1]
 
-        # validation methods, hard code
-        if not validation_methods:
-            validation_methods = [
-                self._validate_in_bounds,
-                self._validate_unused_piece,
-                self._validate_overlap,
-                self._validate_edge_relation,
-                self._validate_corner_relation,
-            ]
+        # messages are only built here, once the failures are known
+        return [InvalidMove(get_failure_message(failure, move)) for failure in failures]
 
-        # check each method, tracking errors as we go
-        for validation_method in validation_methods:
+    def get_move_failure(self, move: Move) -> int:
+        """Returns why the move is invalid for the current board state, without raising or
+        formatting anything. The validators run in order of how often they reject moves, see `ValidationPipeline`
 
-            try:
-                validation_method(move)
-            except InvalidMove as e:
-                error_list.append(e)
+        Args:
+            move (Move): move to check
 
-            if error_list and return_at_first_fail:
-                return error_list
-            
-            # if out of bounds other checks are nonsensical and might break
-            if validation_method == self._validate_in_bounds and error_list:
-                return error_list
-            
-        # return error list
-        return error_list
+        Returns:
+            int: failure code of the first check the move failed, see `MoveFailureEnum`, 0 if the move is valid
+        """
+        return _VALIDATION_PIPELINE.check(self, move)
 
     def validate_move(self, move: Move) -> bool:
         """Validates that a move meets the rule requirements
@@ -252,8 +637,7 @@ class Board:
         Returns:
             bool: True if the move is valid, False otherwise
         """
-        error_list = self.check_move_validity(move)
-        return not error_list
+        return not _VALIDATION_PIPELINE.check(self, move)
 
     def check_if_board_corner_idx(self, idx: tuple[int]) -> bool:
         """Checks if the supplied idx is the corner of a board.
@@ -343,16 +727,92 @@ class Board:
 
         self._add_only_new_moves(new_valid_moves, latest_colour)
 
+        if self.__verification_rate and self.__verification_random.random() < self.__verification_rate:
+            self.verify_valid_moves()
+
+    def enable_verification(self, sample_rate: float = 1.0, seed: int = None):
+        """Enables checking the incrementally updated valid moves against valid moves
+        derived from scratch, after a sample of the moves played. Mismatches are logged
+        with a dump that reproduces the position, see `verify_valid_moves`.
+        Sampling uses its own random generator so games play out the same with it enabled
+
+        Args:
+            sample_rate (float, optional): fraction of moves to check after, 0 disables. Defaults to 1.0.
+            seed (int, optional): seed of the sampling. Defaults to None.
+        """
+        self.__verification_rate = sample_rate
+        self.__verification_random = random.Random(seed)
+
+    def verify_valid_moves(self) -> dict[BoardStatesEnum, tuple[list[Move], list[Move], int]]:
+        """Compares the valid moves of each colour with valid moves derived from scratch.
+        Colours without cells are skipped as their moves are brute forced on request.
+
+        On a mismatch a warning is logged holding the board array, piece sets, last move and
+        the board encoded by `to_bytes`, which `from_buffer` loads to reproduce the position
+
+        Returns:
+            dict[BoardStatesEnum, tuple[list[Move], list[Move], int]]: for each mismatched colour the moves that are missing,
+                                                                        the moves that should not be valid and the number of duplicates
+        """
+        if self.__valid_moves_released:
+            return {}
+        self.__verification_checks += 1
+
+        piece_sets = {colour: PieceSet(pieces=list(piece_set.pieces)) for colour, piece_set in self.piece_sets.items()}
+        reference = Board(self.dimension, piece_set=piece_sets)
+        reference.__array = self.array.copy()
+        reference._initialise_valid_moves()
+
+        mismatches = {}
+        for colour in BoardStatesEnum.get_player_colours():
+            if not (self.array == colour.int_id).any():
+                continue
+            move_ids = self.__valid_move_stores[colour].move_ids
+            expected_ids = reference.__valid_move_stores[colour].move_ids
+            duplicates = len(move_ids) - len(np.unique(move_ids))
+            missing = [Move.from_move_id(colour, move_id) for move_id in np.setdiff1d(expected_ids, move_ids).tolist()]
+            invalid = [Move.from_move_id(colour, move_id) for move_id in np.setdiff1d(move_ids, expected_ids).tolist()]
+            if missing or invalid or duplicates:
+                mismatches[colour] = (missing, invalid, duplicates)
+
+        if mismatches:
+            self.__verification_failures += 1
+            logging.warning(f"incremental valid moves do not match the board: {self._get_verification_dump(mismatches)}")
+        return mismatches
+
+    def _get_verification_dump(self, mismatches: dict[BoardStatesEnum, tuple[list[Move], list[Move], int]]) -> str:
+        """Builds a reproducible dump of a verification mismatch
+
+        Args:
+            mismatches (dict[BoardStatesEnum, tuple[list[Move], list[Move], int]]): mismatches of each colour
+
+        Returns:
+            str: json dump
+        """
+        latest = self.latest_move
+        dump = {
+            "array": self.array.tolist(),
+            "piece_sets": {colour.str_id: [piece.value for piece in piece_set.present_types] for colour, piece_set in self.piece_sets.items()},
+            "last_move": None if latest is None else {"colour": latest.colour.str_id, "piece": latest.piece_type.value, "idxs": latest.idxs},
+            "mismatches": {
+                colour.str_id: {
+                    "missing": [move.move_id for move in missing],
+                    "invalid": [move.move_id for move in invalid],
+                    "duplicates": duplicates,
+                }
+                for colour, (missing, invalid, duplicates) in mismatches.items()
+            },
+            "board_bytes": self.to_bytes().hex(),
+        }
+        return json.dumps(dump)
+
     def _remove_moves_of_latest_piece(self):
         """Removes all moves of the latest piece from the valid moves
         for the latest colour
         """
         latest_colour = self.latest_move.colour
-        latest_type = self.latest_move.piece_type
-
-        self.__valid_moves_dict[latest_colour] = [
-            move for move in self.__valid_moves_dict[latest_colour] if move.piece_type != latest_type
-        ]
+        latest_piece_id = PIECE_ORDER.index(self.latest_move.piece_type)
+        self.__valid_move_stores[latest_colour].remove_piece(latest_piece_id)
 
     def remove_invalid_moves_based_on_last_move(self):
         """Removes all moves that could have been made invalid
@@ -363,40 +823,38 @@ class Board:
         for moves of the same colour
         - touching sides with the last move
 
+        Both are checked against the cell bitmasks of every stored move at once.
         """
 
         # check against latest moves idxs
-        latest_idxs = self.latest_move.idxs
-        
-        # for each colour
-        # find all the moves could have been affected by the last move
-        for colour in BoardStatesEnum.get_player_colours():
+        overlap_mask = self._get_idxs_mask(self.latest_move.idxs)
 
-            # if its the same colour we also need to check the neighbours
-            # as sides cant touch between the same colour
-            additional_idxs = []
-            if colour == self.latest_move.colour:
-                additional_idxs = self._get_neighbouring_idxs_from_idxs(latest_idxs)
+        # if its the same colour we also need to check the neighbours
+        # as sides cant touch between the same colour
+        side_mask = overlap_mask | shift_mask(overlap_mask, ADJACENT_STEPS)
 
-            # check all existing valid moves for this colour to see if impaced
-            checked_moves = []
-            for move in self.__valid_moves_dict[colour]:
-
-                # remove overlaps with the last move
-                if any(idx in latest_idxs for idx in move.idxs):
-                    continue
-
-                # if doesnt touch any of the idxs its not affected
-                if not any(idx in additional_idxs for idx in move.idxs):
-                    checked_moves.append(move)
-                    continue
+        # the windows of each mask are shared by the stores
+        overlap_windows = get_window_masks(overlap_mask)
+        side_windows = get_window_masks(side_mask)
+        for colour in BoardStatesEnum.get_player_colours():
+            if colour == self.latest_move.colour:
+                self.__valid_move_stores[colour].remove_overlapping(side_mask, side_windows)
+            else:
+                self.__valid_move_stores[colour].remove_overlapping(overlap_mask, overlap_windows)
 
-                # impacted but still valid
-                if self.validate_move(move):
-                    checked_moves.append(move)
+    def _get_idxs_mask(self, idxs: list[tuple[int]]) -> np.ndarray:
+        """Returns a mask of the supplied idxs
 
-            self.__valid_moves_dict[colour] = checked_moves
+        Args:
+            idxs (list[tuple[int]]): idxs to set
 
+        Returns:
+            np.ndarray: bool mask the shape of the board
+        """
+        mask = np.zeros((self.dimension, self.dimension), dtype=bool)
+        for row, col in idxs:
+            mask[row, col] = True
+        return mask
 
     def _get_neighbouring_idxs_from_idxs(self, idxs: list[tuple[int]]) -> list[tuple[int]]:
         """Gets all the neighbouring idxs from a list of idxs
@@ -421,12 +879,12 @@ class Board:
 
         return neighbouring_idxs
 
-    def _find_new_valid_moves_from_last_move(self) -> list[Move]:
+    def _find_new_valid_moves_from_last_move(self) -> ValidMoves:
         """Finds all the new valid moves that could have been created
         from the last move.
 
         Returns:
-            list[Move]: list of new valid moves
+            ValidMoves: new valid moves
         """
         last_move_idxs = self.latest_move.idxs
         colour = self.latest_move.colour
@@ -442,7 +900,7 @@ class Board:
 
         return valid_moves
 
-    def _find_valid_moves_brute_force(self, colour: BoardStatesEnum) -> list[Move]:
+    def _find_valid_moves_brute_force(self, colour: BoardStatesEnum) -> ValidMoves:
         """Finds all valid moves for the colour via brute force.
         This finds all possible origins for the colour, then for each origin
         checks all possible piece placements.
@@ -452,35 +910,42 @@ class Board:
             colour (BoardStatesEnum): colour to find moves for
 
         Returns:
-            list[Move]: list of valid moves
+            ValidMoves: valid moves
         """
         possible_origins = self._get_possible_origins_for_colour(colour)
         valid_moves = self._find_valid_moves_from_origins(colour, possible_origins)
         return valid_moves
 
-    def _find_valid_moves_from_origins(self, colour: BoardStatesEnum, origins: list[tuple[int]]) -> list[Move]:
+    def _find_valid_moves_from_origins(self, colour: BoardStatesEnum, origins: list[tuple[int]]) -> ValidMoves:
         """Finds all valid moves for the colour from the supplied origins.
 
+        The moves that fit at an origin only depend on the cells the colour is blocked from
+        around it and the colour's remaining pieces, so they are looked up in the shared `PatternCache`
+        and only checked when that window has not been seen before.
+        Pieces larger than the free space around an origin are skipped before the lookup,
+        and origins without space for any remaining piece are skipped entirely.
+
         Args:
             colour (BoardStatesEnum): colour to find moves for
             origins (list[tuple[int]]): origins to find moves from
 
         Returns:
-            list[Move]: list of valid moves
+            ValidMoves: valid moves, by origin then in the order of the pieces and their variants
         """
-        valid_moves = []
-        for origin in origins:
-            for piece in self.__piece_sets[colour].pieces:
-                for piece_rep in piece.all_idx_representations:
+        if not origins:
+            return ValidMoves(colour, np.zeros(0, dtype=np.int64))
 
-                    # build move from representation
-                    move = Move.from_piece_representation(colour, piece.name, piece_rep, origin)
+        cache = get_pattern_cache()
+        fitting_piece_masks = get_fitting_piece_masks()
+        piece_mask = self.__piece_sets[colour].to_mask()
+        windows, free_spaces = get_windows(self.get_forbidden_mask(colour), origins)
 
-                    # check if the piece can be placed
-                    if self.validate_move(move):
-                        valid_moves.append(move)
-
-        return valid_moves
+        move_ids = [np.zeros(0, dtype=np.int64)]
+        for window, free_space, origin in zip(windows, free_spaces, origins):
+            fitting_mask = piece_mask & fitting_piece_masks[free_space]
+            if fitting_mask:
+                move_ids.append(cache.get_move_ids(window, fitting_mask, origin))
+        return ValidMoves(colour, np.concatenate(move_ids))
 
     def _get_possible_origins_for_colour(self, colour: BoardStatesEnum) -> list[tuple[int]]:
         """Returns all possible origins for the colour.
@@ -497,21 +962,39 @@ class Board:
             empty_corners = [corner for corner in self.corner_idxs if not self.array[corner[0]][corner[1]]]
             return empty_corners
         
-        # get all the corners for the colour
-        corner_idxs = self._get_corner_idxs_for_colour(colour)
+        # the origins are the free cells diagonal to the colour's corners
+        return [tuple(idx) for idx in np.argwhere(self.get_anchor_mask(colour)).tolist()]
 
-        # get all the origins for the corners
-        origins = []
-        for corner in corner_idxs:
+    def get_forbidden_mask(self, colour: BoardStatesEnum) -> np.ndarray:
+        """Returns a mask of the cells the colour is unable to place on,
+        these are the occupied cells and the cells sharing an edge with the colour
 
-            new_origins = self._get_valid_origins_from_corner(corner, colour)
+        Args:
+            colour (BoardStatesEnum): colour to get the mask for
 
-            for origin in new_origins:
-                if origin in origins:
-                    continue
-                origins.append(origin)
+        Returns:
+            np.ndarray: bool mask the shape of the board
+        """
+        colour_mask = self.array == colour.int_id
+        return (self.array != BoardStatesEnum.EMPTY.int_id) | shift_mask(colour_mask, ADJACENT_STEPS)
+
+    def get_anchor_mask(self, colour: BoardStatesEnum) -> np.ndarray:
+        """Returns a mask of the cells the next piece of the colour could cover a corner with,
+        these are the free cells diagonal to the colour, or the empty board corners if the colour has no cells
 
-        return origins
+        Args:
+            colour (BoardStatesEnum): colour to get the mask for
+
+        Returns:
+            np.ndarray: bool mask the shape of the board
+        """
+        colour_mask = self.array == colour.int_id
+        if not colour_mask.any():
+            anchor_mask = np.zeros_like(colour_mask)
+            for row, col in self.corner_idxs:
+                anchor_mask[row, col] = True
+            return anchor_mask & (self.array == BoardStatesEnum.EMPTY.int_id)
+        return shift_mask(colour_mask, DIAGONAL_STEPS) & ~self.get_forbidden_mask(colour)
 
     def _get_valid_origins_from_corner(self, corner: tuple[int], colour: BoardStatesEnum) -> list[tuple[int]]:
         """Returns all valid origins from a corner.
@@ -600,15 +1083,15 @@ class Board:
         
         return True
 
-    def _validate_piece_idx_matches_type(self, move: Move):
+    def _validate_piece_idx_matches_type(self, move: Move) -> int:
         """Validates that the idx of the move match the topology of the piece
         in the move
 
         Args:
             move (Move): move to check
 
-        Raises:
-            InvalidMove: if the move idxs to match the move piece type
+        Returns:
+            int: `MoveFailureEnum.PIECE_SHAPE` if the move idxs do not match the move piece type, 0 otherwise
         """
         # check if the idx matches the shape
 
@@ -620,59 +1103,64 @@ class Board:
         # check if this map exists in the piece representations
 
         if binary_representation not in piece.all_idx_representations:
-            raise InvalidMove(f"The supplied idx do not match the piece type shape {move}")
+            return MoveFailureEnum.PIECE_SHAPE
+        return MoveFailureEnum.VALID
 
-    def _validate_unused_piece(self, move: Move):
+    def _validate_unused_piece(self, move: Move) -> int:
         """Validates if the piece associated with the move
         has not yet been used by the colour
 
         Args:
             move (Move): Move to validate
 
-        Raises:
-            InvalidMove: if the piece has already been used
+        Returns:
+            int: `MoveFailureEnum.USED_PIECE` if the piece has already been used, 0 otherwise
         """
         if move.piece_type in self.__piece_sets[move.colour].present_types:
-            return
-        raise InvalidMove(f"The piece {move.piece_type} was already used by {move.colour}")
+            return MoveFailureEnum.VALID
+        return MoveFailureEnum.USED_PIECE
 
-    def _validate_overlap(self, move: Move):
+    def _validate_overlap(self, move: Move) -> int:
         """Checks if the move is trying to place on an already populated grid cell
 
         Args:
             move (Move): Move to validate
 
-        Raises:
-            InvalidMove: if the move overalsp an existing piece
+        Returns:
+            int: `MoveFailureEnum.OVERLAP` if the move overlaps an existing piece, 0 otherwise
         """
         # check the move against the board array
         for idx_pair in move.idxs:
             row, col = idx_pair
             if self.array[row][col]:
-                raise InvalidMove(f"cell {row,col} is already populated")
+                return MoveFailureEnum.OVERLAP
+        return MoveFailureEnum.VALID
 
-    def _validate_corner_relation(self, move: Move):
+    def _validate_corner_relation(self, move: Move) -> int:
         """Validates that the move obeys the corner touching relation.
         Each new piece must touch the corner of another piece
 
         Args:
             move (Move): move to check
+
+        Returns:
+            int: `MoveFailureEnum.CORNER_RELATION` if the move does not touch a corner, 0 otherwise
         """
         # checks that diagonal neighbours of the any of the moves
-        # idxs are from the same colourillegal_move
+        # idxs are from the same colour
         for idx in move.idxs:
             # if its the first move in a corner this is obeyed
             if self.check_if_board_corner_idx(idx):
-                return
+                return MoveFailureEnum.VALID
             diagonal_neighbours = self.get_diagonal_idxs_from_idx(idx)
             for diagonal_neighbour in diagonal_neighbours:
                 row, col = diagonal_neighbour
                 # check if corner relation obeyed
                 if self.array[row][col] == move.colour.int_id:
-                    return
-        raise InvalidMove(f"The move does not obey the corner relation, {move}")
+                    return MoveFailureEnum.VALID
+        return MoveFailureEnum.CORNER_RELATION
 
-    def _validate_edge_relation(self, move: Move):
+    def _validate_edge_relation(self, move: Move) -> int:
         """Checks that the move obeys the side relation rule.
         This rule prevents moves that share a side border
         with an existing piece of the same colour
@@ -680,8 +1168,8 @@ class Board:
         Args:
             move (Move): move to check
 
-        Raises:
-            InvalidMove: if the move does not obey the side relation rules
+        Returns:
+            int: `MoveFailureEnum.EDGE_RELATION` if the move does not obey the side relation rules, 0 otherwise
         """
         # checks that the move does not share any borders with existing moves of
         # the colour
@@ -692,20 +1180,21 @@ class Board:
                 # check each
                 row, col = adjacent_neighbour
                 if self.array[row][col] == move.colour.int_id:
-                    raise InvalidMove(f"The move does not objey the side relation, {move}")
+                    return MoveFailureEnum.EDGE_RELATION
+        return MoveFailureEnum.VALID
 
-    def _validate_in_bounds(self, move: Move):
+    def _validate_in_bounds(self, move: Move) -> int:
         """Checks that the move is fully contained within the board
 
         Args:
             move (Move): move to check
 
-        Raises:
-            InvalidMove: if the move does not fit within the board
+        Returns:
+            int: `MoveFailureEnum.OUT_OF_BOUNDS` if the move does not fit within the board, 0 otherwise
         """
         if any(not self.check_coord_in_board(idx) for idx in move.idxs):
-            raise InvalidMove(f"Move does not fit in the board, {move}")
-    
+            return MoveFailureEnum.OUT_OF_BOUNDS
+        return MoveFailureEnum.VALID
 
     def _get_initial_piece_dict(self) -> dict[BoardStatesEnum, PieceSet]:
         """Gets the initial dictionary of all the pieces
@@ -731,30 +1220,14 @@ class Board:
         return np.zeros((self.dimension, self.dimension), dtype=int)
 
     def _add_only_new_moves(self, new_valid_moves: list[Move], colour: BoardStatesEnum):
-        """Adds only the unique new valid moves to the valid moves dict
+        """Adds only the unique new valid moves to the valid moves of the colour,
+        new moves found from neighbouring origins can repeat each other or existing moves
 
         Args:
             new_valid_moves (list[Move]): new valid moves
             colour (BoardStatesEnum): colour to add the moves to
         """
-        rep_nums = [self._convert_move_to_str_representation(move) for move in self.__valid_moves_dict[colour]]
-        for move in new_valid_moves:
-            rep_num = self._convert_move_to_str_representation(move)
-            if rep_num in rep_nums:
-                continue
-            self.__valid_moves_dict[colour].append(move)
-
-    def _convert_move_to_str_representation(self, move: Move) -> str:
-        """Converts a move to a int representation by joining the idxs into
-        a single int
-
-        Args:
-            move (Move): move to convert
-
-        Returns:
-            int: int representation
-        """
-        return "".join([str(idx[0]) + str(idx[1]) for idx in move.idxs])
+        self.__valid_move_stores[colour].add(get_move_ids(new_valid_moves))
 
     @property
     def array(self) -> np.ndarray:
@@ -794,13 +1267,60 @@ class Board:
         return self.__latest_move
 
     @property
-    def valid_moves_dict(self) -> dict[BoardStatesEnum, list[Move]]:
+    def valid_moves_dict(self) -> dict[BoardStatesEnum, ValidMoves]:
         """Returns the valid moves for each colour
 
         Returns:
-            dict[BoardStatesEnum, list[Move]]: valid moves for each colour
+            dict[BoardStatesEnum, ValidMoves]: valid moves for each colour
         """
-        return self.__valid_moves_dict
+        if self.__valid_moves_released:
+            self._rebuild_valid_moves()
+        return {colour: store.view(colour) for colour, store in self.__valid_move_stores.items()}
+
+    @property
+    def verification_checks(self) -> int:
+        """Returns how many times the valid moves were verified
+
+        Returns:
+            int: number of verifications
+        """
+        return self.__verification_checks
+
+    @property
+    def verification_failures(self) -> int:
+        """Returns how many verifications found a mismatch
+
+        Returns:
+            int: number of failed verifications
+        """
+        return self.__verification_failures
+
+    @property
+    def valid_moves_released(self) -> bool:
+        """Returns if the valid moves were released and not yet rebuilt
+
+        Returns:
+            bool: if the valid moves are released
+        """
+        return self.__valid_moves_released
+
+    @property
+    def valid_move_count(self) -> int:
+        """Returns how many valid moves are cached across all colours
+
+        Returns:
+            int: number of cached valid moves
+        """
+        return sum(len(store) for store in self.__valid_move_stores.values())
+
+    @property
+    def valid_move_nbytes(self) -> int:
+        """Returns the bytes held by the valid move stores of every colour
+
+        Returns:
+            int: bytes held
+        """
+        return sum(store.nbytes for store in self.__valid_move_stores.values())
 
     @property
     def dimension(self) -> int:
@@ -857,4 +1377,45 @@ class Board:
             
             moves_played.append()
 
-        return moves_played
\ No newline at end of file
+        return moves_played
+
+
+# the rule checks of every board, in bounds runs first as the others read the cells of the move
+_VALIDATION_PIPELINE = ValidationPipeline(
+    {
+        MoveFailureEnum.OUT_OF_BOUNDS: Board._validate_in_bounds,
+        MoveFailureEnum.USED_PIECE: Board._validate_unused_piece,
+        MoveFailureEnum.OVERLAP: Board._validate_overlap,
+        MoveFailureEnum.EDGE_RELATION: Board._validate_edge_relation,
+        MoveFailureEnum.CORNER_RELATION: Board._validate_corner_relation,
+    }
+)
+
+
+def get_validation_pipeline() -> ValidationPipeline:
+    """Returns the validation pipeline shared by every board
+
+    Returns:
+        ValidationPipeline: the shared pipeline
+    """
+    return _VALIDATION_PIPELINE
+
+
+# binary form of `Board.to_bytes`
+_BUFFER_MAGIC = 0xB10B
+_BUFFER_VERSION = 1
+_BUFFER_VALID_MOVES_FLAG = 1
+_BUFFER_HEADER = struct.Struct("<HBBBH")
+
+
+def _get_piece_size(piece_type: PieceNameEnum) -> int:
+    """Returns the number of cells of a piece
+
+    Args:
+        piece_type (PieceNameEnum): piece to get the size of
+
+    Returns:
+        int: cells of the piece
+    """
+    return get_piece_catalogue().get_orientations(piece_type)[0].size
+
@@ -0,0 +1,248 @@
+"""
+Shared memory arena of board positions for worker processes.
+
+The arena starts with a header (magic, layout version, board dimension, slot count) followed by
+fixed size slots. Each slot holds:
+ - sequence: even once a position is published, odd while it is being written
+ - colour: int id of the colour to move, 0 if unset
+ - piece_masks: remaining pieces of each player colour as uint32 bitmasks, see `PieceSet.to_mask`
+ - cells: the board array, one uint8 per cell
+
+Positions are shared by slot index, so what is sent between processes does not grow with the
+number of moves. Each slot must only have a single writer. Readers never lock, they retry if the
+sequence changed while they copied the slot.
+"""
+
+# Python Imports
+import time
+from multiprocessing import shared_memory
+
+# External Imports
+import numpy as np
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.exceptions import BoardArenaError
+from blokus.pieces.piece_set import PieceSet
+
+_MAGIC = 0xB10C
+_LAYOUT_VERSION = 1
+_HEADER_DTYPE = np.dtype([("magic", "<u2"), ("version", "<u2"), ("dimension", "<u4"), ("slot_count", "<u4"), ("pad", "<u4")])
+_PLAYER_COLOURS = BoardStatesEnum.get_player_colours()
+_COLOURS_BY_ID = {colour.int_id: colour for colour in _PLAYER_COLOURS}
+
+
+def _get_slot_dtype(dimension: int) -> np.dtype:
+    """Returns the layout of a slot for boards of the supplied dimension
+
+    Args:
+        dimension (int): dimension of the boards
+
+    Returns:
+        np.dtype: structured dtype of a slot
+    """
+    return np.dtype(
+        [
+            ("sequence", "<u8"),
+            ("colour", "u1"),
+            ("pad", "u1", 3),
+            ("piece_masks", "<u4", len(_PLAYER_COLOURS)),
+            ("cells", "u1", (dimension, dimension)),
+        ],
+        align=True,
+    )
+
+
+class BoardArena:
+    """Fixed size arena of board positions in shared memory.
+
+    Create it in the parent process with `create`, hand workers its `name` and attach with `attach`.
+    The creating process should `unlink` it once every process has called `close`.
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory, owner: bool):
+        """initialiser for the arena, use `create` or `attach`
+
+        Args:
+            memory (shared_memory.SharedMemory): shared memory holding the arena
+            owner (bool): if this process created the memory
+        """
+        self._memory = memory
+        self._owner = owner
+
+        header = np.ndarray(1, dtype=_HEADER_DTYPE, buffer=memory.buf)[0]
+        if header["magic"] != _MAGIC or header["version"] != _LAYOUT_VERSION:
+            raise BoardArenaError(f"{memory.name} is not a board arena of layout version {_LAYOUT_VERSION}")
+        self._dimension = int(header["dimension"])
+        self._slot_count = int(header["slot_count"])
+        self._slots = np.ndarray(
+            self._slot_count, dtype=_get_slot_dtype(self._dimension), buffer=memory.buf, offset=_HEADER_DTYPE.itemsize
+        )
+
+    @classmethod
+    def create(cls, slot_count: int, dimension: int = 20, name: str = None) -> "BoardArena":
+        """Creates a new arena with every slot empty
+
+        Args:
+            slot_count (int): number of positions the arena holds
+            dimension (int, optional): dimension of the boards. Defaults to 20.
+            name (str, optional): name of the shared memory, a unique one is chosen by default
+
+        Returns:
+            BoardArena: the arena
+        """
+        size = _HEADER_DTYPE.itemsize + slot_count * _get_slot_dtype(dimension).itemsize
+        memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        np.frombuffer(memory.buf, dtype=np.uint8)[:] = 0
+        header = np.ndarray(1, dtype=_HEADER_DTYPE, buffer=memory.buf)
+        header[0] = (_MAGIC, _LAYOUT_VERSION, dimension, slot_count, 0)
+        del header
+        return cls(memory, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "BoardArena":
+        """Attaches to an arena created by another process, no data is copied
+
+        Args:
+            name (str): name of the arena
+
+        Returns:
+            BoardArena: the arena
+        """
+        return cls(shared_memory.SharedMemory(name=name), owner=False)
+
+    @property
+    def name(self) -> str:
+        """Returns the name workers attach to the arena with
+
+        Returns:
+            str: name of the shared memory
+        """
+        return self._memory.name
+
+    @property
+    def dimension(self) -> int:
+        """Returns the dimension of the boards in the arena
+
+        Returns:
+            int: board dimension
+        """
+        return self._dimension
+
+    @property
+    def slot_count(self) -> int:
+        """Returns the number of positions the arena holds
+
+        Returns:
+            int: number of slots
+        """
+        return self._slot_count
+
+    def publish(self, slot: int, board: Board, colour: BoardStatesEnum = None) -> int:
+        """Writes a position to a slot
+
+        Args:
+            slot (int): slot to write to
+            board (Board): board of the position
+            colour (BoardStatesEnum, optional): colour to move. Defaults to None.
+
+        Raises:
+            BoardArenaError: if the board does not fit the arena
+
+        Returns:
+            int: sequence number of the published position
+        """
+        if board.dimension != self._dimension:
+            raise BoardArenaError(f"board of dimension {board.dimension} does not fit an arena of dimension {self._dimension}")
+        record = self._slots[slot]
+        sequence = int(record["sequence"])
+        # odd while writing, so readers retry instead of reading a half written position
+        record["sequence"] = sequence + 1
+        record["colour"] = colour.int_id if colour is not None else 0
+        record["piece_masks"] = [board.piece_sets[c].to_mask() for c in _PLAYER_COLOURS]
+        record["cells"] = board.array
+        record["sequence"] = sequence + 2
+        return sequence + 2
+
+    def get_sequence(self, slot: int) -> int:
+        """Returns the sequence number of a slot, 0 if nothing was published to it
+
+        Args:
+            slot (int): slot to check
+
+        Returns:
+            int: sequence number, odd while a position is being written
+        """
+        return int(self._slots[slot]["sequence"])
+
+    def view(self, slot: int) -> np.ndarray:
+        """Returns a read only view of the cells of a slot, nothing is copied.
+        The view changes if the slot is published to, check `get_sequence` before and after using it
+
+        Args:
+            slot (int): slot to view
+
+        Returns:
+            np.ndarray: (dimension, dimension) uint8 view of the board
+        """
+        cells = self._slots["cells"][slot]
+        cells.flags.writeable = False
+        return cells
+
+    def read(self, slot: int, max_attempts: int = 100) -> tuple[int, np.ndarray, np.ndarray, BoardStatesEnum]:
+        """Reads a consistent copy of a slot
+
+        Args:
+            slot (int): slot to read
+            max_attempts (int, optional): reads to try while the slot is being written. Defaults to 100.
+
+        Raises:
+            BoardArenaError: if the slot kept changing while being read
+
+        Returns:
+            tuple[int, np.ndarray, np.ndarray, BoardStatesEnum]: sequence, cells, piece masks and colour to move
+        """
+        record = self._slots[slot]
+        for _ in range(max_attempts):
+            sequence = int(record["sequence"])
+            if sequence & 1:
+                time.sleep(0)
+                continue
+            cells = record["cells"].copy()
+            piece_masks = record["piece_masks"].copy()
+            colour_id = int(record["colour"])
+            if int(record["sequence"]) == sequence:
+                return sequence, cells, piece_masks, _COLOURS_BY_ID.get(colour_id)
+        raise BoardArenaError(f"slot {slot} changed during {max_attempts} read attempts")
+
+    def read_board(self, slot: int) -> tuple[Board, BoardStatesEnum, int]:
+        """Builds a board from a slot, valid moves are derived from the position
+
+        Args:
+            slot (int): slot to read
+
+        Returns:
+            tuple[Board, BoardStatesEnum, int]: board, colour to move and sequence number
+        """
+        sequence, cells, piece_masks, colour = self.read(slot)
+        piece_sets = {c: PieceSet.from_mask(int(mask)) for c, mask in zip(_PLAYER_COLOURS, piece_masks)}
+        return Board.from_array(cells.astype(int), piece_sets), colour, sequence
+
+    def close(self):
+        """Detaches this process from the arena"""
+        # numpy views keep the buffer exported, they must be dropped before closing
+        self._slots = None
+        self._memory.close()
+
+    def unlink(self):
+        """Frees the arena, only the creating process should call this"""
+        if self._owner:
+            self._memory.unlink()
+
+    def __enter__(self) -> "BoardArena":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        self.unlink()
@@ -8,6 +8,7 @@ from blokus.bots.shy_bot import ShyBot
 from blokus.player.base_player import BasePlayer
 
 from blokus.bots.corner_bot import CornerBot
+from blokus.bots.search_bot import SearchBot
 
 class BotEnum(Enum):
     def __init__(self, cls: BasePlayer):
@@ -17,3 +18,4 @@ class BotEnum(Enum):
     GREEDY = GreedyBot
     SHY = ShyBot
     CORNER = CornerBot
+    SEARCH = SearchBot
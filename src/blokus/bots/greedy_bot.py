@@ -1,11 +1,10 @@
 # Python imports
-import random
-
 from blokus.board import Board
 from blokus.board_states import BoardStatesEnum
 from blokus.move import Move
 
 # Internal imports
+from blokus.bots.move_features import get_move_sizes, select_best_scoring_move
 from blokus.player.base_player import BasePlayer
 
 
@@ -17,16 +16,12 @@ class GreedyBot(BasePlayer):
     """
 
     def select_best_move(self, moves: list[Move]) -> Move:
-        """Selects a random move
+        """Selects a random move among the biggest
 
         Args:
             moves (list[Move]): moves to select from
 
         Returns:
-            Move: randomly selected move
+            Move: randomly selected biggest move
         """
-        random.shuffle(moves)
-        biggest_move = max(moves, key=lambda x: len(x.idxs))
-        biggest_moves = [move for move in moves if len(move.idxs) == len(biggest_move.idxs)]
-        # find biggest dimensinon
-        return random.choice(biggest_moves)
+        return select_best_scoring_move(moves, get_move_sizes(moves))
@@ -0,0 +1,189 @@
+# Python imports
+import random
+from enum import IntEnum
+
+# External imports
+import numpy as np
+
+# Internal imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.masks import DIAGONAL_STEPS
+from blokus.move import Move
+from blokus.pieces.catalogue import MAX_PIECE_SIZE, get_piece_catalogue
+from blokus.valid_moves import get_move_ids
+
+_DIAGONAL_STEPS = np.array(DIAGONAL_STEPS, dtype=np.intp)
+
+
+class MoveFeatureEnum(IntEnum):
+    """Columns of the feature matrix returned by `compute_move_features`"""
+
+    SIZE = 0
+    SPAN = 1
+    MIN_CENTRE_DISTANCE = 2
+    MEAN_CENTRE_DISTANCE = 3
+    NEW_ANCHORS = 4
+    OPPONENT_ANCHORS_BLOCKED = 5
+    OPPONENT_ADJACENT_CELLS = 6
+
+
+def pack_moves(moves: list[Move]) -> tuple[np.ndarray, np.ndarray]:
+    """Packs the cells of the moves into a single array.
+    Moves with less than `MAX_PIECE_SIZE` cells are padded by repeating their first cell.
+
+    Args:
+        moves (list[Move]): moves to pack
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (n, MAX_PIECE_SIZE, 2) row and col of each cell, size of each move
+    """
+    catalogue = get_piece_catalogue()
+    packed = catalogue.packed
+    orientations, rows, cols = catalogue.decode_move_ids(get_move_ids(moves))
+
+    sizes = packed["orientation_sizes"][orientations].astype(np.intp)
+    cells = packed["orientation_offsets"][orientations].astype(np.intp)
+    cells[:, :, 0] += rows[:, None]
+    cells[:, :, 1] += cols[:, None]
+    in_piece = np.arange(MAX_PIECE_SIZE) < sizes[:, None]
+    return np.where(in_piece[:, :, None], cells, cells[:, :1]), sizes
+
+
+def get_move_sizes(moves: list[Move]) -> np.ndarray:
+    """Returns the cells covered by each move, read from the catalogue without packing the moves
+
+    Args:
+        moves (list[Move]): moves to get the sizes of
+
+    Returns:
+        np.ndarray: size of each move
+    """
+    catalogue = get_piece_catalogue()
+    orientations, _, _ = catalogue.decode_move_ids(get_move_ids(moves))
+    return catalogue.packed["orientation_sizes"][orientations].astype(np.intp)
+
+
+def compute_move_features(board: Board, colour: BoardStatesEnum, cells: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+    """Computes the features of a batch of moves of the colour in a single pass.
+    None of the moves are played, every feature comes from the masks of the current position.
+
+    - SIZE: cells covered
+    - SPAN: row range plus col range
+    - MIN/MEAN_CENTRE_DISTANCE: euclidean distance of the cells to the centre
+    - NEW_ANCHORS: cells diagonal to the move, not sharing an edge with it, that are free for the colour
+    - OPPONENT_ANCHORS_BLOCKED: anchors of the opponents covered, counted per opponent
+    - OPPONENT_ADJACENT_CELLS: cells sharing an edge with an opponent
+
+    Args:
+        board (Board): board of the position
+        colour (BoardStatesEnum): colour of the moves
+        cells (np.ndarray): cells of the moves, as returned by `pack_moves`
+        sizes (np.ndarray): size of each move
+
+    Returns:
+        np.ndarray: (n, len(MoveFeatureEnum)) feature matrix
+    """
+    features = np.zeros((len(cells), len(MoveFeatureEnum)), dtype=np.float64)
+    if not len(cells):
+        return features
+
+    rows, cols = cells[:, :, 0], cells[:, :, 1]
+    in_piece = np.arange(cells.shape[1]) < sizes[:, None]
+
+    features[:, MoveFeatureEnum.SIZE] = sizes
+    features[:, MoveFeatureEnum.SPAN] = rows.max(axis=1) - rows.min(axis=1) + cols.max(axis=1) - cols.min(axis=1)
+
+    center = board.dimension // 2
+    distances = np.sqrt((rows - center) ** 2 + (cols - center) ** 2)
+    features[:, MoveFeatureEnum.MIN_CENTRE_DISTANCE] = distances.min(axis=1)
+    features[:, MoveFeatureEnum.MEAN_CENTRE_DISTANCE] = (distances * in_piece).sum(axis=1) / sizes
+
+    features[:, MoveFeatureEnum.NEW_ANCHORS] = _count_new_anchors(board, colour, cells)
+
+    opponents = [opponent for opponent in BoardStatesEnum.get_player_colours() if opponent != colour]
+    opponent_anchors = sum(board.get_anchor_mask(opponent).astype(np.intp) for opponent in opponents)
+    features[:, MoveFeatureEnum.OPPONENT_ANCHORS_BLOCKED] = (opponent_anchors[rows, cols] * in_piece).sum(axis=1)
+
+    # the move only covers empty cells, so any of them forbidden to an opponent shares an edge with it
+    opponent_adjacent = np.logical_or.reduce([board.get_forbidden_mask(opponent) for opponent in opponents])
+    features[:, MoveFeatureEnum.OPPONENT_ADJACENT_CELLS] = (opponent_adjacent[rows, cols] & in_piece).sum(axis=1)
+    return features
+
+
+def get_move_features(board: Board, colour: BoardStatesEnum, moves: list[Move]) -> np.ndarray:
+    """Packs the moves and computes their features
+
+    Args:
+        board (Board): board of the position
+        colour (BoardStatesEnum): colour of the moves
+        moves (list[Move]): moves of the colour
+
+    Returns:
+        np.ndarray: (n, len(MoveFeatureEnum)) feature matrix
+    """
+    cells, sizes = pack_moves(moves)
+    return compute_move_features(board, colour, cells, sizes)
+
+
+def select_best_scoring_move(moves: list[Move], scores: np.ndarray) -> Move:
+    """Selects the highest scoring move, randomly between any that are equal
+
+    Args:
+        moves (list[Move]): moves to select from
+        scores (np.ndarray): score of each move
+
+    Returns:
+        Move: selected move
+    """
+    best_idxs = np.flatnonzero(scores == scores.max())
+    return moves[random.choice(best_idxs.tolist())]
+
+
+def select_weighted_move(moves: list[Move], features: np.ndarray, weights: dict[MoveFeatureEnum, float]) -> Move:
+    """Selects the move with the highest weighted sum of features, randomly between any that are equal
+
+    Args:
+        moves (list[Move]): moves to select from
+        features (np.ndarray): feature matrix of the moves
+        weights (dict[MoveFeatureEnum, float]): weight of each feature, missing features are unweighted
+
+    Returns:
+        Move: selected move
+    """
+    weight_vector = np.zeros(len(MoveFeatureEnum), dtype=np.float64)
+    for feature, weight in weights.items():
+        weight_vector[feature] = weight
+    return select_best_scoring_move(moves, features @ weight_vector)
+
+
+def _count_new_anchors(board: Board, colour: BoardStatesEnum, cells: np.ndarray) -> np.ndarray:
+    """Counts the distinct cells diagonal to each move, not sharing an edge with it,
+    that are free for the colour
+
+    Args:
+        board (Board): board of the position
+        colour (BoardStatesEnum): colour of the moves
+        cells (np.ndarray): cells of the moves, as returned by `pack_moves`
+
+    Returns:
+        np.ndarray: new anchors of each move
+    """
+    count = len(cells)
+    diagonals = (cells[:, :, None, :] + _DIAGONAL_STEPS).reshape(count, -1, 2)
+
+    # diagonals touching the move, including its own cells, are not corners of it
+    distances = np.abs(diagonals[:, :, None, :] - cells[:, None, :, :]).sum(axis=3)
+    is_corner = (distances > 1).all(axis=2)
+
+    # pad so diagonals off the board index a cell that is not free
+    dimension = board.dimension + 2
+    free = np.pad(~board.get_forbidden_mask(colour), 1)
+    is_corner &= free[diagonals[:, :, 0] + 1, diagonals[:, :, 1] + 1]
+
+    # count each distinct cell once, two cells of a move can share a diagonal
+    flat_idxs = np.where(is_corner, (diagonals[:, :, 0] + 1) * dimension + diagonals[:, :, 1] + 1, -1)
+    flat_idxs.sort(axis=1)
+    distinct = np.ones_like(is_corner)
+    distinct[:, 1:] = flat_idxs[:, 1:] != flat_idxs[:, :-1]
+    return (distinct & (flat_idxs >= 0)).sum(axis=1)
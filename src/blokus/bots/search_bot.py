@@ -0,0 +1,71 @@
+# Python imports
+import copy
+
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.move import Move
+
+# Internal imports
+from blokus.player.base_player import BasePlayer
+from blokus.search.evaluators import BaseEvaluator
+from blokus.search.move_ordering import TranspositionTable
+from blokus.search.multiplayer_search import BaseMultiplayerSearch, ParanoidSearch, SearchResult
+
+
+class SearchBot(BasePlayer):
+    """This bot looks ahead with a deterministic search,
+    by default paranoid alpha-beta with iterative deepening
+    """
+
+    def __init__(
+        self,
+        board: Board,
+        colour: BoardStatesEnum,
+        search: BaseMultiplayerSearch = None,
+        evaluator: BaseEvaluator = None,
+        time_budget: float = 2.0,
+        max_depth: int = 4,
+    ):
+        """initialiser for the search bot
+
+        Args:
+            board (Board): board the game is being played on
+            colour (BoardStatesEnum): colour of the player
+            search (BaseMultiplayerSearch, optional): search to use, defaults to a `ParanoidSearch`
+                                                      with the supplied evaluator and budgets
+            evaluator (BaseEvaluator, optional): static evaluator of the default search. Defaults to None.
+            time_budget (float, optional): max seconds per move of the default search. Defaults to 2.0.
+            max_depth (int, optional): max plies of the default search. Defaults to 4.
+        """
+        super().__init__(board, colour)
+        self.search = search or ParanoidSearch(evaluator, time_budget, max_depth)
+        self.last_result: SearchResult = None
+
+    def select_best_move(self, moves: list[Move]) -> Move:
+        """Selects the move found by the search
+
+        Args:
+            moves (list[Move]): moves to select from
+
+        Returns:
+            Move: best move found
+        """
+        self.last_result = self.search.search(self.board, self.colour, moves)
+        return self.last_result.best_move
+
+    def copy_for_pondering(self, board: Board) -> "SearchBot":
+        """Returns a copy of the bot with its own search, so pondering never shares
+        the transposition table or move orderer of the search the bot plays with
+
+        Args:
+            board (Board): board the copy plays on
+
+        Returns:
+            SearchBot: copy of the bot
+        """
+        player = super().copy_for_pondering(board)
+        player.search = copy.copy(self.search)
+        player.search.move_orderer = copy.deepcopy(self.search.move_orderer)
+        player.search.transposition_table = TranspositionTable(self.search.transposition_table.max_entries)
+        player.last_result = None
+        return player
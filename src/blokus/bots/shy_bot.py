@@ -1,11 +1,10 @@
 # Python imports
-import random
-
 from blokus.board import Board
 from blokus.board_states import BoardStatesEnum
 from blokus.move import Move
 
 # Internal imports
+from blokus.bots.move_features import get_move_sizes, select_best_scoring_move
 from blokus.player.base_player import BasePlayer
 
 
@@ -17,14 +16,12 @@ class ShyBot(BasePlayer):
     """
 
     def select_best_move(self, moves: list[Move]) -> Move:
-        """Selects a random move
+        """Selects a random move among the smallest
 
         Args:
             moves (list[Move]): moves to select from
 
         Returns:
-            Move: randomly selected move
+            Move: randomly selected smallest move
         """
-        smallest_move = min(moves, key=lambda x: len(x.idxs))
-        smallest_moves = [move for move in moves if len(move.idxs) == len(smallest_move.idxs)]
-        return random.choice(smallest_moves)
+        return select_best_scoring_move(moves, -get_move_sizes(moves))
@@ -5,3 +5,11 @@
 
 class InvalidMove(Exception):
     "The move played is invalid for the current board state"
+
+
+class APIPlayerError(Exception):
+    "The remote player could not be reached or replied with an invalid response"
+
+
+class BoardArenaError(Exception):
+    "The shared board arena is malformed or a slot could not be read consistently"
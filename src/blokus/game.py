@@ -1,18 +1,24 @@
 import logging
+import time
 
 from blokus.board import Board
 from blokus.board_states import BoardStatesEnum
 from blokus.exceptions import InvalidMove
+from blokus.move import Move
 from blokus.player.base_player import BasePlayer
+from blokus.telemetry import TelemetryRecorder
 
 
 class Game:
-    def __init__(self, board: Board, players: list[BasePlayer], timeout: float = 30):
+    def __init__(self, board: Board, players: list[BasePlayer], timeout: float = 30, telemetry: TelemetryRecorder = None):
         self._board = board
         self._players = players
         self._validate_game()
         self._timeout = timeout
         self.__unable_to_play = []
+        # every turn is recorded as a ply event if a recorder is supplied
+        self.telemetry = telemetry
+        self._game_id = telemetry.new_game() if telemetry is not None else None
 
     @property
     def board(self) -> Board:
@@ -59,6 +65,15 @@ class Game:
         """
         return BoardStatesEnum.get_player_colours()
     
+    @property
+    def is_finished(self) -> bool:
+        """Returns if the game is over, which is when no colour is able to play
+
+        Returns:
+            bool: if the game is over
+        """
+        return len(self.unable_to_play) == len(self.player_colours)
+
     def play_game(self, display: bool = True) -> list[BasePlayer]:
         """Plays the game,
         this continues until all players are unable to move.
@@ -70,15 +85,27 @@ class Game:
         Returns:
             list[BasePlayer]: players ranked by score
         """
-        while len(self.unable_to_play) != len(self.player_colours):
+        while not self.is_finished:
             self.play_turn()
             if display:
                 self.board.display_board()
-            logging.info(self.board.get_score_str())
+            # only build the score string if it will be logged
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                logging.info(self.board.get_score_str())
+        if self.telemetry is not None:
+            self.telemetry.flush()
         if display:
             self.board.display_board(stop_code=True)
         print(f"FINAL SCORE: {self.board.get_score_str()}")
-        return sorted(self.players, key=lambda x: self.board.get_score_for_colour(x.colour),reverse=True)
+        return self.get_rankings()
+
+    def get_rankings(self) -> list[BasePlayer]:
+        """Returns the players ranked by their current score
+
+        Returns:
+            list[BasePlayer]: players ranked by score
+        """
+        return sorted(self.players, key=lambda x: self.board.get_score_for_colour(x.colour), reverse=True)
 
     def play_turn(self):
         """Plays a single turn for all players
@@ -96,17 +123,127 @@ class Game:
         Args:
             colour (BoardStatesEnum): colour to play
         """
-        if colour in self.unable_to_play:
+        if not self.start_turn(colour):
             return
-        # finidng valid moves for player
-        valid_moves = self.board.get_valid_moves_for_colour(colour)
+        valid_moves = self.get_valid_moves_for_turn(colour)
+        chosen_move = None
+        start = time.perf_counter()
+        if valid_moves:
+            # get the player to select the best move
+            chosen_move = self.get_player_by_colour(colour).choose_move(valid_moves)
+        self.finish_turn(colour, valid_moves, chosen_move, time.perf_counter() - start)
+
+    def start_turn(self, colour: BoardStatesEnum) -> bool:
+        """Starts the turn of the supplied colour, playing its opening book move if it has one.
+        Turns are played by `start_turn`, `get_valid_moves_for_turn`, the player choosing
+        from the valid moves if there are any, then `finish_turn`, which records the turn
+
+        Args:
+            colour (BoardStatesEnum): colour to play
+
+        Returns:
+            bool: if the turn continues, False if the colour was unable to play or played a book move
+        """
+        if colour in self.unable_to_play:
+            return False
+        ply = len(self.board.move_list)
+        start = time.perf_counter()
+        if self.play_book_move(colour):
+            self._record_turn(colour, ply, -1, time.perf_counter() - start, 0.0)
+            return False
+        return True
+
+    def finish_turn(self, colour: BoardStatesEnum, valid_moves: list[Move], chosen_move: Move, decision_latency: float):
+        """Finishes the turn of the supplied colour, see `start_turn`, playing and recording the chosen move.
+        If there were no valid moves the colour was eliminated this turn, which is recorded
+
+        Args:
+            colour (BoardStatesEnum): colour to play
+            valid_moves (list[Move]): valid moves of the turn
+            chosen_move (Move): move chosen by the player, None if it did not choose one
+            decision_latency (float): seconds taken to choose the move
+        """
+        ply = len(self.board.move_list)
         if not valid_moves:
+            self._record_turn(colour, ply, 0, 0.0, 0.0)
+            return
+        start = time.perf_counter()
+        self.play_chosen_move(colour, chosen_move)
+        self._record_turn(colour, ply, len(valid_moves), decision_latency, time.perf_counter() - start)
+
+    def _record_turn(self, colour: BoardStatesEnum, ply: int, legal_move_count: int, decision_latency: float, update_latency: float):
+        """Records the turn of a colour to the telemetry, if the game has a recorder
+
+        Args:
+            colour (BoardStatesEnum): colour whose turn it was
+            ply (int): moves played before the turn
+            legal_move_count (int): valid moves of the colour, -1 if they were not generated
+            decision_latency (float): seconds taken to choose the move
+            update_latency (float): seconds taken to play the move and update the board, including notifying the players
+        """
+        if self.telemetry is None:
+            return
+        played = len(self.board.move_list) > ply
+        move_id = self.board.latest_move.move_id if played else -1
+        self.telemetry.record(
+            self._game_id,
+            ply,
+            colour,
+            legal_move_count,
+            move_id,
+            decision_latency,
+            update_latency,
+            self.board.get_scores(),
+            colour in self.unable_to_play,
+        )
+
+    def play_book_move(self, colour: BoardStatesEnum) -> bool:
+        """Plays the opening book move of the player of the supplied colour,
+        if it has one for the current position. No valid moves are generated
+
+        Args:
+            colour (BoardStatesEnum): colour to play
+
+        Returns:
+            bool: if a book move was played
+        """
+        if colour in self.unable_to_play:
+            return False
+        book_move = self.get_player_by_colour(colour).get_book_move()
+        if book_move is None or not self.board.validate_move(book_move):
+            return False
+        self.play_chosen_move(colour, book_move)
+        return True
+
+    def get_valid_moves_for_turn(self, colour: BoardStatesEnum) -> list[Move]:
+        """Gets the valid moves for the turn of the supplied colour.
+        If the colour is unable to play it is marked as such and no moves are returned
+
+        Args:
+            colour (BoardStatesEnum): colour to get the moves for
+
+        Returns:
+            list[Move]: valid moves, empty if the colour is unable to play
+        """
+        if colour in self.unable_to_play:
+            return []
+        # stop at the first valid move, so eliminated colours never generate them all
+        if not self.board.has_valid_move(colour):
             logging.info(f"{colour} is unable to play")
             self.__unable_to_play.append(colour)
-            return
-        # get the player to select the best move
-        player = self.get_player_by_colour(colour)
-        chosen_move = player.select_best_move(valid_moves)
+            return []
+        # finidng valid moves for player
+        return self.board.get_valid_moves_for_colour(colour)
+
+    def play_chosen_move(self, colour: BoardStatesEnum, chosen_move: Move):
+        """Plays the move chosen by the player of the supplied colour,
+        no move is played if the player did not choose one.
+        All players are notified of the played move
+
+        Args:
+            colour (BoardStatesEnum): colour of the player
+            chosen_move (Move): move chosen by the player
+        """
         if not chosen_move:
             return
         # play the move
@@ -114,6 +251,10 @@ class Game:
             self.board.play_move(chosen_move)
         except InvalidMove:
             logging.info(f"Player {colour} made an invalid move")
+            return
+
+        for player in self.players:
+            player.on_move_played(chosen_move)
 
     def _validate_game(self):
         """Validates that the game is valid,
@@ -0,0 +1,223 @@
+# Python Imports
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+# Internal Imports
+from blokus.board_states import BoardStatesEnum
+from blokus.game import Game
+from blokus.move import Move
+from blokus.player.base_player import BasePlayer
+
+
+@dataclass
+class HostMetrics:
+    """Metrics of a `GameHost`
+
+    - plies: moves requested from players across all games
+    - queue_depth: local move selections waiting for an executor worker
+    - running_local: local move selections running in the executor
+    - awaiting_remote: games waiting on a remote player to respond
+    - released_boards: times an idle board released its valid moves
+    """
+
+    started_at: float = field(default_factory=time.perf_counter)
+    plies: int = 0
+    active_games: int = 0
+    finished_games: int = 0
+    queue_depth: int = 0
+    running_local: int = 0
+    awaiting_remote: int = 0
+    released_boards: int = 0
+
+    @property
+    def plies_per_second(self) -> float:
+        """Returns the throughput of the host since it started
+
+        Returns:
+            float: plies per second
+        """
+        elapsed = time.perf_counter() - self.started_at
+        return self.plies / elapsed if elapsed else 0.0
+
+
+class GameHost:
+    """Hosts many games at once on a single event loop.
+
+    Each game runs as its own task and advances as soon as its current player responds.
+    Players that provide `async_select_best_move` (such as the `APIPlayer`) are awaited
+    on the loop, local bots are run in an executor so they do not block other games.
+
+    Boards of games that are waiting on a remote player are idle, when the valid moves cached
+    across all boards exceed the memory budget the longest idle boards release them.
+    They are rebuilt from the board when the game next needs them. Boards of games waiting on
+    a local player are never released, as the player may be searching on the board in the executor.
+    """
+
+    def __init__(self, executor: Executor = None, max_cached_moves: int = 200_000):
+        """initialiser for the host
+
+        Args:
+            executor (Executor, optional): executor for local bots,
+                                           defaults to a thread pool owned by the host.
+            max_cached_moves (int, optional): memory budget as the max number of valid moves cached
+                                              across all boards. Defaults to 200_000.
+        """
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor()
+        self.max_cached_moves = max_cached_moves
+        self.metrics = HostMetrics()
+        # the executor metrics are updated from worker threads
+        self._metrics_lock = threading.Lock()
+
+        # idle games ordered from longest to most recently idle
+        self._idle_games: dict[Game, None] = {}
+        self._cached_moves: dict[Game, int] = {}
+
+    async def play_games(self, games: list[Game]) -> list[list[BasePlayer]]:
+        """Plays all the supplied games concurrently
+
+        Args:
+            games (list[Game]): games to play
+
+        Returns:
+            list[list[BasePlayer]]: the rankings of each game, in the order of the games
+        """
+        return await asyncio.gather(*[self.play_game(game) for game in games])
+
+    async def play_game(self, game: Game) -> list[BasePlayer]:
+        """Plays a single game until it is finished
+
+        Args:
+            game (Game): game to play
+
+        Returns:
+            list[BasePlayer]: players ranked by score
+        """
+        self.metrics.active_games += 1
+        try:
+            while not game.is_finished:
+                for colour in game.player_colours:
+                    await self._play_turn_for_colour(game, colour)
+        finally:
+            self.metrics.active_games -= 1
+            self._idle_games.pop(game, None)
+            self._cached_moves.pop(game, None)
+
+        self.metrics.finished_games += 1
+        logging.info(f"game finished, {game.board.get_score_str()}")
+        return game.get_rankings()
+
+    def close(self):
+        """Shuts down the executor if it is owned by the host"""
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+    async def _play_turn_for_colour(self, game: Game, colour: BoardStatesEnum):
+        """Plays a move for the supplied colour, in the steps of `Game.play_turn_for_colour`
+        so the turn is recorded to the game's telemetry the same way
+
+        Args:
+            game (Game): game to play in
+            colour (BoardStatesEnum): colour to play
+        """
+        ply = len(game.board.move_list)
+        if not game.start_turn(colour):
+            # a book move may have been played
+            self.metrics.plies += len(game.board.move_list) - ply
+            return
+        if game.board.valid_moves_released:
+            # rebuilding released moves is cpu heavy so keep it off the loop
+            loop = asyncio.get_running_loop()
+            valid_moves = await loop.run_in_executor(self._executor, game.get_valid_moves_for_turn, colour)
+        else:
+            valid_moves = game.get_valid_moves_for_turn(colour)
+        if not valid_moves:
+            game.finish_turn(colour, valid_moves, None, 0.0)
+            return
+
+        player = game.get_player_by_colour(colour)
+        self.metrics.plies += 1
+        self._cached_moves[game] = game.board.valid_move_count
+        if self._is_remote(player):
+            self._idle_games[game] = None
+        self._release_idle_boards()
+        start = time.perf_counter()
+        try:
+            chosen_move = await self._select_move(player, valid_moves)
+        finally:
+            self._idle_games.pop(game, None)
+
+        game.finish_turn(colour, valid_moves, chosen_move, time.perf_counter() - start)
+        self._cached_moves[game] = game.board.valid_move_count
+
+    async def _select_move(self, player: BasePlayer, valid_moves: list[Move]) -> Move:
+        """Gets the player to select a move, awaiting remote players
+        and running local players in the executor
+
+        Args:
+            player (BasePlayer): player to select the move
+            valid_moves (list[Move]): moves to select from
+
+        Returns:
+            Move: selected move
+        """
+        if self._is_remote(player):
+            self.metrics.awaiting_remote += 1
+            try:
+                return await player.async_select_best_move(valid_moves)
+            finally:
+                self.metrics.awaiting_remote -= 1
+
+        with self._metrics_lock:
+            self.metrics.queue_depth += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._run_local_player, player, valid_moves)
+
+    def _run_local_player(self, player: BasePlayer, valid_moves: list[Move]) -> Move:
+        """Runs a local player in the executor, tracking the queue metrics
+
+        Args:
+            player (BasePlayer): player to select the move
+            valid_moves (list[Move]): moves to select from
+
+        Returns:
+            Move: selected move
+        """
+        with self._metrics_lock:
+            self.metrics.queue_depth -= 1
+            self.metrics.running_local += 1
+        try:
+            return player.choose_move(valid_moves)
+        finally:
+            with self._metrics_lock:
+                self.metrics.running_local -= 1
+
+    @staticmethod
+    def _is_remote(player: BasePlayer) -> bool:
+        """Checks if the player is awaited on the loop rather than run in the executor
+
+        Args:
+            player (BasePlayer): player to check
+
+        Returns:
+            bool: if the player selects its moves remotely
+        """
+        return hasattr(player, "async_select_best_move")
+
+    def _release_idle_boards(self):
+        """Enforces the memory budget, releasing the valid moves of the longest idle boards.
+        Only games waiting on a remote player are idle, so no released board is in use"""
+        total_cached = sum(self._cached_moves.values())
+        for idle_game in list(self._idle_games):
+            if total_cached <= self.max_cached_moves:
+                break
+            if idle_game.board.valid_moves_released:
+                continue
+            total_cached -= self._cached_moves[idle_game]
+            self._cached_moves[idle_game] = 0
+            idle_game.board.release_valid_moves()
+            self.metrics.released_boards += 1
@@ -0,0 +1,241 @@
+# Python Imports
+from typing import Self
+
+# External Imports
+import numpy as np
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.move import Move
+from blokus.pieces.catalogue import MAX_PIECE_SIZE, PIECE_ORDER
+from blokus.pieces.piece_set import PieceSet, build_full_piece_set
+
+_PLAYER_COLOURS = BoardStatesEnum.get_player_colours()
+_COLOURS_BY_ID = {colour.int_id: colour for colour in _PLAYER_COLOURS}
+_COLOUR_IDS = np.array([colour.int_id for colour in _PLAYER_COLOURS], dtype=np.uint8)
+
+# a ply is the move id, the int id of its colour, the piece removed and the flat idxs of the cells covered
+_DIFF_DTYPE = np.dtype(
+    [("move_id", "<u4"), ("colour", "u1"), ("piece_id", "u1"), ("size", "u1"), ("cells", "<u2", (MAX_PIECE_SIZE,))]
+)
+
+
+class GameHistory:
+    """History of the plies of a game with random access to the position after any of them.
+
+    Each ply is stored as a small fixed size diff, the cells the move covered and the piece it removed.
+    Every `checkpoint_interval` plies the full state (board array and piece masks, see `PieceSet.to_mask`)
+    is stored as a checkpoint. A cursor holds the position after `ply` plies, seeking moves the cursor
+    from whichever of the cursor and the closest earlier checkpoint is nearer, applying or undoing diffs.
+    A range of diffs is applied in one vectorised step, as a cell is only ever covered once.
+
+    Memory is 17 bytes per ply (`_DIFF_DTYPE.itemsize`) plus dimension ** 2 + 16 bytes per checkpoint, so a larger
+    interval holds less at the cost of applying more diffs when seeking.
+    """
+
+    def __init__(self, dimension: int = 20, checkpoint_interval: int = 8):
+        """initialiser for the history of a game from the empty board
+
+        Args:
+            dimension (int, optional): dimension of the board. Defaults to 20.
+            checkpoint_interval (int, optional): plies between full state checkpoints. Defaults to 8.
+        """
+        if checkpoint_interval < 1:
+            raise ValueError(f"checkpoint interval must be positive, got {checkpoint_interval}")
+        self.dimension = dimension
+        self.checkpoint_interval = checkpoint_interval
+
+        full_mask = build_full_piece_set().to_mask()
+        self._diffs = np.zeros(64, dtype=_DIFF_DTYPE)
+        self._length = 0
+        self._checkpoint_arrays = [np.zeros((dimension, dimension), dtype=np.uint8)]
+        self._checkpoint_masks = [np.full(len(_PLAYER_COLOURS), full_mask, dtype=np.uint32)]
+
+        # state after the last ply recorded, for building the checkpoints
+        self._head_array = self._checkpoint_arrays[0].copy()
+        self._head_masks = self._checkpoint_masks[0].copy()
+        # state after the plies the cursor is at
+        self._array = self._checkpoint_arrays[0].copy()
+        self._masks = self._checkpoint_masks[0].copy()
+        self._ply = 0
+
+    @classmethod
+    def from_board(cls, board: Board, checkpoint_interval: int = 8) -> Self:
+        """Creates the history of the moves played on a board since its empty array.
+        The moves are recorded without being validated or replayed on a board
+
+        Args:
+            board (Board): board of the game
+            checkpoint_interval (int, optional): plies between full state checkpoints. Defaults to 8.
+
+        Returns:
+            GameHistory: history of the game, with the cursor at the start
+        """
+        history = cls(board.dimension, checkpoint_interval)
+        for move in board.move_list:
+            history.record(move)
+        return history
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def ply(self) -> int:
+        """Returns how many plies the cursor position is after
+
+        Returns:
+            int: ply of the cursor
+        """
+        return self._ply
+
+    @property
+    def array(self) -> np.ndarray:
+        """Returns the board array at the cursor
+
+        Returns:
+            np.ndarray: read only uint8 board array
+        """
+        array = self._array.view()
+        array.setflags(write=False)
+        return array
+
+    @property
+    def piece_masks(self) -> dict[BoardStatesEnum, int]:
+        """Returns the remaining pieces of each colour at the cursor
+
+        Returns:
+            dict[BoardStatesEnum, int]: bitmask of the pieces of each colour, see `PieceSet.to_mask`
+        """
+        return {colour: int(mask) for colour, mask in zip(_PLAYER_COLOURS, self._masks)}
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the bytes held by the diffs and checkpoints
+
+        Returns:
+            int: bytes held
+        """
+        checkpoints = sum(array.nbytes + masks.nbytes for array, masks in zip(self._checkpoint_arrays, self._checkpoint_masks))
+        return self._diffs[: self._length].nbytes + checkpoints
+
+    def record(self, move: Move):
+        """Records the next ply of the game, the cursor does not move
+
+        Args:
+            move (Move): move played
+        """
+        if self._length == len(self._diffs):
+            self._diffs = np.concatenate([self._diffs, np.zeros(len(self._diffs), dtype=_DIFF_DTYPE)])
+        diff = self._diffs[self._length : self._length + 1]
+        diff["move_id"] = move.move_id
+        diff["colour"] = move.colour.int_id
+        diff["piece_id"] = PIECE_ORDER.index(move.piece_type)
+        diff["size"] = len(move.idxs)
+        diff["cells"][0, : len(move.idxs)] = [row * self.dimension + col for row, col in move.idxs]
+        self._length += 1
+
+        self._apply(self._head_array, self._head_masks, diff)
+        if self._length % self.checkpoint_interval == 0:
+            self._checkpoint_arrays.append(self._head_array.copy())
+            self._checkpoint_masks.append(self._head_masks.copy())
+
+    def seek(self, ply: int):
+        """Moves the cursor to the position after the supplied number of plies
+
+        Args:
+            ply (int): plies played, from 0 for the empty board to `len(history)`
+
+        Raises:
+            IndexError: if the ply is outside the history
+        """
+        if not 0 <= ply <= self._length:
+            raise IndexError(f"ply {ply} is outside the history of {self._length} plies")
+
+        checkpoint = ply // self.checkpoint_interval
+        checkpoint_ply = checkpoint * self.checkpoint_interval
+        if ply - checkpoint_ply < abs(ply - self._ply):
+            self._array[:] = self._checkpoint_arrays[checkpoint]
+            self._masks[:] = self._checkpoint_masks[checkpoint]
+            self._ply = checkpoint_ply
+
+        if ply > self._ply:
+            self._apply(self._array, self._masks, self._diffs[self._ply : ply])
+        elif ply < self._ply:
+            self._undo(self._array, self._masks, self._diffs[ply : self._ply])
+        self._ply = ply
+
+    def step(self, plies: int = 1):
+        """Moves the cursor forward, or backward for negative plies
+
+        Args:
+            plies (int, optional): plies to move by. Defaults to 1.
+        """
+        self.seek(self._ply + plies)
+
+    def get_move(self, ply: int) -> Move:
+        """Returns the move of a ply
+
+        Args:
+            ply (int): index of the ply, the move played from the position after `ply` plies
+
+        Returns:
+            Move: move of the ply
+        """
+        diff = self._diffs[: self._length][ply]
+        return Move.from_move_id(_COLOURS_BY_ID[int(diff["colour"])], int(diff["move_id"]))
+
+    def get_board(self, ply: int = None) -> Board:
+        """Builds a board of the position after the supplied number of plies,
+        with the moves that led to it and its valid moves
+
+        Args:
+            ply (int, optional): plies played. Defaults to the cursor.
+
+        Returns:
+            Board: board of the position
+        """
+        if ply is not None:
+            self.seek(ply)
+        piece_sets = {colour: PieceSet.from_mask(mask) for colour, mask in self.piece_masks.items()}
+        moves = [self.get_move(idx) for idx in range(self._ply)]
+        return Board.from_array(self._array.astype(int), piece_sets, moves)
+
+    def _apply(self, array: np.ndarray, masks: np.ndarray, diffs: np.ndarray):
+        """Applies a range of diffs to a state
+
+        Args:
+            array (np.ndarray): board array to update in place
+            masks (np.ndarray): piece masks to update in place
+            diffs (np.ndarray): consecutive diffs
+        """
+        in_piece = np.arange(MAX_PIECE_SIZE) < diffs["size"][:, None]
+        colours = np.broadcast_to(diffs["colour"][:, None], in_piece.shape)
+        array.reshape(-1)[diffs["cells"][in_piece]] = colours[in_piece]
+        masks &= ~self._get_removed_pieces(diffs)
+
+    def _undo(self, array: np.ndarray, masks: np.ndarray, diffs: np.ndarray):
+        """Undoes a range of diffs from a state
+
+        Args:
+            array (np.ndarray): board array to update in place
+            masks (np.ndarray): piece masks to update in place
+            diffs (np.ndarray): consecutive diffs
+        """
+        in_piece = np.arange(MAX_PIECE_SIZE) < diffs["size"][:, None]
+        array.reshape(-1)[diffs["cells"][in_piece]] = BoardStatesEnum.EMPTY.int_id
+        masks |= self._get_removed_pieces(diffs)
+
+    @staticmethod
+    def _get_removed_pieces(diffs: np.ndarray) -> np.ndarray:
+        """Returns the pieces each colour removed over a range of diffs
+
+        Args:
+            diffs (np.ndarray): consecutive diffs
+
+        Returns:
+            np.ndarray: uint32 bitmask of the removed pieces of each colour
+        """
+        bits = np.left_shift(np.uint32(1), diffs["piece_id"].astype(np.uint32))
+        is_colour = diffs["colour"][None, :] == _COLOUR_IDS[:, None]
+        return np.bitwise_or.reduce(np.where(is_colour, bits, np.uint32(0)), axis=1).astype(np.uint32)
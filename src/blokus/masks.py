@@ -0,0 +1,28 @@
+# Python Imports
+# External Imports
+import numpy as np
+
+# Internal Imports
+
+# row and col steps to the cells sharing an edge or a corner with a cell
+ADJACENT_STEPS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+DIAGONAL_STEPS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+def shift_mask(mask: np.ndarray, steps: tuple[tuple[int, int], ...]) -> np.ndarray:
+    """Returns the cells reached by moving any cell of the mask by one of the steps,
+    stacked masks are shifted over their last two axes
+
+    Args:
+        mask (np.ndarray): bool mask
+        steps (tuple[tuple[int, int], ...]): row and col steps of at most 1
+
+    Returns:
+        np.ndarray: bool mask of the reached cells
+    """
+    rows, cols = mask.shape[-2:]
+    padded = np.pad(mask, [(0, 0)] * (mask.ndim - 2) + [(1, 1), (1, 1)])
+    shifted = np.zeros_like(mask)
+    for d_row, d_col in steps:
+        shifted |= padded[..., 1 - d_row : 1 - d_row + rows, 1 - d_col : 1 - d_col + cols]
+    return shifted
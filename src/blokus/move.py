@@ -1,11 +1,13 @@
 # Python Imports
 from dataclasses import dataclass
+from functools import cached_property
 
 # External Imports
 import numpy as np
 
 # Internal Imports
 from blokus.board_states import BoardStatesEnum
+from blokus.pieces.catalogue import PIECE_ORDER, decode_move_id, encode_move_id, get_piece_catalogue
 from blokus.pieces.piece_names import PieceNameEnum
 
 
@@ -45,6 +47,35 @@ class Move:
         idxs = [(idx_pair[0] + origin[0], idx_pair[1] + origin[1]) for idx_pair in relative_representation]
         return cls(colour, piece_type, idxs)
 
+    @classmethod
+    def from_move_id(cls, colour: BoardStatesEnum, move_id: int) -> "Move":
+        """Creates a move from a compact move id, see `move_id`
+
+        Args:
+            colour (BoardStatesEnum): colour of the player
+            move_id (int): id of the move
+
+        Returns:
+            Move: the move
+        """
+        piece_id, orientation_id, row, col = decode_move_id(move_id)
+        orientation = get_piece_catalogue().get_orientation(PIECE_ORDER[piece_id], orientation_id)
+        idxs = [(offset_row + row, offset_col + col) for offset_row, offset_col in orientation.offsets.tolist()]
+        move = cls(colour, orientation.piece_type, idxs)
+        move.__dict__["move_id"] = move_id
+        return move
+
+    @cached_property
+    def move_id(self) -> int:
+        """Returns a compact id of the move.
+        This packs the piece, its orientation and its top left position into a single int,
+        the colour is not included. The id is cached as moves are not mutated once built.
+
+        Returns:
+            int: id of the move
+        """
+        orientation, (row, col) = get_piece_catalogue().find_orientation(self.piece_type, self.idxs)
+        return encode_move_id(orientation.piece_id, orientation.orientation_id, row, col)
 
     def __hash__(self) -> int:
         return hash((self.colour, self.piece_type, tuple(self.idxs)))
\ No newline at end of file
@@ -0,0 +1,13 @@
+# Python Imports
+from enum import Enum
+
+
+class MoveOrderEnum(Enum):
+    """Orders `Board.iter_valid_moves` can yield moves in"""
+
+    # the order the moves are stored or found in
+    FOUND = "found"
+    # a random order, suited to playouts that only need one random move
+    RANDOM = "random"
+    # pieces with the most cells first
+    LARGEST_FIRST = "largest_first"
@@ -0,0 +1,161 @@
+# Python Imports
+import argparse
+import logging
+import random
+from collections import defaultdict
+from pathlib import Path
+
+# External Imports
+import numpy as np
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.bots.bot_enums import BotEnum
+from blokus.move import Move
+from blokus.self_play import GameRecord, SelfPlayRunner
+from blokus.symmetry import get_position_key, transform_move
+
+# one entry per position, sorted by key so lookups are a binary search
+BOOK_DTYPE = np.dtype([("key", "<u8"), ("move_id", "<u4"), ("count", "<u4"), ("mean_score", "<f4")])
+
+
+class OpeningBook:
+    """Book of the best known moves for early game positions.
+
+    Positions are keyed by `get_position_key`, so all symmetric positions share an entry.
+    Moves are stored in the canonical frame of the position and mapped back onto the
+    board on lookup. The book is a sorted array saved as .npy, loading memory maps it.
+    """
+
+    def __init__(self, entries: np.ndarray):
+        """initialiser for the book
+
+        Args:
+            entries (np.ndarray): entries of the book with BOOK_DTYPE, sorted by key
+        """
+        self._entries = entries
+        self._keys = entries["key"]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @classmethod
+    def load(cls, path: Path) -> "OpeningBook":
+        """Memory maps a book saved via `save`
+
+        Args:
+            path (Path): file to load
+
+        Returns:
+            OpeningBook: loaded book
+        """
+        return cls(np.load(path, mmap_mode="r"))
+
+    def save(self, path: Path):
+        """Saves the book as a .npy file
+
+        Args:
+            path (Path): file to save to
+        """
+        np.save(path, np.asarray(self._entries))
+
+    def lookup(self, board: Board, colour: BoardStatesEnum) -> Move:
+        """Looks up the book move for the position, no moves are generated
+
+        Args:
+            board (Board): board of the position
+            colour (BoardStatesEnum): colour to move
+
+        Returns:
+            Move: book move, None if the position is not in the book
+        """
+        if not len(self._entries):
+            return None
+        key, transform = get_position_key(board, colour)
+        idx = np.searchsorted(self._keys, key)
+        if idx == len(self._keys) or self._keys[idx] != key:
+            return None
+
+        canonical_move = Move.from_move_id(colour, int(self._entries["move_id"][idx]))
+        return transform_move(canonical_move, transform, board.dimension, inverse=True)
+
+
+class OpeningBookBuilder:
+    """Builds an `OpeningBook` from self play game records.
+
+    The first plies of every record are replayed, the move played in each position is
+    credited with the final score of the colour that played it. The book keeps the move
+    with the best mean score for every position seen often enough.
+    """
+
+    def __init__(self, max_plies: int = 12, min_count: int = 2):
+        """initialiser for the builder
+
+        Args:
+            max_plies (int, optional): number of plies of each game to add. Defaults to 12.
+            min_count (int, optional): times a move must be seen to be added. Defaults to 2.
+        """
+        self.max_plies = max_plies
+        self.min_count = min_count
+        # key -> move id -> [count, total score]
+        self._stats: dict[int, dict[int, list[int]]] = defaultdict(lambda: defaultdict(lambda: [0, 0]))
+
+    def add_record(self, record: GameRecord):
+        """Adds the opening of a game record to the book
+
+        Args:
+            record (GameRecord): record to add
+        """
+        board = Board()
+        for move in record.get_moves()[: self.max_plies]:
+            key, transform = get_position_key(board, move.colour)
+            canonical_move = transform_move(move, transform, board.dimension)
+            stats = self._stats[key][canonical_move.move_id]
+            stats[0] += 1
+            stats[1] += record.scores[move.colour.str_id]
+            board.play_move(move)
+
+    def build(self) -> OpeningBook:
+        """Builds the book from the added records
+
+        Returns:
+            OpeningBook: built book
+        """
+        entries = []
+        for key, move_stats in self._stats.items():
+            candidates = [(total / count, count, move_id) for move_id, (count, total) in move_stats.items() if count >= self.min_count]
+            if not candidates:
+                continue
+            mean_score, count, move_id = max(candidates)
+            entries.append((key, move_id, count, mean_score))
+
+        book_entries = np.array(entries, dtype=BOOK_DTYPE)
+        book_entries.sort(order="key")
+        return OpeningBook(book_entries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="builds an opening book from self play")
+    parser.add_argument("out", type=Path, help="file to save the book to")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--bots", nargs="+", default=["GREEDY", "CORNER"], choices=[b.name for b in BotEnum])
+    parser.add_argument("--max-plies", type=int, default=12)
+    parser.add_argument("--min-count", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    # the bots draw from the random module, seed it too so the games are reproducible
+    if args.seed is not None:
+        random.seed(args.seed)
+    records = SelfPlayRunner([BotEnum[name] for name in args.bots], seed=args.seed).run(args.games)
+    builder = OpeningBookBuilder(args.max_plies, args.min_count)
+    for record in records:
+        builder.add_record(record)
+    book = builder.build()
+    book.save(args.out)
+    logging.info(f"saved opening book with {len(book)} positions to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""
+Memoised placements around an origin.
+
+A placement of a variant of a piece covers its origin, which is diagonal to the colour or a board corner,
+so whether it is valid only depends on the cells it covers being free for the colour and the piece being left.
+Pieces are connected and at most `MAX_PIECE_SIZE` cells, so every cell of a placement is within `WINDOW_REACH`
+steps of the origin. The placements that fit at an origin are therefore determined by the blocked cells
+(occupied, sharing an edge with the colour or off the board) of the window of cells within reach of it.
+Recurring windows, such as along the board edges, are looked up rather than checked.
+
+Pieces are also connected through the cells they cover, so only the free cells joined to the origin within
+the window can be covered. The number of them, the free space of the origin, bounds the pieces that fit
+before anything is looked up, which prunes most pieces from the pockets of the mid and late game.
+"""
+
+# Python Imports
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+# External Imports
+import numpy as np
+
+# Internal Imports
+from blokus.masks import ADJACENT_STEPS
+from blokus.pieces.catalogue import MAX_PIECE_SIZE, PIECE_ORDER, encode_move_id, get_piece_catalogue
+
+WINDOW_REACH = MAX_PIECE_SIZE - 1
+# row and col steps to the cells of a window, bit n of a window key is the cell of step n
+_WINDOW_STEPS = np.array(
+    [(row, col) for row in range(-WINDOW_REACH, WINDOW_REACH + 1) for col in range(-WINDOW_REACH, WINDOW_REACH + 1) if abs(row) + abs(col) <= WINDOW_REACH]
+)
+
+_WINDOW_STEP_BITS = {step: bit for bit, step in enumerate(map(tuple, _WINDOW_STEPS.tolist()))}
+_ORIGIN_BIT = _WINDOW_STEP_BITS[(0, 0)]
+# bits of the cells sharing an edge with each cell of a window, len(_WINDOW_STEPS) for cells outside it
+_WINDOW_NEIGHBOURS = np.array(
+    [
+        [_WINDOW_STEP_BITS.get((row + row_step, col + col_step), len(_WINDOW_STEPS)) for row_step, col_step in ADJACENT_STEPS]
+        for row, col in _WINDOW_STEP_BITS
+    ]
+)
+
+
+def _pack_windows(windows: np.ndarray) -> np.ndarray:
+    """Packs bool windows into keys
+
+    Args:
+        windows (np.ndarray): (n, window cells) bool
+
+    Returns:
+        np.ndarray: uint64 key of each window
+    """
+    packed = np.packbits(windows, axis=1, bitorder="little")
+    return np.pad(packed, [(0, 0), (0, 8 - packed.shape[1])]).view("<u8")[:, 0]
+
+
+@lru_cache(maxsize=None)
+def _get_variant_table() -> dict[str, np.ndarray]:
+    """Builds the variants of every piece, in the order of `PIECE_ORDER` and `BasePiece` variants,
+    with the window key of their cells around the origin
+
+    Returns:
+        dict[str, np.ndarray]: read only arrays indexed by variant
+    """
+    packed = get_piece_catalogue().packed
+    orientations = packed["variant_orientations"].astype(np.intp)
+    pivots = packed["variant_pivots"].astype(np.intp)
+
+    windows = np.zeros((len(orientations), len(_WINDOW_STEPS)), dtype=bool)
+    for variant, (orientation, pivot) in enumerate(zip(orientations, pivots)):
+        offsets = packed["orientation_offsets"][orientation, : packed["orientation_sizes"][orientation]]
+        windows[variant, [_WINDOW_STEP_BITS[tuple(step)] for step in (offsets - pivot).tolist()]] = True
+
+    table = {
+        "pieces": packed["orientation_pieces"][orientations].astype(np.uint32),
+        "masks": _pack_windows(windows),
+        # the move id of a variant relative to its origin, move ids are linear in the top left of a placement
+        "move_ids": encode_move_id(
+            packed["orientation_pieces"][orientations].astype(np.int64),
+            packed["orientation_ids"][orientations].astype(np.int64),
+            0,
+            0,
+        )
+        - encode_move_id(0, 0, pivots[:, 0], pivots[:, 1]),
+    }
+    for array in table.values():
+        array.setflags(write=False)
+    return table
+
+
+@lru_cache(maxsize=None)
+def get_fitting_piece_masks() -> tuple[int, ...]:
+    """Returns the pieces small enough to fit in each free space, see `get_windows`
+
+    Returns:
+        tuple[int, ...]: bitmask of the pieces, see `PieceSet.to_mask`, indexed by free space
+    """
+    packed = get_piece_catalogue().packed
+    piece_sizes = np.zeros(len(PIECE_ORDER), dtype=np.intp)
+    piece_sizes[packed["orientation_pieces"]] = packed["orientation_sizes"]
+    return tuple(
+        sum(1 << piece_id for piece_id, size in enumerate(piece_sizes.tolist()) if size <= free_space)
+        for free_space in range(len(_WINDOW_STEPS) + 1)
+    )
+
+
+def get_windows(blocked: np.ndarray, origins: list[tuple[int, int]]) -> tuple[list[int], list[int]]:
+    """Returns the key of the window around each origin, the bitmask of the cells a placement
+    at the origin is unable to cover, and the free space of the origin, the number of cells it is able to.
+
+    The cells able to be covered are found by a flood fill from the origin over the free cells,
+    bounded to `WINDOW_REACH` steps. Cells off the board are blocked, as are free cells cut off from the origin,
+    so windows that only differ outside the pocket of an origin share a key
+
+    Args:
+        blocked (np.ndarray): bool mask of the cells the colour is unable to cover
+        origins (list[tuple[int, int]]): origins to get the windows of
+
+    Returns:
+        tuple[list[int], list[int]]: key of the window and free space of each origin
+    """
+    padded = np.pad(blocked.astype(bool), WINDOW_REACH, constant_values=True)
+    origins = np.array(origins, dtype=np.intp).reshape(-1, 2) + WINDOW_REACH
+    free = ~padded[origins[:, :1] + _WINDOW_STEPS[:, 0], origins[:, 1:] + _WINDOW_STEPS[:, 1]]
+
+    # the extra column stands in for the cells outside the window, which are never reached
+    reached = np.zeros((len(origins), len(_WINDOW_STEPS) + 1), dtype=bool)
+    reached[:, _ORIGIN_BIT] = free[:, _ORIGIN_BIT]
+    for _ in range(WINDOW_REACH):
+        reached[:, :-1] |= free & reached[:, _WINDOW_NEIGHBOURS].any(axis=2)
+
+    return _pack_windows(~reached[:, :-1]).tolist(), reached.sum(axis=1).tolist()
+
+
+class PatternCache:
+    """Bounded LRU of the placements that fit at an origin, keyed by the window around the origin,
+    see `get_windows`.
+
+    Entries hold the placements of every piece, the remaining pieces of the colour are selected from them
+    on lookup, so a window is shared by every colour and every stage of a game. The entries do not depend
+    on the board, so one cache is shared by every board, see `get_pattern_cache`.
+    Lookups are counted so the hit rate can be monitored.
+    """
+
+    def __init__(self, capacity: int = 1 << 16):
+        """initialiser for an empty cache
+
+        Args:
+            capacity (int, optional): max entries kept, the least recently used are evicted. Defaults to 65536.
+        """
+        self.capacity = capacity
+        self._entries: OrderedDict[int, tuple[np.ndarray, np.ndarray]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """Returns the fraction of lookups that were cached
+
+        Returns:
+            float: hit rate, 0 before any lookups
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get_move_ids(self, window: int, piece_mask: int, origin: tuple[int, int]) -> np.ndarray:
+        """Returns the moves that fit at an origin, in the order of the pieces and their variants
+
+        Args:
+            window (int): key of the window around the origin, see `get_windows`
+            piece_mask (int): remaining pieces of the colour, see `PieceSet.to_mask`
+            origin (tuple[int, int]): origin the moves cover
+
+        Returns:
+            np.ndarray: int64 move ids
+        """
+        with self._lock:
+            entry = self._entries.get(window)
+            if entry is not None:
+                self._entries.move_to_end(window)
+                self.hits += 1
+        if entry is None:
+            entry = self._find_placements(window)
+            with self._lock:
+                self.misses += 1
+                self._entries[window] = entry
+                if len(self._entries) > self.capacity:
+                    self._entries.popitem(last=False)
+
+        pieces, relative_ids = entry
+        remaining = (np.uint32(piece_mask) >> pieces) & 1 == 1
+        return relative_ids[remaining] + encode_move_id(0, 0, origin[0], origin[1])
+
+    def clear(self):
+        """Removes every entry and resets the counts"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @staticmethod
+    def _find_placements(window: int) -> tuple[np.ndarray, np.ndarray]:
+        """Checks every variant of every piece against a window
+
+        Args:
+            window (int): key of the window around the origin
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: piece ids and move ids relative to the origin of the variants that fit
+        """
+        table = _get_variant_table()
+        fits = table["masks"] & np.uint64(window) == 0
+        return table["pieces"][fits], table["move_ids"][fits]
+
+
+_PATTERN_CACHE: PatternCache = None
+
+
+def get_pattern_cache() -> PatternCache:
+    """Returns the pattern cache shared by every board, creating it on first use
+
+    Returns:
+        PatternCache: the shared cache
+    """
+    global _PATTERN_CACHE
+    if _PATTERN_CACHE is None:
+        _PATTERN_CACHE = PatternCache()
+    return _PATTERN_CACHE
@@ -0,0 +1,476 @@
+# Python Imports
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+# External Imports
+import numpy as np
+
+# Internal Imports
+from blokus.pieces.piece_names import PieceNameEnum
+
+# bump this whenever the layout of the catalogue or the piece definitions change,
+# cached catalogues with a different version are ignored and rebuilt
+CATALOGUE_VERSION = 1
+
+# every piece fits in a 5x5 window once normalised to its top left corner
+TEMPLATE_DIMENSION = 5
+MAX_PIECE_SIZE = 5
+
+# order of the pieces, the index of a piece in this list is its piece id
+PIECE_ORDER: list[PieceNameEnum] = list(PieceNameEnum)
+
+_DIAGONAL_STEPS = np.array([(-1, -1), (-1, 1), (1, -1), (1, 1)], dtype=np.int8)
+_ADJACENT_STEPS = np.array([(-1, 0), (1, 0), (0, -1), (0, 1)], dtype=np.int8)
+
+# packed arrays making up the catalogue, these are what get cached to disk
+_PACKED_KEYS = (
+    "orientation_pieces",
+    "orientation_ids",
+    "orientation_sizes",
+    "orientation_offsets",
+    "orientation_dims",
+    "orientation_templates",
+    "corner_counts",
+    "corner_offsets",
+    "edge_counts",
+    "edge_offsets",
+    "variant_orientations",
+    "variant_pivots",
+)
+
+
+@dataclass(frozen=True, eq=False)
+class PieceOrientation:
+    """A single orientation of a piece.
+
+    All offsets are relative to the top left corner of the bounding box of
+    the orientation, so the orientation spans rows [0, height) and cols [0, width).
+    The arrays are read only views into the packed arrays of the catalogue.
+
+    - offsets: cells the piece occupies
+    - corner_offsets: cells diagonal to the piece that do not share an edge with it,
+      these are where the colour could place its next piece
+    - edge_offsets: cells sharing an edge with the piece, these become forbidden
+      for the colour once the piece is placed
+    - pivots: the cells that the variants of `BasePiece` place on their origin
+    - template: bitmask of the occupied cells within a 5x5 window, bit = row * 5 + col
+    """
+
+    piece_type: PieceNameEnum
+    piece_id: int
+    orientation_id: int
+    index: int
+    offsets: np.ndarray
+    height: int
+    width: int
+    corner_offsets: np.ndarray
+    edge_offsets: np.ndarray
+    pivots: np.ndarray
+    template: int
+
+    @property
+    def size(self) -> int:
+        """Returns how many cells the orientation occupies
+
+        Returns:
+            int: size of the orientation
+        """
+        return len(self.offsets)
+
+
+class PieceCatalogue:
+    """Frozen catalogue of every orientation of every piece.
+
+    The catalogue is built once from the piece definitions and is immutable afterwards,
+    all arrays are flagged read only. Building it before forking worker processes
+    lets every worker share the same pages read only.
+
+    Orientations are the unique shapes of a piece once normalised to their top left corner.
+    The variants generated by `BasePiece` (the same shapes shifted so a given cell sits on the origin)
+    are kept as (orientation, pivot) pairs so the original variant order is preserved.
+    """
+
+    def __init__(self, packed: dict[str, np.ndarray]):
+        self._packed = {}
+        for key in _PACKED_KEYS:
+            array = np.ascontiguousarray(packed[key])
+            array.setflags(write=False)
+            self._packed[key] = array
+
+        self._orientations = self._build_orientations()
+        self._orientations_by_piece: dict[PieceNameEnum, tuple[PieceOrientation, ...]] = {
+            piece_type: tuple(o for o in self._orientations if o.piece_type == piece_type) for piece_type in PIECE_ORDER
+        }
+        self._template_lookup = {(o.piece_id, o.template): o for o in self._orientations}
+        self._orientation_lookup = np.full((len(PIECE_ORDER), 1 << _MOVE_ID_ORIENTATION_BITS), -1, dtype=np.int16)
+        for o in self._orientations:
+            self._orientation_lookup[o.piece_id, o.orientation_id] = o.index
+        self._variants_by_piece = self._build_variants()
+
+    @property
+    def orientations(self) -> tuple[PieceOrientation, ...]:
+        """Returns every orientation of every piece, indexed by the orientation index
+
+        Returns:
+            tuple[PieceOrientation, ...]: all orientations
+        """
+        return self._orientations
+
+    @property
+    def packed(self) -> dict[str, np.ndarray]:
+        """Returns the packed read only arrays backing the catalogue,
+        these are indexed by the global orientation index and are suited to vectorised kernels
+
+        Returns:
+            dict[str, np.ndarray]: packed arrays
+        """
+        return self._packed
+
+    def get_orientations(self, piece_type: PieceNameEnum) -> tuple[PieceOrientation, ...]:
+        """Returns all orientations of the supplied piece
+
+        Args:
+            piece_type (PieceNameEnum): piece to get orientations of
+
+        Returns:
+            tuple[PieceOrientation, ...]: orientations of the piece
+        """
+        return self._orientations_by_piece[piece_type]
+
+    def get_orientation(self, piece_type: PieceNameEnum, orientation_id: int) -> PieceOrientation:
+        """Returns a single orientation of a piece
+
+        Args:
+            piece_type (PieceNameEnum): piece of the orientation
+            orientation_id (int): id of the orientation within the piece
+
+        Returns:
+            PieceOrientation: the orientation
+        """
+        return self._orientations_by_piece[piece_type][orientation_id]
+
+    def get_variants(self, piece_type: PieceNameEnum) -> list[list[list[int]]]:
+        """Returns the variants of a piece as relative idxs,
+        matching the representations generated by `BasePiece`
+
+        Args:
+            piece_type (PieceNameEnum): piece to get variants of
+
+        Returns:
+            list[list[list[int]]]: variants of the piece
+        """
+        return self._variants_by_piece[piece_type]
+
+    def find_orientation(self, piece_type: PieceNameEnum, idxs: list[tuple[int]]) -> tuple[PieceOrientation, tuple[int, int]]:
+        """Finds the orientation and top left position matching a set of board idxs
+
+        Args:
+            piece_type (PieceNameEnum): piece the idxs belong to
+            idxs (list[tuple[int]]): board idxs of the piece
+
+        Raises:
+            ValueError: if the idxs are not a shape of the piece
+
+        Returns:
+            tuple[PieceOrientation, tuple[int, int]]: the orientation and its top left position
+        """
+        top = min(idx[0] for idx in idxs)
+        left = min(idx[1] for idx in idxs)
+        template = 0
+        for row, col in idxs:
+            row, col = row - top, col - left
+            if row >= TEMPLATE_DIMENSION or col >= TEMPLATE_DIMENSION:
+                raise ValueError(f"{idxs} are not a shape of {piece_type}")
+            template |= 1 << (row * TEMPLATE_DIMENSION + col)
+
+        orientation = self._template_lookup.get((PIECE_ORDER.index(piece_type), template))
+        if orientation is None or orientation.size != len(idxs):
+            raise ValueError(f"{idxs} are not a shape of {piece_type}")
+        return orientation, (top, left)
+
+    def decode_move_ids(self, move_ids: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Unpacks a batch of move ids into indexes of the packed arrays
+
+        Args:
+            move_ids (np.ndarray): move ids
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: orientation indexes, top rows, left columns
+        """
+        piece_ids, orientation_ids, rows, cols = decode_move_id(np.asarray(move_ids, dtype=np.int64))
+        return self._orientation_lookup[piece_ids, orientation_ids].astype(np.intp), rows, cols
+
+    def save(self, path: Path):
+        """Saves the packed catalogue to the supplied path
+
+        Args:
+            path (Path): path to save to
+        """
+        with open(path, "wb") as f:
+            np.savez(f, catalogue_version=np.array(CATALOGUE_VERSION), **self._packed)
+
+    @classmethod
+    def load(cls, path: Path) -> "PieceCatalogue":
+        """Loads a catalogue saved via `save`
+
+        Args:
+            path (Path): path to load from
+
+        Raises:
+            ValueError: if the cached catalogue is from a different version
+
+        Returns:
+            PieceCatalogue: loaded catalogue
+        """
+        with np.load(path) as data:
+            version = int(data["catalogue_version"])
+            if version != CATALOGUE_VERSION:
+                raise ValueError(f"cached catalogue is version {version} not {CATALOGUE_VERSION}")
+            packed = {key: data[key] for key in _PACKED_KEYS}
+        return cls(packed)
+
+    @classmethod
+    def build(cls) -> "PieceCatalogue":
+        """Builds the catalogue from the piece definitions
+
+        Returns:
+            PieceCatalogue: built catalogue
+        """
+        return cls(_build_packed_arrays())
+
+    def _build_orientations(self) -> tuple[PieceOrientation, ...]:
+        """Builds the orientation objects as views into the packed arrays
+
+        Returns:
+            tuple[PieceOrientation, ...]: all orientations
+        """
+        packed = self._packed
+        variant_orientations = packed["variant_orientations"]
+
+        orientations = []
+        for index in range(len(packed["orientation_pieces"])):
+            piece_id = int(packed["orientation_pieces"][index])
+            height, width = packed["orientation_dims"][index]
+            orientations.append(
+                PieceOrientation(
+                    piece_type=PIECE_ORDER[piece_id],
+                    piece_id=piece_id,
+                    orientation_id=int(packed["orientation_ids"][index]),
+                    index=index,
+                    offsets=packed["orientation_offsets"][index, : packed["orientation_sizes"][index]],
+                    height=int(height),
+                    width=int(width),
+                    corner_offsets=packed["corner_offsets"][index, : packed["corner_counts"][index]],
+                    edge_offsets=packed["edge_offsets"][index, : packed["edge_counts"][index]],
+                    pivots=packed["variant_pivots"][variant_orientations == index],
+                    template=int(packed["orientation_templates"][index]),
+                )
+            )
+        return tuple(orientations)
+
+    def _build_variants(self) -> dict[PieceNameEnum, list[list[list[int]]]]:
+        """Rebuilds the `BasePiece` style variants from the (orientation, pivot) pairs
+
+        Returns:
+            dict[PieceNameEnum, list[list[list[int]]]]: variants for each piece
+        """
+        variants = {piece_type: [] for piece_type in PIECE_ORDER}
+        for index, pivot in zip(self._packed["variant_orientations"], self._packed["variant_pivots"]):
+            orientation = self._orientations[index]
+            variants[orientation.piece_type].append((orientation.offsets - pivot).tolist())
+        return variants
+
+
+def _build_packed_arrays() -> dict[str, np.ndarray]:
+    """Builds the packed arrays of the catalogue from the binary representations of the pieces
+
+    Returns:
+        dict[str, np.ndarray]: packed arrays
+    """
+    # imported here as the piece module builds its pieces from the catalogue
+    from blokus.pieces import pieces
+
+    shapes = []
+    variant_orientations = []
+    variant_pivots = []
+    for piece_id, piece_type in enumerate(PIECE_ORDER):
+        binary_repr = np.atleast_2d(np.array(getattr(pieces, f"{piece_type.value}_array")))
+        piece_shapes = []
+        for variant in generate_variants_from_binary_repr(binary_repr):
+            top_left = variant.min(axis=0)
+            offsets = variant - top_left
+            template = _get_template(offsets)
+            if template not in piece_shapes:
+                piece_shapes.append(template)
+                shapes.append((piece_id, len(piece_shapes) - 1, offsets))
+            index = len(shapes) - len(piece_shapes) + piece_shapes.index(template)
+            variant_orientations.append(index)
+            variant_pivots.append(-top_left)
+
+    count = len(shapes)
+    max_corners = 4 * MAX_PIECE_SIZE
+    max_edges = 4 * MAX_PIECE_SIZE
+    packed = {
+        "orientation_pieces": np.zeros(count, dtype=np.uint8),
+        "orientation_ids": np.zeros(count, dtype=np.uint8),
+        "orientation_sizes": np.zeros(count, dtype=np.uint8),
+        "orientation_offsets": np.zeros((count, MAX_PIECE_SIZE, 2), dtype=np.int8),
+        "orientation_dims": np.zeros((count, 2), dtype=np.uint8),
+        "orientation_templates": np.zeros(count, dtype=np.uint32),
+        "corner_counts": np.zeros(count, dtype=np.uint8),
+        "corner_offsets": np.zeros((count, max_corners, 2), dtype=np.int8),
+        "edge_counts": np.zeros(count, dtype=np.uint8),
+        "edge_offsets": np.zeros((count, max_edges, 2), dtype=np.int8),
+        "variant_orientations": np.array(variant_orientations, dtype=np.uint16),
+        "variant_pivots": np.array(variant_pivots, dtype=np.int8).reshape(-1, 2),
+    }
+    for index, (piece_id, orientation_id, offsets) in enumerate(shapes):
+        corners, edges = _get_neighbour_offsets(offsets)
+        packed["orientation_pieces"][index] = piece_id
+        packed["orientation_ids"][index] = orientation_id
+        packed["orientation_sizes"][index] = len(offsets)
+        packed["orientation_offsets"][index, : len(offsets)] = offsets
+        packed["orientation_dims"][index] = offsets.max(axis=0) + 1
+        packed["orientation_templates"][index] = _get_template(offsets)
+        packed["corner_counts"][index] = len(corners)
+        packed["corner_offsets"][index, : len(corners)] = corners
+        packed["edge_counts"][index] = len(edges)
+        packed["edge_offsets"][index, : len(edges)] = edges
+    return packed
+
+
+def generate_variants_from_binary_repr(binary_repr: np.ndarray) -> list[np.ndarray]:
+    """Generates the unique rotations and mirrors of a binary representation
+    as idxs relative to the middle of the representation.
+
+    This follows the same steps, and so the same order, as `BasePiece`
+
+    Args:
+        binary_repr (np.ndarray): 2d binary representation of the piece
+
+    Returns:
+        list[np.ndarray]: relative idxs of every unique variant
+    """
+    # each rotation followed by its mirror, skipping any duplicates
+    variants = []
+    rotation = binary_repr
+    for _ in range(4):
+        for variant in (rotation, np.fliplr(rotation)):
+            if not any(np.array_equal(variant, unique) for unique in variants):
+                variants.append(variant)
+        rotation = np.rot90(rotation)
+
+    return [np.argwhere(variant == 1) - variant.shape[0] // 2 for variant in variants]
+
+
+def _get_template(offsets: np.ndarray) -> int:
+    """Converts normalised offsets into a bitmask over a 5x5 window
+
+    Args:
+        offsets (np.ndarray): offsets normalised to the top left
+
+    Returns:
+        int: bitmask of the offsets
+    """
+    template = 0
+    for row, col in offsets:
+        template |= 1 << int(row * TEMPLATE_DIMENSION + col)
+    return template
+
+
+def _get_neighbour_offsets(offsets: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Finds the corner and edge neighbours of a shape
+
+    Args:
+        offsets (np.ndarray): offsets of the shape
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: corner neighbour offsets, edge neighbour offsets
+    """
+    cells = {tuple(cell) for cell in offsets.tolist()}
+    edges = {(row + d_row, col + d_col) for row, col in cells for d_row, d_col in _ADJACENT_STEPS.tolist()}
+    edges -= cells
+    corners = {(row + d_row, col + d_col) for row, col in cells for d_row, d_col in _DIAGONAL_STEPS.tolist()}
+    corners -= cells | edges
+    return np.array(sorted(corners), dtype=np.int8).reshape(-1, 2), np.array(sorted(edges), dtype=np.int8).reshape(-1, 2)
+
+
+_CATALOGUE: PieceCatalogue = None
+
+
+def get_piece_catalogue(cache_path: Path = None) -> PieceCatalogue:
+    """Returns the shared piece catalogue, building it on first use.
+
+    If a cache path is supplied the catalogue is loaded from it when the cached
+    version matches, otherwise it is built and written to the path.
+
+    Args:
+        cache_path (Path, optional): file to cache the catalogue in. Defaults to None.
+
+    Returns:
+        PieceCatalogue: the shared catalogue
+    """
+    global _CATALOGUE
+    if _CATALOGUE is not None:
+        return _CATALOGUE
+
+    if cache_path is None:
+        _CATALOGUE = PieceCatalogue.build()
+        return _CATALOGUE
+
+    cache_path = Path(cache_path)
+    if cache_path.is_dir():
+        cache_path = cache_path / f"piece_catalogue_v{CATALOGUE_VERSION}.npz"
+    try:
+        _CATALOGUE = PieceCatalogue.load(cache_path)
+    except (OSError, KeyError, ValueError) as e:
+        logging.info(f"rebuilding piece catalogue, unable to use cache {cache_path}: {e}")
+        _CATALOGUE = PieceCatalogue.build()
+        _CATALOGUE.save(cache_path)
+    return _CATALOGUE
+
+
+# move ids pack the piece, orientation and top left position of a move into a single int,
+# this supports boards up to 32x32
+_MOVE_ID_POSITION_BITS = 5
+_MOVE_ID_ORIENTATION_BITS = 3
+_MOVE_ID_POSITION_MASK = (1 << _MOVE_ID_POSITION_BITS) - 1
+_MOVE_ID_ORIENTATION_MASK = (1 << _MOVE_ID_ORIENTATION_BITS) - 1
+# every move id is below this, so it can size tables indexed by move id
+MOVE_ID_COUNT = len(PIECE_ORDER) << (_MOVE_ID_ORIENTATION_BITS + 2 * _MOVE_ID_POSITION_BITS)
+
+
+def encode_move_id(piece_id: int, orientation_id: int, row: int, col: int) -> int:
+    """Packs a placement into a move id
+
+    Args:
+        piece_id (int): id of the piece
+        orientation_id (int): id of the orientation within the piece
+        row (int): top row of the placement
+        col (int): left column of the placement
+
+    Returns:
+        int: move id
+    """
+    move_id = piece_id << _MOVE_ID_ORIENTATION_BITS | orientation_id
+    move_id = move_id << _MOVE_ID_POSITION_BITS | row
+    return move_id << _MOVE_ID_POSITION_BITS | col
+
+
+def decode_move_id(move_id: int) -> tuple[int, int, int, int]:
+    """Unpacks a move id into its placement
+
+    Args:
+        move_id (int): move id
+
+    Returns:
+        tuple[int, int, int, int]: piece id, orientation id, top row, left column
+    """
+    # shifts are not in place so arrays of move ids are left untouched
+    col = move_id & _MOVE_ID_POSITION_MASK
+    move_id = move_id >> _MOVE_ID_POSITION_BITS
+    row = move_id & _MOVE_ID_POSITION_MASK
+    move_id = move_id >> _MOVE_ID_POSITION_BITS
+    orientation_id = move_id & _MOVE_ID_ORIENTATION_MASK
+    return move_id >> _MOVE_ID_ORIENTATION_BITS, orientation_id, row, col
@@ -4,9 +4,12 @@ from dataclasses import dataclass, field
 # Extenral Imports
 # Intenral Imports
 from blokus.pieces.base import BasePiece
+from blokus.pieces.catalogue import PIECE_ORDER
 from blokus.pieces.piece_names import PieceNameEnum
 from blokus.pieces.pieces import *
 
+_PIECE_IDS = {name: piece_id for piece_id, name in enumerate(PIECE_ORDER)}
+
 
 @dataclass
 class PieceSet:
@@ -53,6 +56,31 @@ class PieceSet:
         piece = [p for p in self.pieces if p.name == name][0]
         return piece
 
+    def to_mask(self) -> int:
+        """Returns the pieces in the set as a bitmask,
+        bit n is set if the piece with piece id n is present
+
+        Returns:
+            int: bitmask of the present pieces
+        """
+        mask = 0
+        for piece in self.pieces:
+            mask |= 1 << _PIECE_IDS[piece.name]
+        return mask
+
+    @classmethod
+    def from_mask(cls, mask: int) -> "PieceSet":
+        """Builds a piece set from a bitmask created by `to_mask`
+
+        Args:
+            mask (int): bitmask of the present pieces
+
+        Returns:
+            PieceSet: piece set with the present pieces
+        """
+        full_set = build_full_piece_set()
+        return cls(pieces=[piece for piece in full_set.pieces if mask >> _PIECE_IDS[piece.name] & 1])
+
 
 def build_full_piece_set() -> PieceSet:
     """Builds a full set of pieces
@@ -0,0 +1,256 @@
+# Python Imports
+import asyncio
+import logging
+import threading
+import time
+from urllib.parse import urlparse
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.exceptions import APIPlayerError
+from blokus.move import Move
+from blokus.player.api_protocol import NO_MOVE, build_http_message, decode_response, encode_request, read_http_message
+from blokus.player.base_player import BasePlayer
+
+# errors that mean the connection is unusable and the request can be retried
+_RETRYABLE_ERRORS = (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, APIPlayerError)
+
+
+class ConnectionPool:
+    """Pool of persistent keep-alive connections to a single remote bot.
+
+    Supports tcp addresses `http://host:port/path` and unix sockets `unix:///path/to/socket`.
+    A pool belongs to the event loop it was created in.
+    """
+
+    def __init__(self, address: str, max_size: int = 4):
+        """initialiser for the pool
+
+        Args:
+            address (str): address of the remote bot
+            max_size (int, optional): max number of open connections. Defaults to 4.
+        """
+        parsed = urlparse(address)
+        if parsed.scheme not in ("http", "unix"):
+            raise ValueError(f"unsupported address scheme {parsed.scheme}, use http or unix")
+
+        self._address = address
+        self._is_unix = parsed.scheme == "unix"
+        self._host = parsed.hostname or "localhost"
+        self._port = parsed.port or 80
+        self._socket_path = parsed.path
+        self._request_path = "/move" if self._is_unix else parsed.path or "/move"
+
+        self._idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._slots = asyncio.Semaphore(max_size)
+
+    @property
+    def request_path(self) -> str:
+        """Returns the path requests are posted to
+
+        Returns:
+            str: request path
+        """
+        return self._request_path
+
+    @property
+    def host(self) -> str:
+        """Returns the host header value of the remote bot
+
+        Returns:
+            str: host
+        """
+        return self._host
+
+    async def request(self, message: bytes) -> tuple[str, dict[str, str], bytes]:
+        """Sends a message on a pooled connection and reads the response.
+        The connection is returned to the pool unless an error occured or the server closes it.
+
+        Args:
+            message (bytes): full HTTP message to send
+
+        Returns:
+            tuple[str, dict[str, str], bytes]: status line, headers and body of the response
+        """
+        async with self._slots:
+            reader, writer = await self._acquire()
+            try:
+                writer.write(message)
+                await writer.drain()
+                response = await read_http_message(reader)
+            except BaseException:
+                # includes cancellation by the request deadline, the connection state is unknown
+                writer.close()
+                raise
+
+            if response[1].get("connection", "").lower() == "close":
+                writer.close()
+            else:
+                self._idle.append((reader, writer))
+            return response
+
+    async def close(self):
+        """Closes all idle connections"""
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    async def _acquire(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Returns an idle connection, opening a new one if none are alive
+
+        Returns:
+            tuple[asyncio.StreamReader, asyncio.StreamWriter]: connection
+        """
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer
+            writer.close()
+
+        if self._is_unix:
+            return await asyncio.open_unix_connection(self._socket_path)
+        return await asyncio.open_connection(self._host, self._port)
+
+
+class APIPlayer(BasePlayer):
+    """Player that asks a remote bot for its moves.
+
+    The position and the legal moves are posted to the remote bot using the compact
+    binary protocol in `api_protocol`, the bot replies with the index of its chosen move.
+    Connections are pooled and kept alive, each request has a deadline and failed requests
+    are retried with exponential backoff. If every attempt fails no move is played.
+
+    `async_select_best_move` can be awaited from any event loop, `select_best_move`
+    runs it on a private event loop thread.
+    """
+
+    def __init__(
+        self,
+        board: Board,
+        colour: BoardStatesEnum,
+        address: str,
+        deadline: float = 30,
+        retries: int = 3,
+        backoff: float = 0.05,
+        pool_size: int = 4,
+    ):
+        """initialiser for the api player
+
+        Args:
+            board (Board): board the game is being played on
+            colour (BoardStatesEnum): colour of the player
+            address (str): address of the remote bot, `http://host:port/path` or `unix:///path`
+            deadline (float, optional): max seconds for a single request. Defaults to 30.
+            retries (int, optional): number of retries after a failed request. Defaults to 3.
+            backoff (float, optional): seconds to wait before the first retry,
+                                       doubled for every following retry. Defaults to 0.05.
+            pool_size (int, optional): max number of open connections. Defaults to 4.
+        """
+        super().__init__(board, colour)
+        self.address = address
+        self.deadline = deadline
+        self.retries = retries
+        self.backoff = backoff
+        self.pool_size = pool_size
+
+        self._pools: dict[asyncio.AbstractEventLoop, ConnectionPool] = {}
+        self._loop: asyncio.AbstractEventLoop = None
+        self._loop_lock = threading.Lock()
+        self._round_trip_times: list[float] = []
+
+    @property
+    def round_trip_times(self) -> list[float]:
+        """Returns the seconds taken by each successful request, including encoding
+
+        Returns:
+            list[float]: round trip times
+        """
+        return self._round_trip_times
+
+    def select_best_move(self, moves: list[Move]) -> Move:
+        """Asks the remote bot for its move
+
+        Args:
+            moves (list[Move]): moves to select from
+
+        Returns:
+            Move: move selected by the remote bot, None if it could not be reached
+        """
+        future = asyncio.run_coroutine_threadsafe(self.async_select_best_move(moves), self._get_loop())
+        return future.result()
+
+    async def async_select_best_move(self, moves: list[Move]) -> Move:
+        """Asks the remote bot for its move
+
+        Args:
+            moves (list[Move]): moves to select from
+
+        Returns:
+            Move: move selected by the remote bot, None if it could not be reached
+        """
+        start = time.perf_counter()
+        pool = self._get_pool()
+        body = encode_request(self.board, self.colour, moves)
+        message = build_http_message(f"POST {pool.request_path} HTTP/1.1", body, {"Host": pool.host})
+
+        for attempt in range(self.retries + 1):
+            if attempt:
+                await asyncio.sleep(self.backoff * 2 ** (attempt - 1))
+            try:
+                status_line, _, response_body = await asyncio.wait_for(pool.request(message), self.deadline)
+                if status_line.split(" ")[1:2] != ["200"]:
+                    raise APIPlayerError(f"remote bot replied with {status_line}")
+                move_idx = decode_response(response_body, len(moves))
+            except _RETRYABLE_ERRORS as e:
+                logging.warning(f"request {attempt + 1} to {self.address} for {self.colour} failed: {e!r}")
+                continue
+
+            self._round_trip_times.append(time.perf_counter() - start)
+            if move_idx == NO_MOVE:
+                return None
+            return moves[move_idx]
+
+        logging.error(f"unable to get a move for {self.colour} from {self.address}")
+        return None
+
+    async def async_close(self):
+        """Closes the pooled connections of the running event loop"""
+        pool = self._pools.pop(asyncio.get_running_loop(), None)
+        if pool is not None:
+            await pool.close()
+
+    def close(self):
+        """Closes the pooled connections and stops the private event loop thread"""
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.async_close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop = None
+
+    def _get_pool(self) -> ConnectionPool:
+        """Returns the connection pool of the running event loop
+
+        Returns:
+            ConnectionPool: connection pool
+        """
+        loop = asyncio.get_running_loop()
+        if loop not in self._pools:
+            self._pools[loop] = ConnectionPool(self.address, self.pool_size)
+        return self._pools[loop]
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Returns the private event loop, starting its thread on first use
+
+        Returns:
+            asyncio.AbstractEventLoop: private event loop
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name=f"api-player-{self.colour.str_id}", daemon=True).start()
+            return self._loop
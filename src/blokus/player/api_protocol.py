@@ -0,0 +1,204 @@
+"""
+Binary protocol used between the `APIPlayer` and a remote bot.
+
+A request holds the position and the legal moves:
+ - header: protocol version, colour to move, board dimension, number of moves
+ - the board array, one uint8 per cell
+ - the remaining pieces of each player colour as uint32 bitmasks
+ - the legal moves as uint32 move ids, see `Move.move_id`
+
+A response is the uint16 index of the chosen move within the request moves,
+or NO_MOVE if the bot does not want to play.
+"""
+
+# Python Imports
+import asyncio
+import struct
+from dataclasses import dataclass
+
+# External Imports
+import numpy as np
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.exceptions import APIPlayerError
+from blokus.move import Move
+from blokus.pieces.piece_set import PieceSet
+from blokus.valid_moves import get_move_ids
+
+PROTOCOL_VERSION = 1
+CONTENT_TYPE = "application/x-blokus-move"
+NO_MOVE = 0xFFFF
+
+_HEADER = struct.Struct("<BBBH")
+_RESPONSE = struct.Struct("<H")
+_MOVE_DTYPE = np.dtype("<u4")
+_MASK_DTYPE = np.dtype("<u4")
+_COLOURS_BY_ID = {colour.int_id: colour for colour in BoardStatesEnum.get_player_colours()}
+_MAX_HEADER_COUNT = 64
+
+
+@dataclass
+class MoveRequest:
+    """Decoded request sent to a remote bot"""
+
+    colour: BoardStatesEnum
+    board_array: np.ndarray
+    piece_masks: np.ndarray
+    move_ids: np.ndarray
+
+    def build_board(self) -> Board:
+        """Builds a board for the requested position
+
+        Returns:
+            Board: board of the position
+        """
+        piece_sets = {
+            colour: PieceSet.from_mask(int(mask))
+            for colour, mask in zip(BoardStatesEnum.get_player_colours(), self.piece_masks)
+        }
+        return Board(len(self.board_array), self.board_array.astype(int), piece_sets)
+
+    def build_moves(self) -> list[Move]:
+        """Builds the legal moves of the request
+
+        Returns:
+            list[Move]: legal moves
+        """
+        return [Move.from_move_id(self.colour, move_id) for move_id in self.move_ids.tolist()]
+
+
+def encode_request(board: Board, colour: BoardStatesEnum, moves: list[Move]) -> bytes:
+    """Encodes a position and its legal moves into a request body
+
+    Args:
+        board (Board): board of the position
+        colour (BoardStatesEnum): colour to move
+        moves (list[Move]): legal moves of the colour
+
+    Returns:
+        bytes: request body
+    """
+    header = _HEADER.pack(PROTOCOL_VERSION, colour.int_id, board.dimension, len(moves))
+    masks = np.array([board.piece_sets[c].to_mask() for c in BoardStatesEnum.get_player_colours()], dtype=_MASK_DTYPE)
+    move_ids = get_move_ids(moves).astype(_MOVE_DTYPE)
+    return b"".join([header, board.array.astype(np.uint8).tobytes(), masks.tobytes(), move_ids.tobytes()])
+
+
+def decode_request(body: bytes) -> MoveRequest:
+    """Decodes a request body, the arrays are views onto the body
+
+    Args:
+        body (bytes): request body
+
+    Raises:
+        APIPlayerError: if the body is malformed
+
+    Returns:
+        MoveRequest: decoded request
+    """
+    try:
+        version, colour_id, dimension, move_count = _HEADER.unpack_from(body)
+    except struct.error as e:
+        raise APIPlayerError(f"malformed request header: {e}") from e
+    if version != PROTOCOL_VERSION:
+        raise APIPlayerError(f"unsupported protocol version {version}")
+    if colour_id not in _COLOURS_BY_ID:
+        raise APIPlayerError(f"{colour_id} is not a player colour")
+
+    colour_count = len(BoardStatesEnum.get_player_colours())
+    expected = _HEADER.size + dimension**2 + colour_count * _MASK_DTYPE.itemsize + move_count * _MOVE_DTYPE.itemsize
+    if len(body) != expected:
+        raise APIPlayerError(f"request body is {len(body)} bytes, expected {expected}")
+
+    offset = _HEADER.size
+    board_array = np.frombuffer(body, dtype=np.uint8, count=dimension**2, offset=offset).reshape(dimension, dimension)
+    offset += dimension**2
+    piece_masks = np.frombuffer(body, dtype=_MASK_DTYPE, count=colour_count, offset=offset)
+    offset += colour_count * _MASK_DTYPE.itemsize
+    move_ids = np.frombuffer(body, dtype=_MOVE_DTYPE, count=move_count, offset=offset)
+
+    return MoveRequest(_COLOURS_BY_ID[colour_id], board_array, piece_masks, move_ids)
+
+
+def encode_response(move_idx: int) -> bytes:
+    """Encodes the index of the chosen move
+
+    Args:
+        move_idx (int): index of the chosen move, or NO_MOVE
+
+    Returns:
+        bytes: response body
+    """
+    return _RESPONSE.pack(move_idx)
+
+
+def decode_response(body: bytes, move_count: int) -> int:
+    """Decodes the index of the chosen move
+
+    Args:
+        body (bytes): response body
+        move_count (int): number of moves sent in the request
+
+    Raises:
+        APIPlayerError: if the response is malformed or the index is out of range
+
+    Returns:
+        int: index of the chosen move, or NO_MOVE
+    """
+    if len(body) != _RESPONSE.size:
+        raise APIPlayerError(f"response body is {len(body)} bytes, expected {_RESPONSE.size}")
+    (move_idx,) = _RESPONSE.unpack(body)
+    if move_idx != NO_MOVE and move_idx >= move_count:
+        raise APIPlayerError(f"response move index {move_idx} is out of range for {move_count} moves")
+    return move_idx
+
+
+def build_http_message(start_line: str, body: bytes, headers: dict[str, str] = None) -> bytes:
+    """Builds a HTTP/1.1 message with a binary body, connections are kept alive
+
+    Args:
+        start_line (str): request or status line
+        body (bytes): body of the message
+        headers (dict[str, str], optional): additional headers. Defaults to None.
+
+    Returns:
+        bytes: the message
+    """
+    all_headers = {"Content-Type": CONTENT_TYPE, "Content-Length": str(len(body)), "Connection": "keep-alive"}
+    all_headers.update(headers or {})
+    head = start_line + "\r\n" + "".join(f"{key}: {value}\r\n" for key, value in all_headers.items()) + "\r\n"
+    return head.encode("latin-1") + body
+
+
+async def read_http_message(reader: asyncio.StreamReader) -> tuple[str, dict[str, str], bytes]:
+    """Reads a single HTTP/1.1 message with a Content-Length body
+
+    Args:
+        reader (asyncio.StreamReader): stream to read from
+
+    Raises:
+        asyncio.IncompleteReadError: if the stream closes mid message
+        APIPlayerError: if the message is malformed
+
+    Returns:
+        tuple[str, dict[str, str], bytes]: start line, lower cased headers and body
+    """
+    start_line = (await reader.readuntil(b"\r\n")).decode("latin-1").rstrip()
+    headers = {}
+    for _ in range(_MAX_HEADER_COUNT):
+        line = (await reader.readuntil(b"\r\n")).decode("latin-1").rstrip()
+        if not line:
+            break
+        key, _, value = line.partition(":")
+        headers[key.strip().lower()] = value.strip()
+    else:
+        raise APIPlayerError("too many headers in message")
+
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError as e:
+        raise APIPlayerError(f"invalid content length {headers['content-length']}") from e
+    body = await reader.readexactly(length)
+    return start_line, headers, body
@@ -0,0 +1,109 @@
+# Python Imports
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+# Internal Imports
+from blokus.bots.bot_enums import BotEnum
+from blokus.exceptions import APIPlayerError
+from blokus.player.api_protocol import NO_MOVE, MoveRequest, build_http_message, decode_request, encode_response, read_http_message
+
+
+class BotServer:
+    """Serves a local bot over the `api_protocol` so it can be played by an `APIPlayer`.
+
+    Listens on tcp or a unix socket, connections are kept alive and each request
+    is answered by a fresh bot built for the requested position. The bot runs in a
+    worker thread so slow bots do not block other connections.
+    """
+
+    def __init__(self, bot_enum: BotEnum, max_workers: int = 4):
+        """initialiser for the server
+
+        Args:
+            bot_enum (BotEnum): bot used to select moves
+            max_workers (int, optional): max number of bots running at once. Defaults to 4.
+        """
+        self.bot_enum = bot_enum
+        self.request_count = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._server: asyncio.AbstractServer = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0, socket_path: str = None) -> str:
+        """Starts listening, on the unix socket if a path is supplied otherwise on tcp
+
+        Args:
+            host (str, optional): host to bind to. Defaults to "127.0.0.1".
+            port (int, optional): port to bind to, 0 picks a free port. Defaults to 0.
+            socket_path (str, optional): unix socket to bind to. Defaults to None.
+
+        Returns:
+            str: address to supply to an `APIPlayer`
+        """
+        if socket_path is not None:
+            self._server = await asyncio.start_unix_server(self._handle_connection, socket_path)
+            return f"unix://{socket_path}"
+
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        bound_host, bound_port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{bound_host}:{bound_port}/move"
+
+    async def close(self):
+        """Stops listening and closes all connections"""
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._executor.shutdown(wait=False)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Answers requests on a connection until the client closes it
+
+        Args:
+            reader (asyncio.StreamReader): connection reader
+            writer (asyncio.StreamWriter): connection writer
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            while not reader.at_eof():
+                try:
+                    _, headers, body = await read_http_message(reader)
+                except asyncio.IncompleteReadError:
+                    break
+
+                try:
+                    request = decode_request(body)
+                    move_idx = await loop.run_in_executor(self._executor, self._select_move_idx, request)
+                    response = build_http_message("HTTP/1.1 200 OK", encode_response(move_idx))
+                except APIPlayerError as e:
+                    logging.warning(f"rejected malformed request: {e}")
+                    response = build_http_message("HTTP/1.1 400 Bad Request", b"")
+
+                self.request_count += 1
+                writer.write(response)
+                await writer.drain()
+
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, APIPlayerError) as e:
+            logging.info(f"closing connection: {e!r}")
+        finally:
+            writer.close()
+
+    def _select_move_idx(self, request: MoveRequest) -> int:
+        """Asks the bot to select a move for the request
+
+        Args:
+            request (MoveRequest): decoded request
+
+        Returns:
+            int: index of the selected move, or NO_MOVE
+        """
+        moves = request.build_moves()
+        if not moves:
+            return NO_MOVE
+        bot = self.bot_enum.cls(request.build_board(), request.colour)
+        move = bot.select_best_move(list(moves))
+        if move is None:
+            return NO_MOVE
+        return moves.index(move)
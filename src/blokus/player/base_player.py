@@ -1,8 +1,10 @@
+import copy
 from abc import ABC, abstractmethod
 
 from blokus.board import Board
 from blokus.board_states import BoardStatesEnum
 from blokus.move import Move
+from blokus.player.ponder import Ponderer
 
 
 class BasePlayer(ABC):
@@ -10,6 +12,11 @@ class BasePlayer(ABC):
 
     Each player must specifiy the method `select_best_move`
 
+    Players can opt in to pondering via `enable_pondering`, they then keep
+    working out their next move in the background while the opponents think.
+
+    Players with an `opening_book` play its moves while their position is in the book,
+    players with an `endgame_solver` play its move once the position is small enough to solve.
     """
 
     def __init__(self, board: Board, colour: BoardStatesEnum):
@@ -21,6 +28,9 @@ class BasePlayer(ABC):
         """
         self.board = board
         self.colour = colour
+        self.ponderer: Ponderer = None
+        self.opening_book: "OpeningBook" = None
+        self.endgame_solver: "EndgameSolver" = None
 
     @abstractmethod
     def select_best_move(self, moves: list[Move], board:Board) -> Move:
@@ -33,3 +43,98 @@ class BasePlayer(ABC):
         Returns:
             Move: Move to play
         """
+
+    def get_book_move(self) -> Move:
+        """Looks up the current position in the opening book,
+        this happens before any moves are generated for the turn
+
+        Returns:
+            Move: book move, None if there is no book or the position is not in it
+        """
+        if self.opening_book is None:
+            return None
+        return self.opening_book.lookup(self.board, self.colour)
+
+    def choose_move(self, moves: list[Move]) -> Move:
+        """Chooses the move to play, reusing pondered work if any applies,
+        then solving the endgame if the position is small enough
+        and otherwise selecting the best move
+
+        Args:
+            moves (list[Move]): List of valid moves
+
+        Returns:
+            Move: Move to play
+        """
+        if self.ponderer is not None:
+            pondered_move = self.ponderer.take(moves)
+            if pondered_move is not None:
+                return pondered_move
+        if self.endgame_solver is not None and self.endgame_solver.should_solve(self.board):
+            result = self.endgame_solver.solve(self.board, self.colour)
+            if result.best_move is not None:
+                return result.best_move
+        return self.select_best_move(moves)
+
+    def on_move_played(self, move: Move):
+        """Called after every move played in the game, including the player's own moves
+
+        Args:
+            move (Move): move that was played
+        """
+        if self.ponderer is None:
+            return
+        if move.colour == self.colour:
+            self.ponderer.start(self.board)
+        else:
+            self.ponderer.notify(move)
+
+    def enable_pondering(self, processes: bool = False, **kwargs):
+        """Enables pondering, the player thinks about its next move during the opponents' turns.
+        Players that think in Python should ponder in a worker process, see `Ponderer`
+
+        Args:
+            processes (bool, optional): if to ponder in a worker process, which is sent a copy of the player
+                                        from `copy_for_pondering` as it is now. Defaults to False.
+            **kwargs: settings of the `Ponderer`, such as the max lines to ponder
+        """
+        ponder_position = self.copy_for_pondering(None).ponder_position if processes else self.ponder_position
+        self.ponderer = Ponderer(self.colour, ponder_position, processes=processes, **kwargs)
+
+    def disable_pondering(self):
+        """Disables pondering and stops the background worker"""
+        if self.ponderer is not None:
+            self.ponderer.close()
+        self.ponderer = None
+
+    def ponder_position(self, board: Board) -> Move:
+        """Works out the move the player would play in a pondered position.
+        This runs on the pondering worker with its own board, by default
+        a copy of the player from `copy_for_pondering` selects from the position's valid moves.
+
+        Args:
+            board (Board): board of the pondered position
+
+        Returns:
+            Move: move the player would play
+        """
+        moves = board.get_valid_moves_for_colour(self.colour)
+        if not moves:
+            return None
+        return self.copy_for_pondering(board).select_best_move(list(moves))
+
+    def copy_for_pondering(self, board: Board) -> "BasePlayer":
+        """Returns a copy of the player, keeping its configuration, that plays on the supplied board.
+        The copy is used from the pondering worker while the player keeps playing, players that
+        mutate state while selecting moves must override this so the copy has its own
+
+        Args:
+            board (Board): board the copy plays on
+
+        Returns:
+            BasePlayer: copy of the player
+        """
+        player = copy.copy(self)
+        player.board = board
+        player.ponderer = None
+        return player
@@ -2,6 +2,7 @@
 from blokus.board import Board
 from blokus.board_states import BoardStatesEnum
 from blokus.bots.bot_enums import BotEnum
+from blokus.player.api_player import APIPlayer
 from blokus.player.local_player import LocalPlayer
 
 
@@ -19,3 +20,18 @@ class PlayerFactory:
             LocalPlayer: local player
         """
         return bot_enum.cls(board, colour)
+
+    @staticmethod
+    def build_api_player(board: Board, colour: BoardStatesEnum, address: str, **kwargs) -> APIPlayer:
+        """Builds a player that gets its moves from a remote bot
+
+        Args:
+            board (Board): board to link to player
+            colour (BoardStatesEnum): colour of player
+            address (str): address of the remote bot
+            **kwargs: additional settings of the APIPlayer, such as the deadline and retries
+
+        Returns:
+            APIPlayer: api player
+        """
+        return APIPlayer(board, colour, address, **kwargs)
@@ -0,0 +1,266 @@
+# Python Imports
+import logging
+import random
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_arena import BoardArena
+from blokus.board_states import BoardStatesEnum
+from blokus.exceptions import InvalidMove
+from blokus.move import Move
+
+
+# state of a pondering worker process, set by `_init_worker`
+_WORKER_ARENA: BoardArena = None
+_WORKER_PONDER_POSITION: Callable[[Board], Move] = None
+
+
+def predict_biggest_move(moves: list[Move], rng: random.Random) -> Move:
+    """Default reply predictor, assumes opponents play one of their biggest pieces
+
+    Args:
+        moves (list[Move]): valid moves of the opponent
+        rng (random.Random): random generator of the ponderer
+
+    Returns:
+        Move: predicted move
+    """
+    biggest_size = max(len(move.idxs) for move in moves)
+    return rng.choice([move for move in moves if len(move.idxs) == biggest_size])
+
+
+def _init_worker(arena_name: str, ponder_position: Callable[[Board], Move]):
+    """Initialiser of a pondering worker process, attaches to the arena of the ponderer
+
+    Args:
+        arena_name (str): name of the arena positions are published to
+        ponder_position (Callable[[Board], Move]): works out the player's move for a position
+    """
+    global _WORKER_ARENA, _WORKER_PONDER_POSITION
+    _WORKER_ARENA = BoardArena.attach(arena_name)
+    _WORKER_PONDER_POSITION = ponder_position
+
+
+def _ponder_slot(slot: int) -> Move:
+    """Works out the player's move for the position published to a slot of the arena
+
+    Args:
+        slot (int): slot of the position
+
+    Returns:
+        Move: move the player would play
+    """
+    board, _, _ = _WORKER_ARENA.read_board(slot)
+    return _WORKER_PONDER_POSITION(board)
+
+
+class Ponderer:
+    """Thinks about the next move of a player while its opponents are thinking.
+
+    After the player moves, a background worker predicts lines of opponent replies and
+    works out the player's move for the position each line leads to. Every move the
+    opponents actually play prunes the lines that no longer apply, when the player's turn
+    arrives the work of the line matching the actual replies is reused.
+
+    The worker operates on its own copy of the board so the game is never touched, and predicts replies
+    with its own random generator so the predictions never draw from the game's `random`.
+
+    By default the worker is a thread, which only adds thinking time when the player releases the GIL
+    while thinking, such as a remote player waiting on its server. A player that thinks in Python, like
+    the local bots, holds the GIL and would only slow the game down, and one that draws from `random`
+    while thinking would draw from it at timing dependent points, so it should ponder with `processes`.
+    The positions are then worked out by a worker process, they are published to a single slot
+    `BoardArena` and `ponder_position` is sent to the process once, so it must be picklable.
+    """
+
+    def __init__(
+        self,
+        colour: BoardStatesEnum,
+        ponder_position: Callable[[Board], Move],
+        max_lines: int = 8,
+        predictor: Callable[[list[Move], random.Random], Move] = predict_biggest_move,
+        processes: bool = False,
+        seed: int = None,
+    ):
+        """initialiser for the ponderer
+
+        Args:
+            colour (BoardStatesEnum): colour of the player
+            ponder_position (Callable[[Board], Move]): works out the player's move for a position
+            max_lines (int, optional): max lines of replies to ponder per turn. Defaults to 8.
+            predictor (Callable[[list[Move], random.Random], Move], optional): predicts an opponent's reply from its
+                                                                               valid moves. Defaults to predict_biggest_move.
+            processes (bool, optional): if to work out positions in a worker process. Defaults to False.
+            seed (int, optional): seed of the random generator of the predictions. Defaults to None.
+        """
+        self.colour = colour
+        self.max_lines = max_lines
+        self.processes = processes
+        self._ponder_position = ponder_position
+        self._predictor = predictor
+        self._rng = random.Random(seed)
+        # created on the first start, once the dimension of the board is known
+        self._arena: BoardArena = None
+        self._process_executor: ProcessPoolExecutor = None
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"ponder-{colour.str_id}")
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._actual_replies: list[Move] = []
+        self._results: dict[tuple[Move, ...], Move] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def start(self, board: Board):
+        """Starts pondering on the position after the player's move,
+        this must be called from the thread that owns the board
+
+        Args:
+            board (Board): board after the player's move
+        """
+        with self._lock:
+            self._generation += 1
+            self._actual_replies = []
+            self._results = {}
+            generation = self._generation
+        if self.processes and self._arena is None:
+            self._arena = BoardArena.create(1, board.dimension)
+            self._process_executor = ProcessPoolExecutor(
+                max_workers=1, initializer=_init_worker, initargs=(self._arena.name, self._ponder_position)
+            )
+        self._executor.submit(self._ponder, board.copy(), generation)
+
+    def notify(self, move: Move):
+        """Records a reply actually played by an opponent, pruning lines that no longer apply
+
+        Args:
+            move (Move): move played by an opponent
+        """
+        with self._lock:
+            self._actual_replies.append(move)
+            depth = len(self._actual_replies)
+            actual = tuple(self._actual_replies)
+            self._results = {line: result for line, result in self._results.items() if line[:depth] == actual}
+
+    def take(self, moves: list[Move]) -> Move:
+        """Stops pondering and returns the pondered move for the actual position,
+        if one was found and it is still valid
+
+        Args:
+            moves (list[Move]): valid moves of the player
+
+        Returns:
+            Move: pondered move, None if no pondered work applies
+        """
+        with self._lock:
+            # stale generations are discarded by the worker
+            self._generation += 1
+            result = self._results.get(tuple(self._actual_replies))
+            self._results = {}
+
+        if result is not None and result in moves:
+            self.hits += 1
+            return result
+        self.misses += 1
+        return None
+
+    def close(self):
+        """Stops the background workers"""
+        with self._lock:
+            self._generation += 1
+        # the arena is released from the worker thread once it is done with it
+        self._executor.submit(self._close_processes)
+        self._executor.shutdown(wait=False)
+
+    def _close_processes(self):
+        """Shuts down the worker process and releases the arena, if pondering used them"""
+        if self._process_executor is not None:
+            self._process_executor.shutdown(cancel_futures=True)
+            self._arena.close()
+            self._arena.unlink()
+            self._process_executor = None
+            self._arena = None
+
+    def _ponder_line(self, board: Board) -> Move:
+        """Works out the player's move for the position a line leads to,
+        in the worker process if pondering uses one
+
+        Args:
+            board (Board): board of the position, owned by the worker thread
+
+        Returns:
+            Move: move the player would play
+        """
+        if not self.processes:
+            return self._ponder_position(board)
+        # the thread waits on the process, so the slot only ever has one position being worked on
+        self._arena.publish(0, board, self.colour)
+        return self._process_executor.submit(_ponder_slot, 0).result()
+
+    def _ponder(self, board: Board, generation: int):
+        """Worker loop, ponders lines of replies until the budget is used or the turn arrives
+
+        Args:
+            board (Board): copy of the board after the player's move, owned by the worker
+            generation (int): generation of this pondering run
+        """
+        applied = 0
+        try:
+            for _ in range(self.max_lines):
+                with self._lock:
+                    if generation != self._generation:
+                        return
+                    actual = list(self._actual_replies)
+
+                # catch the board up with the replies actually played
+                for move in actual[applied:]:
+                    board.play_move(move)
+                applied = len(actual)
+
+                line_board = board.copy()
+                line = tuple(actual) + self._predict_line(line_board, actual)
+                with self._lock:
+                    if line in self._results:
+                        continue
+
+                result = self._ponder_line(line_board)
+
+                with self._lock:
+                    if generation != self._generation or line[: len(self._actual_replies)] != tuple(self._actual_replies):
+                        continue
+                    self._results[line] = result
+        except InvalidMove as e:
+            logging.warning(f"stopped pondering for {self.colour}: {e}")
+        except Exception:
+            # the worker runs in an executor, so anything not logged here would be lost in its future
+            logging.exception(f"pondering failed for {self.colour}")
+
+    def _predict_line(self, board: Board, actual: list[Move]) -> tuple[Move, ...]:
+        """Predicts and plays the replies of the opponents yet to move before the player
+
+        Args:
+            board (Board): board to play the predictions on
+            actual (list[Move]): replies already played
+
+        Returns:
+            tuple[Move, ...]: predicted replies
+        """
+        colours = BoardStatesEnum.get_player_colours()
+        own_idx = colours.index(self.colour)
+        opponents = [colours[(own_idx + offset) % len(colours)] for offset in range(1, len(colours))]
+        if actual:
+            opponents = opponents[opponents.index(actual[-1].colour) + 1 :]
+
+        predicted = []
+        for opponent in opponents:
+            moves = board.get_valid_moves_for_colour(opponent)
+            if not moves:
+                continue
+            move = self._predictor(moves, self._rng)
+            board.play_move(move)
+            predicted.append(move)
+        return tuple(predicted)
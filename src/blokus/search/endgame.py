@@ -0,0 +1,171 @@
+# Python Imports
+import logging
+import time
+from dataclasses import dataclass
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.move import Move
+
+
+class _BudgetExceeded(Exception):
+    "The node or time budget of the solver ran out"
+
+
+@dataclass
+class SolverResult:
+    """Result of an endgame solve.
+
+    If the solve finished within its budget the result is exact and the move is provably
+    best for the side to move under max^n, otherwise the move is the best among the root moves
+    that were fully searched (None if none were).
+    """
+
+    best_move: Move
+    scores: dict[BoardStatesEnum, int]
+    exact: bool
+    nodes: int
+    elapsed: float
+
+    @property
+    def nodes_per_second(self) -> float:
+        """Returns the search speed of the solve
+
+        Returns:
+            float: nodes per second
+        """
+        return self.nodes / self.elapsed if self.elapsed else 0.0
+
+
+class EndgameSolver:
+    """Exact solver for low mobility endgames.
+
+    Searches the rest of the game with max^n, every colour maximises its own final score,
+    which is the number of cells it covers. Colours without moves pass and the game ends once
+    no colour can move. Values are memoised on the position, moves are made and unmade on the board.
+    """
+
+    def __init__(self, max_total_moves: int = 30, node_budget: int = 200_000, time_budget: float = 5.0):
+        """initialiser for the solver
+
+        Args:
+            max_total_moves (int, optional): solve once the legal moves across all colours
+                                             are at most this. Defaults to 30.
+            node_budget (int, optional): max nodes to search. Defaults to 200_000.
+            time_budget (float, optional): max seconds to search. Defaults to 5.0.
+        """
+        self.max_total_moves = max_total_moves
+        self.node_budget = node_budget
+        self.time_budget = time_budget
+
+        self._colours = BoardStatesEnum.get_player_colours()
+        self._memo: dict[tuple, tuple[int, ...]] = {}
+        self._nodes = 0
+        self._deadline = 0.0
+
+    def should_solve(self, board: Board) -> bool:
+        """Checks if the position has few enough legal moves to be solved
+
+        Args:
+            board (Board): board of the position
+
+        Returns:
+            bool: if the position should be solved
+        """
+        total_moves = 0
+        for colour in self._colours:
+            total_moves += len(board.get_valid_moves_for_colour(colour))
+            if total_moves > self.max_total_moves:
+                return False
+        return True
+
+    def solve(self, board: Board, colour: BoardStatesEnum) -> SolverResult:
+        """Solves the position for the colour to move,
+        the board is restored to its original state afterwards
+
+        Args:
+            board (Board): board of the position
+            colour (BoardStatesEnum): colour to move
+
+        Returns:
+            SolverResult: result of the solve
+        """
+        start = time.perf_counter()
+        self._deadline = start + self.time_budget
+        self._nodes = 0
+        self._memo = {}
+
+        side = self._colours.index(colour)
+        best_move, best_value, exact = None, None, True
+        try:
+            for move in list(board.get_valid_moves_for_colour(colour)):
+                board.push_move(move)
+                try:
+                    value = self._search(board, (side + 1) % len(self._colours), 0)
+                finally:
+                    board.pop_move()
+                if best_value is None or value[side] > best_value[side]:
+                    best_move, best_value = move, value
+        except _BudgetExceeded:
+            exact = False
+
+        elapsed = time.perf_counter() - start
+        scores = dict(zip(self._colours, best_value)) if best_value is not None else {}
+        result = SolverResult(best_move, scores, exact, self._nodes, elapsed)
+        logging.info(f"endgame solve for {colour}: exact={exact} nodes={self._nodes} nps={result.nodes_per_second:.0f}")
+        return result
+
+    def _search(self, board: Board, side: int, passes: int) -> tuple[int, ...]:
+        """Returns the final scores of the position under max^n
+
+        Args:
+            board (Board): board of the position
+            side (int): index of the colour to move
+            passes (int): number of colours in a row that were unable to move
+
+        Returns:
+            tuple[int, ...]: final score of each colour
+        """
+        self._nodes += 1
+        if self._nodes > self.node_budget or (self._nodes & 1023 == 0 and time.perf_counter() > self._deadline):
+            raise _BudgetExceeded()
+
+        if passes == len(self._colours):
+            return tuple(int(board.get_score_for_colour(colour)) for colour in self._colours)
+
+        key = self._get_position_key(board, side)
+        if key in self._memo:
+            return self._memo[key]
+
+        colour = self._colours[side]
+        next_side = (side + 1) % len(self._colours)
+        moves = list(board.get_valid_moves_for_colour(colour))
+        if not moves:
+            value = self._search(board, next_side, passes + 1)
+        else:
+            value = None
+            for move in moves:
+                board.push_move(move)
+                try:
+                    child_value = self._search(board, next_side, 0)
+                finally:
+                    board.pop_move()
+                if value is None or child_value[side] > value[side]:
+                    value = child_value
+
+        self._memo[key] = value
+        return value
+
+    def _get_position_key(self, board: Board, side: int) -> tuple:
+        """Returns the memo key of the position
+
+        Args:
+            board (Board): board of the position
+            side (int): index of the colour to move
+
+        Returns:
+            tuple: memo key
+        """
+        masks = tuple(board.piece_sets[colour].to_mask() for colour in self._colours)
+        return board.array.tobytes(), side, masks
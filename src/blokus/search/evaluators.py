@@ -0,0 +1,106 @@
+# Python Imports
+from abc import ABC, abstractmethod
+
+# External Imports
+import numpy as np
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.territory import Territory
+
+
+class BaseEvaluator(ABC):
+    """Abstract base class for static evaluators used by search.
+
+    Each evaluator must specify `evaluate`, which scores the position from the
+    point of view of a colour, higher is better for that colour.
+    """
+
+    @abstractmethod
+    def evaluate(self, board: Board, colour: BoardStatesEnum) -> float:
+        """Scores the position for the supplied colour
+
+        Args:
+            board (Board): board of the position
+            colour (BoardStatesEnum): colour to score for
+
+        Returns:
+            float: score of the position
+        """
+
+    def evaluate_all(self, board: Board) -> tuple[float, ...]:
+        """Scores the position for every player colour, used by max^n search
+
+        Args:
+            board (Board): board of the position
+
+        Returns:
+            tuple[float, ...]: score for each colour in the order of `get_player_colours`
+        """
+        return tuple(self.evaluate(board, colour) for colour in BoardStatesEnum.get_player_colours())
+
+
+class ScoreEvaluator(BaseEvaluator):
+    """Scores the cells the colour covers minus the mean covered by its opponents"""
+
+    def evaluate(self, board: Board, colour: BoardStatesEnum) -> float:
+        counts = np.bincount(board.array.ravel(), minlength=len(BoardStatesEnum))
+        opponents = [c.int_id for c in BoardStatesEnum.get_player_colours() if c != colour]
+        return float(counts[colour.int_id] - counts[opponents].mean())
+
+
+class MobilityEvaluator(BaseEvaluator):
+    """Scores the valid moves of the colour minus the mean valid moves of its opponents"""
+
+    def evaluate(self, board: Board, colour: BoardStatesEnum) -> float:
+        move_counts = {c: len(board.get_valid_moves_for_colour(c)) for c in BoardStatesEnum.get_player_colours()}
+        opponent_counts = [count for c, count in move_counts.items() if c != colour]
+        return float(move_counts[colour] - sum(opponent_counts) / len(opponent_counts))
+
+
+class TerritoryEvaluator(BaseEvaluator):
+    """Scores the cells only the colour can still reach minus the mean of its opponents.
+    The territory of the last board evaluated is kept and updated incrementally,
+    which suits search making and unmaking moves on a single board
+    """
+
+    def __init__(self):
+        self._board: Board = None
+        self._territory: Territory = None
+
+    def evaluate(self, board: Board, colour: BoardStatesEnum) -> float:
+        counts = self._get_exclusive_counts(board)
+        side = BoardStatesEnum.get_player_colours().index(colour)
+        return float(counts[side] - (counts.sum() - counts[side]) / (len(counts) - 1))
+
+    def _get_exclusive_counts(self, board: Board) -> np.ndarray:
+        if board is not self._board:
+            self._board, self._territory = board, Territory(board)
+        else:
+            self._territory.update(board)
+        return self._territory.get_exclusive_counts()
+
+
+class WeightedEvaluator(BaseEvaluator):
+    """Weighted sum of other evaluators"""
+
+    def __init__(self, weighted_evaluators: list[tuple[BaseEvaluator, float]]):
+        """initialiser for the evaluator
+
+        Args:
+            weighted_evaluators (list[tuple[BaseEvaluator, float]]): evaluators and their weights
+        """
+        self.weighted_evaluators = weighted_evaluators
+
+    def evaluate(self, board: Board, colour: BoardStatesEnum) -> float:
+        return sum(weight * evaluator.evaluate(board, colour) for evaluator, weight in self.weighted_evaluators)
+
+
+def build_default_evaluator() -> BaseEvaluator:
+    """Builds the evaluator used when none is supplied, mostly score with some mobility
+
+    Returns:
+        BaseEvaluator: default evaluator
+    """
+    return WeightedEvaluator([(ScoreEvaluator(), 1.0), (MobilityEvaluator(), 0.05)])
@@ -0,0 +1,210 @@
+# Python Imports
+from dataclasses import dataclass
+
+# External Imports
+import numpy as np
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.move import Move
+from blokus.pieces.catalogue import MOVE_ID_COUNT, PIECE_ORDER, decode_move_id, get_piece_catalogue
+from blokus.valid_moves import ValidMoves, get_move_ids
+
+# bonuses are large enough to always sort hinted moves before the rest
+TT_MOVE_BONUS = 1e9
+KILLER_BONUS = 1e8
+
+
+@dataclass
+class TranspositionEntry:
+    """Stored result of searching a position"""
+
+    depth: int
+    value: float
+    # 0 exact, -1 upper bound, 1 lower bound
+    bound: int
+    best_move: Move
+
+
+class TranspositionTable:
+    """Bounded table of searched positions keyed by the position and the colour to move.
+    When full half of the entries are dropped, the shallowest and then the oldest first.
+    """
+
+    EXACT = 0
+    UPPER_BOUND = -1
+    LOWER_BOUND = 1
+
+    def __init__(self, max_entries: int = 200_000):
+        """initialiser for the table
+
+        Args:
+            max_entries (int, optional): max positions to store. Defaults to 200_000.
+        """
+        self.max_entries = max_entries
+        self._entries: dict[tuple, TranspositionEntry] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def get_key(board: Board, side: int) -> tuple:
+        """Returns the key of a position
+
+        Args:
+            board (Board): board of the position
+            side (int): index of the colour to move
+
+        Returns:
+            tuple: key of the position
+        """
+        masks = tuple(board.piece_sets[colour].to_mask() for colour in BoardStatesEnum.get_player_colours())
+        return board.array.tobytes(), side, masks
+
+    def probe(self, key: tuple) -> TranspositionEntry:
+        """Returns the entry of a position
+
+        Args:
+            key (tuple): key of the position
+
+        Returns:
+            TranspositionEntry: entry, None if the position was not stored
+        """
+        return self._entries.get(key)
+
+    def store(self, key: tuple, depth: int, value: float, bound: int, best_move: Move):
+        """Stores the result of a search, keeping the deeper result if one is already stored
+
+        Args:
+            key (tuple): key of the position
+            depth (int): depth searched
+            value (float): value found
+            bound (int): if the value is exact or a bound
+            best_move (Move): best move found
+        """
+        existing = self._entries.get(key)
+        if existing is not None and existing.depth > depth:
+            return
+        if existing is None and len(self._entries) >= self.max_entries:
+            self._evict()
+        self._entries[key] = TranspositionEntry(depth, value, bound, best_move)
+
+    def clear(self):
+        """Removes all entries"""
+        self._entries.clear()
+
+    def _evict(self):
+        """Drops half of the entries, the shallowest first and the oldest of equal depth"""
+        # the dict keeps insertion order, so the index of an entry is its age
+        ranked = sorted(enumerate(self._entries.items()), key=lambda item: (item[1][1].depth, item[0]))
+        self._entries = dict(item for _, item in sorted(ranked[len(ranked) // 2 :]))
+
+
+class MoveOrderer:
+    """Orders moves so search tries the most promising first.
+
+    Scores every move of a batch at once from:
+     - the best move stored in the transposition table for the position
+     - killer moves, moves that caused a cutoff at the same ply elsewhere in the tree
+     - history scores keyed by (colour, piece, orientation, placement), credited on cutoffs
+     - a prior preferring big pieces
+
+    History and killers age between turns so stale information fades.
+    """
+
+    def __init__(self, max_ply: int = 64, killer_slots: int = 2, size_weight: float = 1.0, history_weight: float = 1.0):
+        """initialiser for the orderer
+
+        Args:
+            max_ply (int, optional): max ply from the root that killers are kept for. Defaults to 64.
+            killer_slots (int, optional): killer moves kept per ply. Defaults to 2.
+            size_weight (float, optional): weight of the piece size prior. Defaults to 1.0.
+            history_weight (float, optional): weight of the normalised history score. Defaults to 1.0.
+        """
+        self.max_ply = max_ply
+        self.killer_slots = killer_slots
+        self.size_weight = size_weight
+        self.history_weight = history_weight
+
+        colour_count = len(BoardStatesEnum.get_player_colours())
+        self._colour_idxs = {colour: idx for idx, colour in enumerate(BoardStatesEnum.get_player_colours())}
+        self._history = np.zeros((colour_count, MOVE_ID_COUNT), dtype=np.float32)
+        self._killers: list[list[int]] = [[] for _ in range(max_ply)]
+
+        catalogue = get_piece_catalogue()
+        self._piece_sizes = np.array([catalogue.get_orientations(piece)[0].size for piece in PIECE_ORDER], dtype=np.float32)
+
+    def order(self, moves: list[Move] | ValidMoves, colour: BoardStatesEnum, ply: int = 0, tt_move: Move = None) -> list[Move] | ValidMoves:
+        """Returns the moves from most to least promising
+
+        Args:
+            moves (list[Move] | ValidMoves): moves to order, all of the supplied colour
+            colour (BoardStatesEnum): colour of the moves
+            ply (int, optional): ply from the root of the search. Defaults to 0.
+            tt_move (Move, optional): best move stored for the position. Defaults to None.
+
+        Returns:
+            list[Move] | ValidMoves: ordered moves, as a view if valid moves of a board were supplied
+        """
+        if len(moves) < 2:
+            return list(moves)
+        scores = self.score_moves(moves, colour, ply, tt_move)
+        order = np.argsort(-scores, kind="stable")
+        # valid moves are reordered as a view so moves cut off are never built
+        if isinstance(moves, ValidMoves):
+            return moves[order]
+        return [moves[idx] for idx in order]
+
+    def score_moves(self, moves: list[Move], colour: BoardStatesEnum, ply: int = 0, tt_move: Move = None) -> np.ndarray:
+        """Scores a batch of moves, higher is more promising
+
+        Args:
+            moves (list[Move]): moves to score, all of the supplied colour
+            colour (BoardStatesEnum): colour of the moves
+            ply (int, optional): ply from the root of the search. Defaults to 0.
+            tt_move (Move, optional): best move stored for the position. Defaults to None.
+
+        Returns:
+            np.ndarray: score of each move
+        """
+        move_ids = get_move_ids(moves)
+        piece_ids = decode_move_id(move_ids)[0]
+
+        history = self._history[self._colour_idxs[colour], move_ids]
+        max_history = history.max()
+        if max_history > 0:
+            history = history / max_history
+
+        scores = self.size_weight * self._piece_sizes[piece_ids] + self.history_weight * history
+        if ply < self.max_ply and self._killers[ply]:
+            scores[np.isin(move_ids, self._killers[ply])] += KILLER_BONUS
+        if tt_move is not None:
+            scores[move_ids == tt_move.move_id] += TT_MOVE_BONUS
+        return scores
+
+    def record_cutoff(self, move: Move, depth: int, ply: int):
+        """Credits a move that caused a cutoff
+
+        Args:
+            move (Move): move that caused the cutoff
+            depth (int): plies left to search below the move's position
+            ply (int): ply from the root of the search
+        """
+        self._history[self._colour_idxs[move.colour], move.move_id] += depth * depth
+        if ply >= self.max_ply:
+            return
+        killers = self._killers[ply]
+        if move.move_id in killers:
+            return
+        killers.insert(0, move.move_id)
+        del killers[self.killer_slots :]
+
+    def age(self, factor: float = 0.5):
+        """Ages the tables between turns, history decays and killers are cleared
+
+        Args:
+            factor (float, optional): history decay factor. Defaults to 0.5.
+        """
+        self._history *= factor
+        self._killers = [[] for _ in range(self.max_ply)]
@@ -0,0 +1,301 @@
+# Python Imports
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.move import Move
+from blokus.search.evaluators import BaseEvaluator, build_default_evaluator
+from blokus.search.move_ordering import MoveOrderer, TranspositionTable
+
+
+class _SearchTimeout(Exception):
+    "The time budget of the search ran out"
+
+
+@dataclass
+class SearchResult:
+    """Result of an iterative deepening search, from the deepest completed iteration"""
+
+    best_move: Move
+    value: float
+    depth: int
+    nodes: int
+    elapsed: float
+
+    @property
+    def effective_branching_factor(self) -> float:
+        """Returns the branching factor b such that b ** depth equals the nodes searched
+
+        Returns:
+            float: effective branching factor
+        """
+        if not self.depth:
+            return 0.0
+        return self.nodes ** (1 / self.depth)
+
+
+class BaseMultiplayerSearch(ABC):
+    """Iterative deepening search for the four colour turn order of `get_player_colours`.
+
+    Moves are made and unmade on the board with `push_move`/`pop_move`. Colours without
+    moves pass, and a position where no colour can move is terminal. Each iteration searches
+    one ply deeper, trying the best move of the previous iteration first, until the time budget
+    or max depth is reached. Subclasses must specify how a single depth is searched, `_search_root`.
+
+    Moves are ordered by a `MoveOrderer`, whose tables persist between searches and are aged
+    at the start of each one, and by the best moves stored in a transposition table.
+    """
+
+    def __init__(
+        self,
+        evaluator: BaseEvaluator = None,
+        time_budget: float = 2.0,
+        max_depth: int = 4,
+        move_orderer: MoveOrderer = None,
+        max_table_entries: int = 200_000,
+    ):
+        """initialiser for the search
+
+        Args:
+            evaluator (BaseEvaluator, optional): static evaluator, defaults to `build_default_evaluator`
+            time_budget (float, optional): max seconds to search. Defaults to 2.0.
+            max_depth (int, optional): max plies to search. Defaults to 4.
+            move_orderer (MoveOrderer, optional): orderer of the moves at each node. Defaults to a new `MoveOrderer`.
+            max_table_entries (int, optional): max positions in the transposition table. Defaults to 200_000.
+        """
+        self.evaluator = evaluator or build_default_evaluator()
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.move_orderer = move_orderer or MoveOrderer()
+        self.transposition_table = TranspositionTable(max_table_entries)
+
+        self._colours = BoardStatesEnum.get_player_colours()
+        self._nodes = 0
+        self._deadline = 0.0
+
+    def search(self, board: Board, colour: BoardStatesEnum, moves: list[Move] = None) -> SearchResult:
+        """Searches for the best move of the colour,
+        the board is restored to its original state afterwards
+
+        Args:
+            board (Board): board of the position
+            colour (BoardStatesEnum): colour to move
+            moves (list[Move], optional): root moves, defaults to the valid moves of the colour
+
+        Returns:
+            SearchResult: result of the deepest completed iteration
+        """
+        start = time.perf_counter()
+        self._deadline = start + self.time_budget
+        self._nodes = 0
+        # values in the table are relative to the root colour so do not carry over between searches
+        self.transposition_table.clear()
+        self.move_orderer.age()
+
+        root_moves = self.move_orderer.order(list(moves if moves is not None else board.get_valid_moves_for_colour(colour)), colour)
+        result = SearchResult(root_moves[0] if root_moves else None, 0.0, 0, 0, 0.0)
+
+        for depth in range(1, self.max_depth + 1):
+            try:
+                best_move, value = self._search_root(board, colour, root_moves, depth)
+            except _SearchTimeout:
+                break
+            result = SearchResult(best_move, value, depth, self._nodes, time.perf_counter() - start)
+            # search the best move first on the next iteration
+            root_moves.remove(best_move)
+            root_moves.insert(0, best_move)
+
+        result.nodes = self._nodes
+        result.elapsed = time.perf_counter() - start
+        logging.info(
+            f"{type(self).__name__} for {colour}: depth={result.depth} nodes={result.nodes} "
+            f"ebf={result.effective_branching_factor:.1f} elapsed={result.elapsed:.2f}s"
+        )
+        return result
+
+    @abstractmethod
+    def _search_root(self, board: Board, colour: BoardStatesEnum, moves: list[Move], depth: int) -> tuple[Move, float]:
+        """Searches the root moves to the supplied depth
+
+        Args:
+            board (Board): board of the position
+            colour (BoardStatesEnum): colour to move
+            moves (list[Move]): root moves, in the order to search them
+            depth (int): plies to search
+
+        Returns:
+            tuple[Move, float]: best move and its value for the colour
+        """
+
+    def _count_node(self):
+        """Counts a searched node, stopping the search if the time budget ran out
+
+        Raises:
+            _SearchTimeout: if the time budget ran out
+        """
+        self._nodes += 1
+        if time.perf_counter() > self._deadline:
+            raise _SearchTimeout()
+
+    def _get_moves(self, board: Board, side: int, ply: int, tt_move: Move = None) -> tuple[int, list[Move]]:
+        """Finds the next colour able to move, starting from the supplied side
+
+        Args:
+            board (Board): board of the position
+            side (int): index of the colour whose turn it is
+            ply (int): ply from the root of the search
+            tt_move (Move, optional): best move stored for the position. Defaults to None.
+
+        Returns:
+            tuple[int, list[Move]]: side to move and its ordered moves, no moves if no colour can move
+        """
+        for offset in range(len(self._colours)):
+            next_side = (side + offset) % len(self._colours)
+            colour = self._colours[next_side]
+            moves = board.get_valid_moves_for_colour(colour)
+            if moves:
+                return next_side, self.move_orderer.order(moves, colour, ply, tt_move)
+        return side, []
+
+
+class ParanoidSearch(BaseMultiplayerSearch):
+    """Paranoid alpha-beta search, the opponents are assumed to all play against the root colour,
+    which turns the game into a two player search that alpha-beta can prune.
+    """
+
+    def _search_root(self, board: Board, colour: BoardStatesEnum, moves: list[Move], depth: int) -> tuple[Move, float]:
+        root_side = self._colours.index(colour)
+        alpha, beta = -math.inf, math.inf
+        best_move = moves[0]
+        for move in moves:
+            board.push_move(move)
+            try:
+                value = self._alpha_beta(board, (root_side + 1) % len(self._colours), root_side, depth - 1, 1, alpha, beta)
+            finally:
+                board.pop_move()
+            if value > alpha:
+                alpha, best_move = value, move
+        return best_move, alpha
+
+    def _alpha_beta(self, board: Board, side: int, root_side: int, depth: int, ply: int, alpha: float, beta: float) -> float:
+        """Returns the paranoid value of the position for the root colour
+
+        Args:
+            board (Board): board of the position
+            side (int): index of the colour whose turn it is
+            root_side (int): index of the root colour
+            depth (int): plies left to search
+            ply (int): ply from the root of the search
+            alpha (float): value the root colour is guaranteed
+            beta (float): value the opponents are guaranteed
+
+        Returns:
+            float: value of the position
+        """
+        self._count_node()
+        root_colour = self._colours[root_side]
+        if depth == 0:
+            return self.evaluator.evaluate(board, root_colour)
+
+        key = self.transposition_table.get_key(board, side)
+        entry = self.transposition_table.probe(key)
+        tt_move = None
+        if entry is not None:
+            tt_move = entry.best_move
+            if entry.depth >= depth:
+                if entry.bound == TranspositionTable.EXACT:
+                    return entry.value
+                if entry.bound == TranspositionTable.LOWER_BOUND and entry.value >= beta:
+                    return entry.value
+                if entry.bound == TranspositionTable.UPPER_BOUND and entry.value <= alpha:
+                    return entry.value
+
+        side, moves = self._get_moves(board, side, ply, tt_move)
+        if not moves:
+            return self.evaluator.evaluate(board, root_colour)
+
+        original_alpha, original_beta = alpha, beta
+        next_side = (side + 1) % len(self._colours)
+        maximising = side == root_side
+        best_move = moves[0]
+        for move in moves:
+            board.push_move(move)
+            try:
+                value = self._alpha_beta(board, next_side, root_side, depth - 1, ply + 1, alpha, beta)
+            finally:
+                board.pop_move()
+
+            if maximising and value > alpha:
+                alpha, best_move = value, move
+            elif not maximising and value < beta:
+                beta, best_move = value, move
+            if alpha >= beta:
+                self.move_orderer.record_cutoff(move, depth, ply)
+                break
+
+        value = alpha if maximising else beta
+        if value <= original_alpha:
+            bound = TranspositionTable.UPPER_BOUND
+        elif value >= original_beta:
+            bound = TranspositionTable.LOWER_BOUND
+        else:
+            bound = TranspositionTable.EXACT
+        self.transposition_table.store(key, depth, value, bound, best_move)
+        return value
+
+
+class MaxNSearch(BaseMultiplayerSearch):
+    """Max^n search, every colour maximises its own evaluation.
+    There is no pruning so it reaches shallower depths than paranoid search.
+    """
+
+    def _search_root(self, board: Board, colour: BoardStatesEnum, moves: list[Move], depth: int) -> tuple[Move, float]:
+        root_side = self._colours.index(colour)
+        best_move, best_value = moves[0], None
+        for move in moves:
+            board.push_move(move)
+            try:
+                value = self._max_n(board, (root_side + 1) % len(self._colours), depth - 1, 1)
+            finally:
+                board.pop_move()
+            if best_value is None or value[root_side] > best_value[root_side]:
+                best_move, best_value = move, value
+        return best_move, best_value[root_side]
+
+    def _max_n(self, board: Board, side: int, depth: int, ply: int) -> tuple[float, ...]:
+        """Returns the max^n value of the position
+
+        Args:
+            board (Board): board of the position
+            side (int): index of the colour whose turn it is
+            depth (int): plies left to search
+            ply (int): ply from the root of the search
+
+        Returns:
+            tuple[float, ...]: value for each colour
+        """
+        self._count_node()
+        if depth == 0:
+            return self.evaluator.evaluate_all(board)
+
+        side, moves = self._get_moves(board, side, ply)
+        if not moves:
+            return self.evaluator.evaluate_all(board)
+
+        best_move, best_value = None, None
+        for move in moves:
+            board.push_move(move)
+            try:
+                value = self._max_n(board, (side + 1) % len(self._colours), depth - 1, ply + 1)
+            finally:
+                board.pop_move()
+            if best_value is None or value[side] > best_value[side]:
+                best_move, best_value = move, value
+        # there are no cutoffs, so credit the best move to order the next iteration
+        self.move_orderer.record_cutoff(best_move, depth, ply)
+        return best_value
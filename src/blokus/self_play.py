@@ -0,0 +1,121 @@
+# Python Imports
+import json
+import logging
+import random
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.bots.bot_enums import BotEnum
+from blokus.game import Game
+from blokus.move import Move
+from blokus.player.player_factory import PlayerFactory
+
+
+@dataclass
+class GameRecord:
+    """Record of a finished game.
+
+    Moves are stored in the order they were played as (colour int id, move id) pairs,
+    scores are keyed by the colour str id
+    """
+
+    bots: dict[str, str]
+    moves: list[tuple[int, int]] = field(default_factory=list)
+    scores: dict[str, int] = field(default_factory=dict)
+
+    def get_moves(self) -> list[Move]:
+        """Returns the moves of the game
+
+        Returns:
+            list[Move]: moves in the order they were played
+        """
+        colours = {colour.int_id: colour for colour in BoardStatesEnum.get_player_colours()}
+        return [Move.from_move_id(colours[colour_id], move_id) for colour_id, move_id in self.moves]
+
+
+class SelfPlayRunner:
+    """Plays games between bots to generate game records.
+
+    The bot of each colour is drawn at random from the supplied bots for every game. The
+    runner draws from its own generator, the bots themselves still draw from the random module.
+    """
+
+    def __init__(self, bots: list[BotEnum], seed: int = None):
+        """initialiser for the runner
+
+        Args:
+            bots (list[BotEnum]): bots to play
+            seed (int, optional): seed of the bot draws. Defaults to None.
+        """
+        self.bots = bots
+        self._rng = random.Random(seed)
+
+    def run(self, game_count: int) -> list[GameRecord]:
+        """Plays the supplied number of games
+
+        Args:
+            game_count (int): number of games to play
+
+        Returns:
+            list[GameRecord]: record of each game
+        """
+        records = []
+        for game_idx in range(game_count):
+            records.append(self.play_game())
+            logging.info(f"self play game {game_idx + 1}/{game_count}: {records[-1].scores}")
+        return records
+
+    def play_game(self) -> GameRecord:
+        """Plays a single game
+
+        Returns:
+            GameRecord: record of the game
+        """
+        board = Board()
+        bots = {colour: self._rng.choice(self.bots) for colour in BoardStatesEnum.get_player_colours()}
+        players = [PlayerFactory.build_local_player_from_enum(board, colour, bot) for colour, bot in bots.items()]
+        game = Game(board, players)
+        while not game.is_finished:
+            game.play_turn()
+
+        return GameRecord(
+            bots={colour.str_id: bot.name for colour, bot in bots.items()},
+            moves=[(move.colour.int_id, move.move_id) for move in board.move_list],
+            scores={colour.str_id: int(board.get_score_for_colour(colour)) for colour in bots},
+        )
+
+    @staticmethod
+    def save_records(records: list[GameRecord], path: Path):
+        """Saves records as json lines
+
+        Args:
+            records (list[GameRecord]): records to save
+            path (Path): file to save to
+        """
+        with open(path, "w") as f:
+            for record in records:
+                f.write(json.dumps(asdict(record)) + "\n")
+
+    @staticmethod
+    def load_records(path: Path) -> list[GameRecord]:
+        """Loads records saved via `save_records`
+
+        Args:
+            path (Path): file to load from
+
+        Returns:
+            list[GameRecord]: loaded records
+        """
+        records = []
+        with open(path, "r") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = GameRecord(**json.loads(line))
+                # json has no tuples, the moves come back as lists
+                record.moves = [tuple(move) for move in record.moves]
+                records.append(record)
+        return records
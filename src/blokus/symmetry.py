@@ -0,0 +1,190 @@
+"""
+Symmetries of the square board.
+
+The rules are unchanged by rotating or mirroring the board, so the 8 transforms of the
+dihedral group map a position onto equivalent positions. Transforms are stored as flat
+index permutations, `transformed.flat[i] == array.flat[perm[i]]`.
+
+Colours can also be relabelled as long as the turn order is kept, so positions are relabelled
+relative to the colour to move: it becomes the first player colour and the rest follow in turn order.
+"""
+
+# Python Imports
+import hashlib
+from dataclasses import dataclass
+from functools import lru_cache
+
+# External Imports
+import numpy as np
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.move import Move
+
+TRANSFORM_COUNT = 8
+
+
+@lru_cache(maxsize=None)
+def get_transform_permutations(dimension: int) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the flat index permutations of the 8 board transforms and their inverses
+
+    Args:
+        dimension (int): dimension of the board
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: permutations and inverse permutations, both 8 x dimension**2
+    """
+    grid = np.arange(dimension * dimension).reshape(dimension, dimension)
+    transforms = []
+    for rotation in range(4):
+        rotated = np.rot90(grid, rotation)
+        transforms.append(rotated.ravel())
+        transforms.append(np.fliplr(rotated).ravel())
+
+    permutations = np.stack(transforms).astype(np.intp)
+    inverses = np.argsort(permutations, axis=1).astype(np.intp)
+    permutations.setflags(write=False)
+    inverses.setflags(write=False)
+    return permutations, inverses
+
+
+@lru_cache(maxsize=None)
+def get_relabelling(colour: BoardStatesEnum) -> tuple[np.ndarray, tuple[BoardStatesEnum, ...]]:
+    """Returns the relabelling of the colours relative to the colour to move
+
+    Args:
+        colour (BoardStatesEnum): colour to move
+
+    Returns:
+        tuple[np.ndarray, tuple[BoardStatesEnum, ...]]: lookup of the relabelled int id of each int id,
+                                                        and the colour relabelled as each player colour
+    """
+    player_colours = BoardStatesEnum.get_player_colours()
+    side = player_colours.index(colour)
+    colours = tuple(player_colours[side:] + player_colours[:side])
+    lookup = np.zeros(max(state.int_id for state in BoardStatesEnum) + 1, dtype=np.uint8)
+    for canonical_colour, actual_colour in zip(player_colours, colours):
+        lookup[actual_colour.int_id] = canonical_colour.int_id
+    lookup.setflags(write=False)
+    return lookup, colours
+
+
+@dataclass(frozen=True, eq=False)
+class CanonicalPosition:
+    """Canonical representative of the symmetry class of a position, see `canonicalise`
+
+    - key: 64 bit key shared by every position of the class
+    - transform: id of the transform mapping the board to the canonical array
+    - colours: the colour relabelled as each player colour, the colour to move first
+    - array: canonical uint8 board array, relabelled then transformed
+    - piece_masks: remaining pieces of each relabelled colour, see `PieceSet.to_mask`
+    """
+
+    key: int
+    transform: int
+    colours: tuple[BoardStatesEnum, ...]
+    array: np.ndarray
+    piece_masks: tuple[int, ...]
+
+    def to_canonical_move(self, move: Move) -> Move:
+        """Maps a move on the board into the canonical position
+
+        Args:
+            move (Move): move on the board
+
+        Returns:
+            Move: move in the canonical position
+        """
+        colour = BoardStatesEnum.get_player_colours()[self.colours.index(move.colour)]
+        mapped = transform_move(move, self.transform, len(self.array))
+        return Move(colour, mapped.piece_type, mapped.idxs)
+
+    def from_canonical_move(self, move: Move) -> Move:
+        """Maps a move in the canonical position back onto the board
+
+        Args:
+            move (Move): move in the canonical position
+
+        Returns:
+            Move: move on the board
+        """
+        colour = self.colours[BoardStatesEnum.get_player_colours().index(move.colour)]
+        mapped = transform_move(move, self.transform, len(self.array), inverse=True)
+        return Move(colour, mapped.piece_type, mapped.idxs)
+
+
+def canonicalise(board: Board, colour: BoardStatesEnum) -> CanonicalPosition:
+    """Maps a position, its array, piece sets and colour to move, to the canonical representative
+    of its symmetry class. Colours are relabelled relative to the colour to move with a lookup,
+    then all 8 transforms are applied at once and the smallest array is kept
+
+    Args:
+        board (Board): board of the position
+        colour (BoardStatesEnum): colour to move
+
+    Returns:
+        CanonicalPosition: canonical position, with the transform and relabelling to map moves back
+    """
+    lookup, colours = get_relabelling(colour)
+    relabelled = lookup[board.array]
+    transform, canonical = get_canonical_transform(relabelled)
+    piece_masks = tuple(board.piece_sets[actual_colour].to_mask() for actual_colour in colours)
+
+    digest = hashlib.blake2b(canonical.tobytes(), digest_size=8)
+    digest.update(np.array(piece_masks, dtype="<u4").tobytes())
+    key = int.from_bytes(digest.digest(), "little")
+    return CanonicalPosition(key, transform, colours, canonical.reshape(board.array.shape), piece_masks)
+
+
+def get_canonical_transform(array: np.ndarray) -> tuple[int, np.ndarray]:
+    """Finds the transform that maps the array to the canonical representative
+    of its symmetry class, the transform giving the smallest bytes
+
+    Args:
+        array (np.ndarray): board array
+
+    Returns:
+        tuple[int, np.ndarray]: transform id and the flat canonical uint8 array
+    """
+    permutations, _ = get_transform_permutations(len(array))
+    transformed = array.astype(np.uint8, copy=False).ravel()[permutations]
+    candidates = [row.tobytes() for row in transformed]
+    transform = candidates.index(min(candidates))
+    return transform, transformed[transform]
+
+
+def get_position_key(board: Board, colour: BoardStatesEnum) -> tuple[int, int]:
+    """Returns a 64 bit key of the position that is the same for all symmetric positions,
+    including those with the colours relabelled, together with the transform that maps
+    the board to its canonical form. Move ids carry no colour, so a move id in the canonical
+    frame only needs the transform to map it back
+
+    Args:
+        board (Board): board of the position
+        colour (BoardStatesEnum): colour to move
+
+    Returns:
+        tuple[int, int]: position key and transform id
+    """
+    canonical = canonicalise(board, colour)
+    return canonical.key, canonical.transform
+
+
+def transform_move(move: Move, transform: int, dimension: int, inverse: bool = False) -> Move:
+    """Maps a move into the frame of a transform, or back out of it if inverse
+
+    Args:
+        move (Move): move to map
+        transform (int): transform id
+        dimension (int): dimension of the board
+        inverse (bool, optional): if to map from the transformed frame back to the board. Defaults to False.
+
+    Returns:
+        Move: the mapped move
+    """
+    permutations, inverses = get_transform_permutations(dimension)
+    mapping = permutations[transform] if inverse else inverses[transform]
+    flat_idxs = mapping[[row * dimension + col for row, col in move.idxs]]
+    idxs = sorted((int(idx) // dimension, int(idx) % dimension) for idx in flat_idxs)
+    return Move(move.colour, move.piece_type, idxs)
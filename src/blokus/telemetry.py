@@ -0,0 +1,204 @@
+# Python Imports
+import json
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable
+
+# External Imports
+import numpy as np
+
+# Internal Imports
+from blokus.board_states import BoardStatesEnum
+
+_PLAYER_COLOURS = BoardStatesEnum.get_player_colours()
+_COLOURS_BY_ID = {colour.int_id: colour for colour in _PLAYER_COLOURS}
+
+# one event per turn of a colour, scores are in the order of `get_player_colours`.
+# move_id is -1 if no move was played, legal_move_count is -1 if the moves were not generated (a book move)
+PLY_EVENT_DTYPE = np.dtype(
+    [
+        ("game", "<u4"),
+        ("ply", "<u2"),
+        ("colour", "u1"),
+        ("legal_move_count", "<i4"),
+        ("move_id", "<i4"),
+        ("decision_latency", "<f8"),
+        ("update_latency", "<f8"),
+        ("scores", "<u2", (len(_PLAYER_COLOURS),)),
+        ("eliminated", "?"),
+    ]
+)
+
+
+class TelemetrySink(ABC):
+    """Abstract base class for destinations of batches of ply events, see `PLY_EVENT_DTYPE`.
+
+    Each sink must specify `write`
+    """
+
+    @abstractmethod
+    def write(self, events: np.ndarray):
+        """Writes a batch of events
+
+        Args:
+            events (np.ndarray): events, only valid for the duration of the call
+        """
+
+    def close(self):
+        """Releases anything held by the sink"""
+
+
+class JsonlSink(TelemetrySink):
+    """Appends events to a file, one json object per line.
+    Events are only formatted when a batch is written, each batch is a single write
+    """
+
+    def __init__(self, path: Path):
+        """initialiser for the sink
+
+        Args:
+            path (Path): file to append to
+        """
+        self._file = open(path, "a")
+
+    def write(self, events: np.ndarray):
+        names = events.dtype.names
+        lines = []
+        for values in events.tolist():
+            event = dict(zip(names, values))
+            event["colour"] = _COLOURS_BY_ID[event["colour"]].str_id
+            event["scores"] = event["scores"].tolist()
+            lines.append(json.dumps(event))
+        self._file.write("\n".join(lines) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class RingBufferSink(TelemetrySink):
+    """Keeps the latest events in memory, older events are overwritten"""
+
+    def __init__(self, capacity: int = 100_000):
+        """initialiser for the sink
+
+        Args:
+            capacity (int, optional): max events kept. Defaults to 100_000.
+        """
+        self._events = np.zeros(capacity, dtype=PLY_EVENT_DTYPE)
+        self._written = 0
+
+    def __len__(self) -> int:
+        return min(self._written, len(self._events))
+
+    @property
+    def events(self) -> np.ndarray:
+        """Returns the kept events from oldest to newest
+
+        Returns:
+            np.ndarray: copy of the events
+        """
+        start = self._written % len(self._events)
+        if self._written <= len(self._events):
+            return self._events[: self._written].copy()
+        return np.concatenate([self._events[start:], self._events[:start]])
+
+    def write(self, events: np.ndarray):
+        capacity = len(self._events)
+        events = events[-capacity:]
+        slots = (self._written + np.arange(len(events))) % capacity
+        self._events[slots] = events
+        self._written += len(events)
+
+
+class CallbackSink(TelemetrySink):
+    """Passes each batch of events to a callback"""
+
+    def __init__(self, callback: Callable[[np.ndarray], None]):
+        """initialiser for the sink
+
+        Args:
+            callback (Callable[[np.ndarray], None]): called with each batch, which is only valid for the duration of the call
+        """
+        self._callback = callback
+
+    def write(self, events: np.ndarray):
+        self._callback(events)
+
+
+class TelemetryRecorder:
+    """Buffers ply events into a preallocated batch and writes full batches to a sink.
+    Recording an event only stores its fields, nothing is formatted until the sink writes it.
+    A recorder can be shared by many games, each game takes an id from `new_game`
+    """
+
+    def __init__(self, sink: TelemetrySink, batch_size: int = 1024):
+        """initialiser for the recorder
+
+        Args:
+            sink (TelemetrySink): where batches are written
+            batch_size (int, optional): events buffered before writing. Defaults to 1024.
+        """
+        self.sink = sink
+        self._batch = np.zeros(batch_size, dtype=PLY_EVENT_DTYPE)
+        self._size = 0
+        self._games = 0
+
+    def new_game(self) -> int:
+        """Returns the id of a new game
+
+        Returns:
+            int: id of the game
+        """
+        self._games += 1
+        return self._games - 1
+
+    def record(
+        self,
+        game: int,
+        ply: int,
+        colour: BoardStatesEnum,
+        legal_move_count: int,
+        move_id: int,
+        decision_latency: float,
+        update_latency: float,
+        scores: np.ndarray,
+        eliminated: bool,
+    ):
+        """Records the turn of a colour
+
+        Args:
+            game (int): id of the game
+            ply (int): moves played before the turn
+            colour (BoardStatesEnum): colour whose turn it was
+            legal_move_count (int): valid moves of the colour, -1 if they were not generated
+            move_id (int): id of the move played, -1 if none was played
+            decision_latency (float): seconds taken to choose the move
+            update_latency (float): seconds taken to play the move and update the board
+            scores (np.ndarray): score of each colour after the turn
+            eliminated (bool): if the colour is unable to play
+        """
+        event = self._batch[self._size]
+        event["game"] = game
+        event["ply"] = ply
+        event["colour"] = colour.int_id
+        event["legal_move_count"] = legal_move_count
+        event["move_id"] = move_id
+        event["decision_latency"] = decision_latency
+        event["update_latency"] = update_latency
+        event["scores"] = scores
+        event["eliminated"] = eliminated
+        self._size += 1
+        if self._size == len(self._batch):
+            self.flush()
+
+    def flush(self):
+        """Writes any buffered events to the sink"""
+        if self._size:
+            self.sink.write(self._batch[: self._size])
+            self._size = 0
+
+    def close(self):
+        """Flushes the buffered events and closes the sink"""
+        self.flush()
+        self.sink.close()
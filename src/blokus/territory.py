@@ -0,0 +1,226 @@
+# Python Imports
+from dataclasses import dataclass
+
+# External Imports
+import numpy as np
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.masks import ADJACENT_STEPS, DIAGONAL_STEPS, shift_mask
+from blokus.move import Move
+
+
+@dataclass
+class _TerritoryState:
+    """Reachable cells after a number of moves of the board"""
+
+    move_count: int
+    latest_move: Move
+    reachable: np.ndarray
+
+
+class Territory:
+    """Tracks the empty cells each colour could still claim.
+
+    A cell is reachable by a colour if it is free for the colour (empty and not sharing an edge
+    with it) and connected, through free cells sharing an edge or a corner, to one of its anchors.
+    Any cell a future piece of the colour covers is reachable, so this is an upper bound on the
+    territory of the colour. Cells reachable by more than one colour are contested, the rest are
+    exclusive to the colour reaching them.
+
+    The flood fills of all colours run together over stacked masks. Reachable cells only ever shrink
+    as moves are played, so `update` skips the fill when no reachable cell was taken and otherwise
+    refills only within the previous reachable cells. States are kept per update, so moves taken back
+    with `pop_move` restore the state from before them without any fill.
+    """
+
+    def __init__(self, board: Board):
+        """initialiser for the territory, computing it from scratch
+
+        Args:
+            board (Board): board to track
+        """
+        self._colours = BoardStatesEnum.get_player_colours()
+        self._corners = np.zeros(board.array.shape, dtype=bool)
+        for row, col in board.corner_idxs:
+            self._corners[row, col] = True
+        self._states: list[_TerritoryState] = []
+        self._reset(board)
+
+    @property
+    def reachable(self) -> np.ndarray:
+        """Returns the reachable cells of each colour
+
+        Returns:
+            np.ndarray: (colours, dimension, dimension) bool mask in the order of `get_player_colours`
+        """
+        return self._states[-1].reachable
+
+    @property
+    def reach_counts(self) -> np.ndarray:
+        """Returns how many colours can reach each cell
+
+        Returns:
+            np.ndarray: (dimension, dimension) count of colours
+        """
+        return self.reachable.sum(axis=0)
+
+    @property
+    def contested(self) -> np.ndarray:
+        """Returns the cells reachable by more than one colour
+
+        Returns:
+            np.ndarray: (dimension, dimension) bool mask
+        """
+        return self.reach_counts > 1
+
+    @property
+    def exclusive(self) -> np.ndarray:
+        """Returns the cells only reachable by each colour
+
+        Returns:
+            np.ndarray: (colours, dimension, dimension) bool mask in the order of `get_player_colours`
+        """
+        return self.reachable & (self.reach_counts == 1)
+
+    def get_reachable_counts(self) -> np.ndarray:
+        """Returns the number of reachable cells of each colour
+
+        Returns:
+            np.ndarray: cells per colour in the order of `get_player_colours`
+        """
+        return self.reachable.sum(axis=(1, 2))
+
+    def get_exclusive_counts(self) -> np.ndarray:
+        """Returns the number of exclusive cells of each colour
+
+        Returns:
+            np.ndarray: cells per colour in the order of `get_player_colours`
+        """
+        return self.exclusive.sum(axis=(1, 2))
+
+    def update(self, board: Board):
+        """Brings the territory up to date with the board.
+        Moves taken back since the last update restore earlier states, new moves are applied incrementally.
+        A board that is not a continuation of the tracked one is recomputed from scratch
+
+        Args:
+            board (Board): tracked board
+        """
+        moves = board.move_list
+        while self._states and not self._matches(self._states[-1], moves):
+            self._states.pop()
+        if not self._states:
+            self._reset(board)
+            return
+
+        state = self._states[-1]
+        new_moves = moves[state.move_count :]
+        if not new_moves:
+            return
+        reachable = self._apply_moves(board, state.reachable)
+        self._states.append(_TerritoryState(len(moves), moves[-1], reachable))
+
+    def _reset(self, board: Board):
+        """Computes the territory from scratch
+
+        Args:
+            board (Board): tracked board
+        """
+        own, free = self._get_own_and_free_masks(board)
+        moves = board.move_list
+        reachable = flood_fill(self._get_seed_mask(own, free), free)
+        self._states = [_TerritoryState(len(moves), moves[-1] if moves else None, reachable)]
+
+    def _apply_moves(self, board: Board, reachable: np.ndarray) -> np.ndarray:
+        """Updates the reachable cells for the moves played since they were computed,
+        refilling only the colours the moves affect
+
+        Args:
+            board (Board): board after the moves
+            reachable (np.ndarray): reachable cells before the moves
+
+        Returns:
+            np.ndarray: reachable cells after the moves
+        """
+        own, free = self._get_own_and_free_masks(board)
+        # a colour is affected if it could reach a cell that is no longer free for it
+        affected = (reachable & ~free).any(axis=(1, 2))
+        if not affected.any():
+            return reachable
+
+        # new anchors are next to cells that were reachable, so the refill stays within the old cells,
+        # unaffected colours refill to their old cells
+        seeds = self._get_seed_mask(own, free)
+        return flood_fill(seeds & reachable, free & reachable)
+
+    def _get_own_and_free_masks(self, board: Board) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the cells of each colour and the cells free for each colour,
+        which are empty and do not share an edge with the colour
+
+        Args:
+            board (Board): board of the position
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: stacked colour masks, stacked free masks
+        """
+        colour_ids = np.array([colour.int_id for colour in self._colours])
+        own = board.array[None, :, :] == colour_ids[:, None, None]
+        free = (board.array == BoardStatesEnum.EMPTY.int_id) & ~shift_mask(own, ADJACENT_STEPS)
+        return own, free
+
+    def _get_seed_mask(self, own: np.ndarray, free: np.ndarray) -> np.ndarray:
+        """Returns the anchors the flood fills start from, the free cells diagonal to the colour.
+        Board corners are always anchors as corner placements remain valid
+
+        Args:
+            own (np.ndarray): stacked colour masks
+            free (np.ndarray): stacked free masks
+
+        Returns:
+            np.ndarray: stacked seed masks
+        """
+        return (shift_mask(own, DIAGONAL_STEPS) | self._corners) & free
+
+    @staticmethod
+    def _matches(state: _TerritoryState, moves: list[Move]) -> bool:
+        """Checks if the board's moves continue from the state
+
+        Args:
+            state (_TerritoryState): state to check
+            moves (list[Move]): moves of the board
+
+        Returns:
+            bool: if the state is part of the board's history
+        """
+        if state.move_count > len(moves):
+            return False
+        return state.move_count == 0 or moves[state.move_count - 1] is state.latest_move
+
+
+def flood_fill(seeds: np.ndarray, free: np.ndarray) -> np.ndarray:
+    """Fills from the seeds through free cells sharing an edge or a corner.
+    Stacked masks are filled together, the fill runs over the last two axes
+
+    Args:
+        seeds (np.ndarray): bool mask of the cells to fill from
+        free (np.ndarray): bool mask of the cells that can be filled
+
+    Returns:
+        np.ndarray: bool mask of the filled cells
+    """
+    filled = seeds & free
+    while True:
+        # a 3x3 dilation, done as a horizontal then a vertical one
+        across = filled.copy()
+        across[..., :, 1:] |= filled[..., :, :-1]
+        across[..., :, :-1] |= filled[..., :, 1:]
+        grown = across.copy()
+        grown[..., 1:, :] |= across[..., :-1, :]
+        grown[..., :-1, :] |= across[..., 1:, :]
+        grown &= free
+        if np.array_equal(grown, filled):
+            return filled
+        filled = grown
+
@@ -0,0 +1,314 @@
+# Python Imports
+import operator
+from collections.abc import Sequence
+from typing import Iterator, Self
+
+# External Imports
+import numpy as np
+
+# Internal Imports
+from blokus.board_states import BoardStatesEnum
+from blokus.move import Move
+from blokus.pieces.catalogue import TEMPLATE_DIMENSION, decode_move_id, encode_move_id, get_piece_catalogue
+
+# a record is the orientation, its top left anchor and the bitmask of its cells within the 5x5 window at the anchor
+RECORD_DTYPE = np.dtype([("piece_id", np.uint8), ("orientation_id", np.uint8), ("anchor", np.uint8, (2,)), ("cells", np.uint32)])
+
+
+def get_window_masks(mask: np.ndarray) -> np.ndarray:
+    """Returns for every cell the bitmask of the supplied mask within the 5x5 window
+    whose top left is the cell, in the layout of the `cells` of a record.
+    Placements anchored on a cell cover a cell of the mask if their cells share a bit with it
+
+    Args:
+        mask (np.ndarray): bool mask the shape of the board
+
+    Returns:
+        np.ndarray: uint32 window bitmask of each cell
+    """
+    dimension = len(mask)
+    padded = np.pad(mask, (0, TEMPLATE_DIMENSION - 1)).astype(np.uint32)
+    windows = np.zeros(mask.shape, dtype=np.uint32)
+    for row in range(TEMPLATE_DIMENSION):
+        for col in range(TEMPLATE_DIMENSION):
+            windows |= padded[row : row + dimension, col : col + dimension] << np.uint32(row * TEMPLATE_DIMENSION + col)
+    return windows
+
+
+def get_move_ids(moves: Sequence[Move]) -> np.ndarray:
+    """Returns the move ids of a batch of moves,
+    read straight from the records for `ValidMoves` so no moves are built
+
+    Args:
+        moves (Sequence[Move]): moves to get the ids of
+
+    Returns:
+        np.ndarray: int64 move ids
+    """
+    if isinstance(moves, ValidMoves):
+        return moves.move_ids
+    return np.fromiter((move.move_id for move in moves), dtype=np.int64, count=len(moves))
+
+
+class ValidMoveStore:
+    """The valid moves of a single colour held as 8 byte records of a structured array,
+    see `RECORD_DTYPE`, rather than `Move` objects.
+
+    The store only holds the records and a bool per slot of whether it is live, so it is
+    `nbytes` in total and copying it copies two arrays. Removed records leave their slot free,
+    and added records fill the lowest free slots before the array grows, so a store only ever holds
+    as many slots as its peak number of moves, and copies of a store mostly made of free slots are compacted. Selecting and removing moves, by piece or by the cells
+    they cover, are vectorised over the records. Moves are only built from the records by the `ValidMoves` views.
+    """
+
+    def __init__(self, capacity: int = 0):
+        """initialiser for an empty store
+
+        Args:
+            capacity (int, optional): slots to allocate up front. Defaults to 0.
+        """
+        self._records = np.zeros(capacity, dtype=RECORD_DTYPE)
+        self._alive = np.zeros(capacity, dtype=bool)
+
+    @classmethod
+    def from_move_ids(cls, move_ids: np.ndarray) -> Self:
+        """Creates a store holding the supplied moves
+
+        Args:
+            move_ids (np.ndarray): ids of the moves
+
+        Returns:
+            ValidMoveStore: store of the moves
+        """
+        store = cls()
+        store.add(move_ids)
+        return store
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._alive))
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the bytes held by the store, the records and live flags of every slot including free slots
+
+        Returns:
+            int: bytes held
+        """
+        return self._records.nbytes + self._alive.nbytes
+
+    @property
+    def records(self) -> np.ndarray:
+        """Returns the records of the valid moves in slot order
+
+        Returns:
+            np.ndarray: copy of the live records
+        """
+        return self._records[self._alive]
+
+    @property
+    def move_ids(self) -> np.ndarray:
+        """Returns the ids of the valid moves in slot order
+
+        Returns:
+            np.ndarray: int64 move ids
+        """
+        return self._get_move_ids(self._records[self._alive])
+
+    def copy(self) -> Self:
+        """Creates an independent copy of the store
+
+        Returns:
+            ValidMoveStore: copy of the store
+        """
+        store = ValidMoveStore()
+        if np.count_nonzero(self._alive) < len(self._alive) // 4:
+            # copies of a store that has shrunk well below its peak only keep the live records
+            store._records = self._records[self._alive]
+            store._alive = np.ones(len(store._records), dtype=bool)
+        else:
+            store._records = self._records.copy()
+            store._alive = self._alive.copy()
+        return store
+
+    def view(self, colour: BoardStatesEnum, slots: np.ndarray = None) -> "ValidMoves":
+        """Returns a view of the valid moves, unaffected by later changes to the store
+
+        Args:
+            colour (BoardStatesEnum): colour of the moves
+            slots (np.ndarray, optional): live slots of the moves to view, as returned by `select`. Defaults to all.
+
+        Returns:
+            ValidMoves: view of the moves
+        """
+        if slots is None:
+            return ValidMoves(colour, self.move_ids)
+        return ValidMoves(colour, self._get_move_ids(self._records[slots]))
+
+    def add(self, move_ids: np.ndarray) -> int:
+        """Adds the moves that are not already held, keeping the order they were supplied in
+
+        Args:
+            move_ids (np.ndarray): ids of the moves
+
+        Returns:
+            int: number of moves added
+        """
+        move_ids = np.asarray(move_ids, dtype=np.int64)
+        _, first_idxs = np.unique(move_ids, return_index=True)
+        move_ids = move_ids[np.sort(first_idxs)]
+        move_ids = move_ids[~np.isin(move_ids, self.move_ids)]
+        if not len(move_ids):
+            return 0
+
+        free_slots = np.flatnonzero(~self._alive)
+        if len(move_ids) > len(free_slots):
+            self._grow(len(move_ids) - len(free_slots))
+            free_slots = np.flatnonzero(~self._alive)
+        slots = free_slots[: len(move_ids)]
+
+        piece_ids, orientation_ids, rows, cols = decode_move_id(move_ids)
+        self._records["piece_id"][slots] = piece_ids
+        self._records["orientation_id"][slots] = orientation_ids
+        self._records["anchor"][slots, 0] = rows
+        self._records["anchor"][slots, 1] = cols
+        catalogue = get_piece_catalogue()
+        self._records["cells"][slots] = catalogue.packed["orientation_templates"][catalogue.decode_move_ids(move_ids)[0]]
+        self._alive[slots] = True
+        return len(move_ids)
+
+    def remove_piece(self, piece_id: int):
+        """Removes every move of a piece
+
+        Args:
+            piece_id (int): id of the piece
+        """
+        self._alive &= self._records["piece_id"] != piece_id
+
+    def remove_overlapping(self, mask: np.ndarray, windows: np.ndarray = None):
+        """Removes every move covering any of the cells of the mask
+
+        Args:
+            mask (np.ndarray): bool mask the shape of the board
+            windows (np.ndarray, optional): `get_window_masks` of the mask, for callers
+                                            removing the same mask from several stores. Defaults to None.
+        """
+        self._alive &= ~self._get_overlaps(self._records, mask, windows)
+
+    def select(self, piece_ids: list[int] = None, mask: np.ndarray = None) -> np.ndarray:
+        """Selects the valid moves matching the supplied filters
+
+        Args:
+            piece_ids (list[int], optional): only moves of these pieces. Defaults to None.
+            mask (np.ndarray, optional): only moves covering at least one cell of this bool mask. Defaults to None.
+
+        Returns:
+            np.ndarray: live slots of the matching moves, in slot order
+        """
+        selected = self._alive
+        if piece_ids is not None:
+            selected = selected & np.isin(self._records["piece_id"], list(piece_ids))
+        slots = np.flatnonzero(selected)
+        if mask is not None:
+            slots = slots[self._get_overlaps(self._records[slots], mask)]
+        return slots
+
+    @staticmethod
+    def _get_overlaps(records: np.ndarray, mask: np.ndarray, windows: np.ndarray = None) -> np.ndarray:
+        """Checks which records cover a cell of the mask
+
+        Args:
+            records (np.ndarray): records of moves
+            mask (np.ndarray): bool mask the shape of the board
+            windows (np.ndarray, optional): `get_window_masks` of the mask. Defaults to None.
+
+        Returns:
+            np.ndarray: bool per record
+        """
+        if windows is None:
+            windows = get_window_masks(mask)
+        return (windows[records["anchor"][:, 0], records["anchor"][:, 1]] & records["cells"]) != 0
+
+    def _grow(self, extra: int):
+        """Grows the arrays by at least the supplied number of slots, doubling the capacity
+
+        Args:
+            extra (int): slots needed
+        """
+        capacity = len(self._records)
+        new_capacity = max(capacity + extra, 2 * capacity)
+        self._records = np.concatenate([self._records, np.zeros(new_capacity - capacity, dtype=self._records.dtype)])
+        self._alive = np.concatenate([self._alive, np.zeros(new_capacity - capacity, dtype=bool)])
+
+    @staticmethod
+    def _get_move_ids(records: np.ndarray) -> np.ndarray:
+        """Packs records into move ids
+
+        Args:
+            records (np.ndarray): records of moves
+
+        Returns:
+            np.ndarray: int64 move ids
+        """
+        return encode_move_id(
+            records["piece_id"].astype(np.int64),
+            records["orientation_id"].astype(np.int64),
+            records["anchor"][:, 0].astype(np.int64),
+            records["anchor"][:, 1].astype(np.int64),
+        )
+
+
+class ValidMoves(Sequence):
+    """Read only sequence of valid moves of a colour held as move ids.
+    `Move` objects are only built for the moves that are accessed, and are kept
+    so accessing the same move again returns the same object.
+    """
+
+    def __init__(self, colour: BoardStatesEnum, move_ids: np.ndarray):
+        """initialiser for the view
+
+        Args:
+            colour (BoardStatesEnum): colour of the moves
+            move_ids (np.ndarray): ids of the moves
+        """
+        self.colour = colour
+        self._move_ids = move_ids
+        self._moves: dict[int, Move] = {}
+
+    @property
+    def move_ids(self) -> np.ndarray:
+        """Returns the ids of the moves
+
+        Returns:
+            np.ndarray: int64 move ids
+        """
+        return self._move_ids
+
+    def __len__(self) -> int:
+        return len(self._move_ids)
+
+    def __getitem__(self, idx: int | slice | np.ndarray) -> Move | Self:
+        # slices and index arrays select a new view
+        if isinstance(idx, (slice, np.ndarray)):
+            return ValidMoves(self.colour, self._move_ids[idx])
+        idx = operator.index(idx)
+        if idx < 0:
+            idx += len(self._move_ids)
+        if not 0 <= idx < len(self._move_ids):
+            raise IndexError("valid move index out of range")
+        move = self._moves.get(idx)
+        if move is None:
+            move = Move.from_move_id(self.colour, int(self._move_ids[idx]))
+            self._moves[idx] = move
+        return move
+
+    def __iter__(self) -> Iterator[Move]:
+        for idx in range(len(self._move_ids)):
+            yield self[idx]
+
+    def __contains__(self, move: Move) -> bool:
+        if not isinstance(move, Move) or move.colour != self.colour:
+            return False
+        return bool((self._move_ids == move.move_id).any())
+
+    def __repr__(self) -> str:
+        return f"ValidMoves({self.colour}, {len(self)} moves)"
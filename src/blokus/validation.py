@@ -0,0 +1,196 @@
+"""
+Validation of moves without exceptions.
+
+A validator takes a board and a move and returns `MoveFailureEnum.VALID`, which is 0, or the failure
+it detected. Nothing is raised or formatted while validating, as most moves checked during move
+generation are rejected. Messages are only built from the failure codes when diagnostics are asked for,
+see `get_failure_message`.
+"""
+
+# Python Imports
+import threading
+from enum import IntEnum
+from typing import Any, Callable
+
+# Internal Imports
+from blokus.move import Move
+
+Validator = Callable[[Any, Move], int]
+
+
+class MoveFailureEnum(IntEnum):
+    """Reasons a move is invalid, falsy only for a valid move"""
+
+    VALID = 0
+    OUT_OF_BOUNDS = 1
+    USED_PIECE = 2
+    OVERLAP = 3
+    EDGE_RELATION = 4
+    CORNER_RELATION = 5
+    PIECE_SHAPE = 6
+
+
+_FAILURE_MESSAGES = {
+    MoveFailureEnum.OUT_OF_BOUNDS: "Move does not fit in the board, {move}",
+    MoveFailureEnum.USED_PIECE: "The piece {move.piece_type} was already used by {move.colour}",
+    MoveFailureEnum.OVERLAP: "The move overlaps a populated cell, {move}",
+    MoveFailureEnum.EDGE_RELATION: "The move does not obey the side relation, {move}",
+    MoveFailureEnum.CORNER_RELATION: "The move does not obey the corner relation, {move}",
+    MoveFailureEnum.PIECE_SHAPE: "The supplied idx do not match the piece type shape {move}",
+}
+
+
+def get_failure_message(failure: int, move: Move) -> str:
+    """Returns the message describing why the move failed validation
+
+    Args:
+        failure (int): failure code, see `MoveFailureEnum`
+        move (Move): move that failed
+
+    Returns:
+        str: message of the failure
+    """
+    return _FAILURE_MESSAGES[MoveFailureEnum(failure)].format(move=move)
+
+
+def compile_validators(validators: list[Validator]) -> Validator:
+    """Compiles validators into a single function that runs them in order,
+    returning the first failure, so a check is one call rather than a loop over the validators
+
+    Args:
+        validators (list[Validator]): validators to run
+
+    Returns:
+        Validator: function returning the first failure of the validators, 0 if none failed
+    """
+    namespace = {f"_validator_{index}": validator for index, validator in enumerate(validators)}
+    calls = " or ".join(f"{name}(board, move)" for name in namespace) or "0"
+    exec(f"def validate(board, move):\n    return {calls}", namespace)
+    return namespace["validate"]
+
+
+class ValidationPipeline:
+    """Validators compiled into a single function, reordered by how often they reject.
+
+    Each check counts the failure it returned, every `reorder_interval` checks the rejection rate of each
+    validator, the fraction of the moves it saw that it rejected, is measured over the checks since the last
+    reorder. The validators are then sorted by it, so the ones that reject most run first and later validators
+    see fewer moves. The first `pinned_count` validators always run first in their supplied order, as the
+    other validators rely on them passing, such as moves being in bounds before cells are read.
+
+    Move generation does not validate moves, see `PatternCache`, so the checks come from playing moves,
+    mostly the `push_move` calls of search, and a reorder only happens once a search has made enough of them.
+
+    Counts are not locked, checks from many threads at most lose a count.
+    """
+
+    def __init__(self, validators: dict[int, Validator], pinned_count: int = 1, reorder_interval: int = 4096):
+        """initialiser for the pipeline
+
+        Args:
+            validators (dict[int, Validator]): validator of each failure code, in their initial order
+            pinned_count (int, optional): validators that are never reordered. Defaults to 1.
+            reorder_interval (int, optional): checks between reorders. Defaults to 4096.
+        """
+        self.reorder_interval = reorder_interval
+        self._validators = dict(validators)
+        self._pinned = list(validators)[:pinned_count]
+        self._order = list(validators)
+        self._lock = threading.Lock()
+
+        # totals of the checks before the current window
+        self._checks = 0
+        self._rejections = [0] * (max(validators, default=0) + 1)
+        self._window_checks = 0
+        self._window_rejections = [0] * len(self._rejections)
+        self._validate = compile_validators([self._validators[failure] for failure in self._order])
+
+    @property
+    def order(self) -> list[MoveFailureEnum]:
+        """Returns the order the validators currently run in
+
+        Returns:
+            list[MoveFailureEnum]: failure code of each validator
+        """
+        return [MoveFailureEnum(failure) for failure in self._order]
+
+    @property
+    def checks(self) -> int:
+        """Returns the number of checks made
+
+        Returns:
+            int: checks made
+        """
+        return self._checks + self._window_checks
+
+    @property
+    def rejection_counts(self) -> dict[MoveFailureEnum, int]:
+        """Returns how many moves each validator rejected
+
+        Returns:
+            dict[MoveFailureEnum, int]: rejections of each validator by failure code
+        """
+        return {
+            MoveFailureEnum(failure): self._rejections[failure] + self._window_rejections[failure] for failure in self._validators
+        }
+
+    def check(self, board: Any, move: Move) -> int:
+        """Returns the first failure of the move
+
+        Args:
+            board (Any): board to validate against
+            move (Move): move to validate
+
+        Returns:
+            int: failure code, see `MoveFailureEnum`, 0 if the move is valid
+        """
+        failure = self._validate(board, move)
+        self._window_rejections[failure] += 1
+        self._window_checks += 1
+        if self._window_checks >= self.reorder_interval:
+            self._reorder()
+        return failure
+
+    def check_all(self, board: Any, move: Move) -> list[int]:
+        """Returns every failure of the move, in the initial order of the validators.
+        The validators are not counted, so diagnostics do not depend on or change the order, and stop after the pinned validators if any of them fail
+
+        Args:
+            board (Any): board to validate against
+            move (Move): move to validate
+
+        Returns:
+            list[int]: failure codes, empty if the move is valid
+        """
+        failures = []
+        for index, (failure, validator) in enumerate(self._validators.items()):
+            if validator(board, move):
+                failures.append(failure)
+            if failures and index < len(self._pinned):
+                break
+        return failures
+
+    def _reorder(self):
+        """Sorts the unpinned validators by their rejection rate over the checks since the last reorder"""
+        with self._lock:
+            if self._window_checks < self.reorder_interval:
+                return
+            rejections, self._window_rejections = self._window_rejections, [0] * len(self._rejections)
+            checks, self._window_checks = self._window_checks, 0
+            self._checks += checks
+            self._rejections = [total + count for total, count in zip(self._rejections, rejections)]
+
+            # each validator only sees the moves none of the validators before it rejected
+            rates = {}
+            seen = checks
+            for failure in self._order:
+                rates[failure] = rejections[failure] / seen if seen else 0.0
+                seen -= rejections[failure]
+
+            unpinned = sorted(
+                (failure for failure in self._order if failure not in self._pinned), key=lambda failure: rates[failure], reverse=True
+            )
+            order = self._pinned + unpinned
+            if order != self._order:
+                self._order = order
+                self._validate = compile_validators([self._validators[failure] for failure in order])
@@ -2,36 +2,55 @@
 Date    :   2024/01/29
 Author  :   Louie Hext
 License :   (C)Copyright 2024, A-Space
-"""
-import json
-import os
 
+This is a configuration file for pytest containing customizations and fixtures.
+"""
 # Python Imports
-from pathlib import Path
+import random
+from typing import Callable
 
 import pytest
 
-# External Imports
-from data_structures.graph import Graph
-
 # Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
 
 
-"""
-This is a configuration file for pytest containing customizations and fixtures.
-"""
+def play_random_moves(board: Board, plies: int, seed: int = 0) -> Board:
+    """Plays random valid moves on the board, colours unable to move are skipped
+
+    Args:
+        board (Board): board to play on
+        plies (int): turns to play, in the order of the player colours
+        seed (int, optional): seed of the moves. Defaults to 0.
 
-DATA_DIRECTORY = Path(os.environ["TEST_DATA_DIRECTORY_LIVINGROOM_FURNISHER"])
+    Returns:
+        Board: the supplied board
+    """
+    rng = random.Random(seed)
+    colours = BoardStatesEnum.get_player_colours()
+    for ply in range(plies):
+        moves = board.get_valid_moves_for_colour(colours[ply % len(colours)])
+        if moves:
+            board.play_move(moves[rng.randrange(len(moves))])
+    return board
+
+
+@pytest.fixture
+def random_board() -> Callable[..., Board]:
+    """Builds boards part way through a random game
+
+    Returns:
+        Callable[..., Board]: called with the plies to play and optionally a seed
+    """
+    return lambda plies, seed=0: play_random_moves(Board(), plies, seed)
 
 
-@pytest.fixture(params=DATA_DIRECTORY.glob("floorplan_graph*.json"))
-def graph(request) -> Graph:
-    """graph loaded directly from a json file.
+@pytest.fixture
+def midgame_board(random_board) -> Board:
+    """board after 6 random moves of every colour
 
     Returns:
-        Graph:graph loaded from a json file
+        Board: board of the position
     """
-    print(request)
-    with open(request.param, "r") as f:
-        data = json.load(f)
-    return Graph.from_json(data)
+    return random_board(24)
@@ -0,0 +1,78 @@
+# Python Imports
+import asyncio
+
+import numpy as np
+import pytest
+
+# Internal Imports
+from blokus.board_states import BoardStatesEnum
+from blokus.bots.bot_enums import BotEnum
+from blokus.exceptions import APIPlayerError
+from blokus.player.api_player import APIPlayer
+from blokus.player.api_protocol import NO_MOVE, decode_request, decode_response, encode_request, encode_response
+from blokus.player.api_server import BotServer
+
+
+@pytest.mark.unit
+def test_request_round_trip(midgame_board):
+    moves = midgame_board.get_valid_moves_for_colour(BoardStatesEnum.RED)
+    request = decode_request(encode_request(midgame_board, BoardStatesEnum.RED, moves))
+
+    assert request.colour == BoardStatesEnum.RED
+    np.testing.assert_array_equal(request.board_array, midgame_board.array)
+    np.testing.assert_array_equal(request.build_board().array, midgame_board.array)
+    assert request.build_moves() == list(moves)
+
+
+@pytest.mark.unit
+def test_response_round_trip():
+    assert decode_response(encode_response(3), 4) == 3
+    assert decode_response(encode_response(NO_MOVE), 4) == NO_MOVE
+    with pytest.raises(APIPlayerError):
+        decode_response(encode_response(4), 4)
+
+
+@pytest.mark.unit
+def test_malformed_request_is_rejected(midgame_board):
+    body = encode_request(midgame_board, BoardStatesEnum.RED, midgame_board.get_valid_moves_for_colour(BoardStatesEnum.RED))
+    with pytest.raises(APIPlayerError):
+        decode_request(body[:-1])
+
+
+@pytest.mark.integration
+def test_api_player_against_local_server(midgame_board):
+    async def play() -> tuple:
+        server = BotServer(BotEnum.GREEDY)
+        address = await server.start()
+        player = APIPlayer(midgame_board, BoardStatesEnum.RED, address)
+        moves = midgame_board.get_valid_moves_for_colour(BoardStatesEnum.RED)
+        try:
+            # a second request reuses the pooled connection
+            chosen = [await player.async_select_best_move(moves) for _ in range(2)]
+        finally:
+            await player.async_close()
+            await server.close()
+        return moves, chosen, server.request_count, player.round_trip_times
+
+    moves, chosen, request_count, round_trip_times = asyncio.run(play())
+
+    biggest = max(len(move.idxs) for move in moves)
+    assert all(move in moves and len(move.idxs) == biggest for move in chosen)
+    assert request_count == 2
+    assert len(round_trip_times) == 2
+
+
+@pytest.mark.integration
+def test_api_player_without_server_plays_no_move(midgame_board):
+    async def play():
+        # bind then close a server so the port is refusing connections
+        server = BotServer(BotEnum.RANDOM)
+        address = await server.start()
+        await server.close()
+        player = APIPlayer(midgame_board, BoardStatesEnum.RED, address, deadline=1, retries=1, backoff=0.01)
+        try:
+            return await player.async_select_best_move(midgame_board.get_valid_moves_for_colour(BoardStatesEnum.RED))
+        finally:
+            await player.async_close()
+
+    assert asyncio.run(play()) is None
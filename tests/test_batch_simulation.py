@@ -0,0 +1,48 @@
+# Python Imports
+import numpy as np
+import pytest
+
+# Internal Imports
+from blokus.batch_simulation import BatchPolicyEnum, BatchSimulator
+from blokus.board_states import BoardStatesEnum
+
+COLOURS = BoardStatesEnum.get_player_colours()
+
+
+@pytest.fixture(scope="module", params=list(BatchPolicyEnum))
+def simulator(request):
+    simulator = BatchSimulator(6, request.param, seed=0)
+    simulator.run()
+    return simulator
+
+
+@pytest.mark.integration
+def test_games_replay_on_boards(simulator):
+    assert simulator.is_finished
+    scores = simulator.get_scores()
+    for game in range(simulator.game_count):
+        board = simulator.get_board(game)
+        np.testing.assert_array_equal(board.array, simulator.boards[game])
+        np.testing.assert_array_equal(board.get_scores(), scores[game])
+        for index, colour in enumerate(COLOURS):
+            assert board.piece_sets[colour].to_mask() == simulator.piece_masks[game, index]
+            assert not board.get_valid_moves_for_colour(colour)
+
+
+@pytest.mark.unit
+def test_anchors_match_board(simulator):
+    board = simulator.get_board(0)
+    for index, colour in enumerate(COLOURS):
+        anchors = np.flatnonzero(simulator.anchors[0, index])
+        assert all(board.array.flat[anchor] == BoardStatesEnum.EMPTY.int_id for anchor in anchors)
+
+
+@pytest.mark.unit
+def test_seed_is_reproducible():
+    first = BatchSimulator(4, seed=1)
+    second = BatchSimulator(4, seed=1)
+    for _ in range(12):
+        first.step()
+        second.step()
+    np.testing.assert_array_equal(first.move_ids, second.move_ids)
+    assert first.turn == second.turn == 12
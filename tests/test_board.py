@@ -0,0 +1,52 @@
+# Python Imports
+import numpy as np
+import pytest
+
+# Internal Imports
+from blokus.board_states import BoardStatesEnum
+
+
+def get_state(board) -> tuple:
+    """Returns everything a move changes on a board"""
+    colours = BoardStatesEnum.get_player_colours()
+    return (
+        board.array.copy(),
+        {colour: board.piece_sets[colour].to_mask() for colour in colours},
+        list(board.move_list),
+        board.latest_move,
+        {colour: sorted(board.get_valid_moves_for_colour(colour).move_ids.tolist()) for colour in colours},
+    )
+
+
+def assert_same_state(state, other):
+    np.testing.assert_array_equal(state[0], other[0])
+    assert state[1:] == other[1:]
+
+
+@pytest.mark.unit
+def test_push_pop_restores_state(midgame_board):
+    before = get_state(midgame_board)
+    colours = BoardStatesEnum.get_player_colours()
+    pushed = []
+    for ply in range(8):
+        moves = midgame_board.get_valid_moves_for_colour(colours[ply % len(colours)])
+        if moves:
+            midgame_board.push_move(moves[len(moves) // 2])
+            pushed.append(moves[len(moves) // 2])
+
+    for move in reversed(pushed):
+        assert midgame_board.pop_move() == move
+    assert_same_state(before, get_state(midgame_board))
+
+
+@pytest.mark.unit
+def test_pop_then_play_matches_playing_directly(midgame_board):
+    move = midgame_board.get_valid_moves_for_colour(BoardStatesEnum.RED)[0]
+    direct = midgame_board.copy()
+    direct.play_move(move)
+
+    other = midgame_board.get_valid_moves_for_colour(BoardStatesEnum.RED)[-1]
+    midgame_board.push_move(other)
+    midgame_board.pop_move()
+    midgame_board.play_move(move)
+    assert_same_state(get_state(direct), get_state(midgame_board))
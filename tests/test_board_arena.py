@@ -0,0 +1,93 @@
+# Python Imports
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_arena import BoardArena
+from blokus.board_states import BoardStatesEnum
+from blokus.exceptions import BoardArenaError
+
+COLOURS = BoardStatesEnum.get_player_colours()
+
+
+def read_in_worker(name: str, slot: int) -> tuple[bytes, list[int], str, int]:
+    arena = BoardArena.attach(name)
+    try:
+        board, colour, sequence = arena.read_board(slot)
+        return board.array.astype(np.uint8).tobytes(), [board.piece_sets[c].to_mask() for c in COLOURS], colour.str_id, sequence
+    finally:
+        arena.close()
+
+
+@pytest.fixture
+def arena():
+    with BoardArena.create(2) as arena:
+        yield arena
+
+
+@pytest.mark.unit
+def test_publish_and_read_board(arena, midgame_board):
+    assert arena.get_sequence(0) == 0
+    assert arena.publish(0, midgame_board, BoardStatesEnum.GREEN) == 2
+
+    attached = BoardArena.attach(arena.name)
+    try:
+        board, colour, sequence = attached.read_board(0)
+        np.testing.assert_array_equal(attached.view(0), midgame_board.array)
+    finally:
+        attached.close()
+
+    assert (colour, sequence) == (BoardStatesEnum.GREEN, 2)
+    np.testing.assert_array_equal(board.array, midgame_board.array)
+    for c in COLOURS:
+        assert board.piece_sets[c].to_mask() == midgame_board.piece_sets[c].to_mask()
+        assert sorted(board.get_valid_moves_for_colour(c).move_ids.tolist()) == sorted(
+            midgame_board.get_valid_moves_for_colour(c).move_ids.tolist()
+        )
+    # the other slot is untouched
+    assert arena.get_sequence(1) == 0
+
+
+@pytest.mark.unit
+def test_sequence_numbers(arena, midgame_board):
+    assert arena.publish(1, Board()) == 2
+    assert arena.publish(1, midgame_board, BoardStatesEnum.RED) == 4
+    assert arena.read(1)[0] == 4
+
+    # a slot left odd is being written, readers retry then give up
+    arena._slots[1]["sequence"] = 5
+    with pytest.raises(BoardArenaError):
+        arena.read(1, max_attempts=3)
+    arena._slots[1]["sequence"] = 6
+    sequence, cells, _, colour = arena.read(1)
+    assert (sequence, colour) == (6, BoardStatesEnum.RED)
+    np.testing.assert_array_equal(cells, midgame_board.array)
+
+
+@pytest.mark.unit
+def test_mismatched_boards_and_memory_are_rejected(arena):
+    with pytest.raises(BoardArenaError):
+        arena.publish(0, Board(14))
+
+    memory = shared_memory.SharedMemory(create=True, size=64)
+    try:
+        with pytest.raises(BoardArenaError):
+            BoardArena.attach(memory.name)
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+@pytest.mark.integration
+def test_read_from_another_process(arena, midgame_board):
+    arena.publish(1, midgame_board, BoardStatesEnum.YELLOW)
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        cells, piece_masks, colour, sequence = executor.submit(read_in_worker, arena.name, 1).result()
+
+    assert cells == midgame_board.array.astype(np.uint8).tobytes()
+    assert piece_masks == [midgame_board.piece_sets[c].to_mask() for c in COLOURS]
+    assert (colour, sequence) == (BoardStatesEnum.YELLOW.str_id, 2)
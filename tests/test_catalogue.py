@@ -0,0 +1,59 @@
+# Python Imports
+import numpy as np
+import pytest
+
+# Internal Imports
+from blokus.board_states import BoardStatesEnum
+from blokus.move import Move
+from blokus.pieces.catalogue import MOVE_ID_COUNT, PIECE_ORDER, decode_move_id, encode_move_id, get_piece_catalogue
+from blokus.pieces.piece_set import build_full_piece_set
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("placement", [(0, 0, 0, 0), (20, 7, 19, 19), (5, 3, 0, 17), (12, 1, 31, 31)])
+def test_move_id_round_trip(placement):
+    move_id = encode_move_id(*placement)
+    assert 0 <= move_id < MOVE_ID_COUNT
+    assert decode_move_id(move_id) == placement
+
+
+@pytest.mark.unit
+def test_move_id_round_trip_vectorised():
+    rng = np.random.default_rng(0)
+    piece_ids = rng.integers(0, len(PIECE_ORDER), 1000)
+    orientation_ids = rng.integers(0, 8, 1000)
+    rows, cols = rng.integers(0, 20, (2, 1000))
+    move_ids = encode_move_id(piece_ids, orientation_ids, rows, cols)
+    for decoded, expected in zip(decode_move_id(move_ids), (piece_ids, orientation_ids, rows, cols)):
+        np.testing.assert_array_equal(decoded, expected)
+
+
+@pytest.mark.unit
+def test_every_orientation_round_trips_through_moves():
+    catalogue = get_piece_catalogue()
+    for orientation in catalogue.orientations:
+        move_id = encode_move_id(orientation.piece_id, orientation.orientation_id, 3, 4)
+        move = Move.from_move_id(BoardStatesEnum.RED, move_id)
+        assert move.move_id == move_id
+        assert len(move.idxs) == orientation.size
+
+
+def generate_variants(binary_repr: np.ndarray) -> list[list[tuple[int, int]]]:
+    """the rotations and mirrors of a raw piece array, centred on the middle of the array as the pieces were"""
+    binary_repr = np.atleast_2d(binary_repr)
+    variants = []
+    for turns in range(4):
+        rotation = np.rot90(binary_repr, turns)
+        for variant in (rotation, np.fliplr(rotation)):
+            idxs = sorted(map(tuple, (np.argwhere(variant == 1) - len(variant) // 2).tolist()))
+            if idxs not in variants:
+                variants.append(idxs)
+    return sorted(variants)
+
+
+@pytest.mark.unit
+def test_variants_match_rotations_of_piece_arrays():
+    catalogue = get_piece_catalogue()
+    for piece in build_full_piece_set().pieces:
+        variants = sorted(sorted(map(tuple, variant)) for variant in catalogue.get_variants(piece.name))
+        assert variants == generate_variants(piece.base_binary_repr), piece.name
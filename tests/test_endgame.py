@@ -0,0 +1,69 @@
+# Python Imports
+import numpy as np
+import pytest
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.search.endgame import EndgameSolver
+from conftest import play_random_moves
+
+COLOURS = BoardStatesEnum.get_player_colours()
+
+# positions with few moves left, in each of them at least one colour passes before the game ends
+POSITIONS = [(2, 54, BoardStatesEnum.RED), (0, 52, BoardStatesEnum.RED), (1, 56, BoardStatesEnum.RED), (4, 52, BoardStatesEnum.BLUE)]
+
+
+def play_out(board: Board, side: int, passes: int = 0) -> tuple[int, ...]:
+    """max^n final scores of the rest of the game by exhaustive play out on copies of the board"""
+    if passes == len(COLOURS):
+        return tuple(int(score) for score in board.get_scores())
+    next_side = (side + 1) % len(COLOURS)
+    moves = list(board.get_valid_moves_for_colour(COLOURS[side]))
+    if not moves:
+        return play_out(board, next_side, passes + 1)
+
+    best_value = None
+    for move in moves:
+        child = board.copy()
+        child.play_move(move)
+        value = play_out(child, next_side)
+        if best_value is None or value[side] > best_value[side]:
+            best_value = value
+    return best_value
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("seed, plies, colour", POSITIONS)
+def test_solver_matches_exhaustive_play_out(seed, plies, colour):
+    board = play_random_moves(Board(), plies, seed)
+    array = board.array.copy()
+    side = COLOURS.index(colour)
+    values = {}
+    for move in board.get_valid_moves_for_colour(colour):
+        child = board.copy()
+        child.play_move(move)
+        values[move] = play_out(child, (side + 1) % len(COLOURS))
+
+    solver = EndgameSolver()
+    assert solver.should_solve(board)
+    result = solver.solve(board, colour)
+
+    assert result.exact
+    assert values[result.best_move][side] == max(value[side] for value in values.values())
+    assert result.scores == dict(zip(COLOURS, values[result.best_move]))
+    np.testing.assert_array_equal(board.array, array)
+
+
+@pytest.mark.unit
+def test_solver_without_moves():
+    board = play_random_moves(Board(), 50, seed=4)
+    result = EndgameSolver().solve(board, BoardStatesEnum.RED)
+    assert result.best_move is None and result.scores == {} and result.exact
+
+
+@pytest.mark.unit
+def test_solver_stops_at_its_node_budget(midgame_board):
+    result = EndgameSolver(node_budget=50).solve(midgame_board, BoardStatesEnum.RED)
+    assert not result.exact
+    assert result.nodes <= 51
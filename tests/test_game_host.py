@@ -0,0 +1,79 @@
+# Python Imports
+import asyncio
+
+import pytest
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.bots.random_bot import RandomBot
+from blokus.game import Game
+from blokus.game_host import GameHost
+from blokus.telemetry import RingBufferSink, TelemetryRecorder
+
+
+class RemoteRandomBot(RandomBot):
+    """Random bot awaited on the loop like a remote player"""
+
+    async def async_select_best_move(self, moves):
+        await asyncio.sleep(0)
+        return self.select_best_move(moves)
+
+
+def build_games(count: int, player_type: type, **kwargs) -> list[Game]:
+    games = []
+    for _ in range(count):
+        board = Board()
+        games.append(Game(board, [player_type(board, colour) for colour in BoardStatesEnum.get_player_colours()], **kwargs))
+    return games
+
+
+@pytest.mark.integration
+def test_local_boards_are_never_released():
+    games = build_games(3, RandomBot)
+    host = GameHost(max_cached_moves=0)
+    try:
+        rankings = asyncio.run(host.play_games(games))
+    finally:
+        host.close()
+
+    assert len(rankings) == 3 and all(game.is_finished for game in games)
+    assert host.metrics.finished_games == 3
+    assert host.metrics.released_boards == 0
+
+
+@pytest.mark.integration
+def test_remote_boards_are_released_and_rebuilt():
+    games = build_games(3, RemoteRandomBot)
+    host = GameHost(max_cached_moves=100)
+    try:
+        asyncio.run(host.play_games(games))
+    finally:
+        host.close()
+
+    assert all(game.is_finished for game in games)
+    assert host.metrics.released_boards > 0
+    # every move was validated when played, so released boards rebuilt valid moves correctly
+    assert all(len(game.board.move_list) > 40 for game in games)
+
+
+@pytest.mark.integration
+def test_hosted_games_record_telemetry():
+    recorder = TelemetryRecorder(RingBufferSink())
+    games = build_games(2, RandomBot, telemetry=recorder)
+    host = GameHost()
+    try:
+        asyncio.run(host.play_games(games))
+    finally:
+        host.close()
+    recorder.flush()
+
+    events = recorder.sink.events
+    for game_id, game in enumerate(games):
+        game_events = events[events["game"] == game_id]
+        # a played event per move and an elimination event per colour
+        assert (game_events["move_id"] >= 0).sum() == len(game.board.move_list)
+        assert game_events["eliminated"].sum() == len(BoardStatesEnum.get_player_colours())
+        assert sorted(game_events["move_id"][game_events["move_id"] >= 0].tolist()) == sorted(
+            move.move_id for move in game.board.move_list
+        )
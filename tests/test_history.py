@@ -0,0 +1,90 @@
+# Python Imports
+import random
+
+import numpy as np
+import pytest
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.history import GameHistory
+from conftest import play_random_moves
+
+COLOURS = BoardStatesEnum.get_player_colours()
+
+
+@pytest.fixture(scope="module")
+def played_board():
+    return play_random_moves(Board(), 120, seed=3)
+
+
+@pytest.fixture(scope="module")
+def states(played_board):
+    """array and piece masks after each ply, from replaying the moves"""
+    board = Board()
+    states = [(board.array.copy(), {colour: board.piece_sets[colour].to_mask() for colour in COLOURS})]
+    for move in played_board.move_list:
+        board.play_move(move)
+        states.append((board.array.copy(), {colour: board.piece_sets[colour].to_mask() for colour in COLOURS}))
+    return states
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("checkpoint_interval", [1, 5, 8, 64])
+def test_seek_matches_replay(played_board, states, checkpoint_interval):
+    history = GameHistory.from_board(played_board, checkpoint_interval)
+    assert len(history) == len(played_board.move_list)
+
+    # forwards, backwards and random jumps
+    rng = random.Random(0)
+    plies = list(range(len(history) + 1))
+    for ply in plies + plies[::-1] + [rng.randint(0, len(history)) for _ in range(100)]:
+        history.seek(ply)
+        array, masks = states[ply]
+        assert history.ply == ply
+        np.testing.assert_array_equal(history.array, array)
+        assert history.piece_masks == masks
+
+
+@pytest.mark.unit
+def test_step(played_board, states):
+    history = GameHistory.from_board(played_board)
+    history.seek(0)
+    history.step(5)
+    history.step(-2)
+    assert history.ply == 3
+    np.testing.assert_array_equal(history.array, states[3][0])
+
+
+@pytest.mark.unit
+def test_get_move(played_board):
+    history = GameHistory.from_board(played_board)
+    assert [history.get_move(ply) for ply in range(len(history))] == played_board.move_list
+
+
+@pytest.mark.unit
+def test_get_board(played_board, states):
+    history = GameHistory.from_board(played_board)
+    board = history.get_board(30)
+
+    replayed = Board()
+    for move in played_board.move_list[:30]:
+        replayed.play_move(move)
+    np.testing.assert_array_equal(board.array, states[30][0])
+    assert board.move_list == played_board.move_list[:30]
+    assert board.latest_move == played_board.move_list[29]
+    for colour in COLOURS:
+        assert sorted(board.get_valid_moves_for_colour(colour).move_ids.tolist()) == sorted(
+            replayed.get_valid_moves_for_colour(colour).move_ids.tolist()
+        )
+
+
+@pytest.mark.unit
+def test_seek_outside_history(played_board):
+    history = GameHistory.from_board(played_board)
+    with pytest.raises(IndexError):
+        history.seek(-1)
+    with pytest.raises(IndexError):
+        history.seek(len(history) + 1)
+    with pytest.raises(ValueError):
+        GameHistory(checkpoint_interval=0)
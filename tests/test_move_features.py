@@ -0,0 +1,82 @@
+# Python Imports
+import numpy as np
+import pytest
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.bots.corner_bot import CornerBot
+from blokus.bots.move_features import MoveFeatureEnum, get_move_features, get_move_sizes
+from blokus.move import Move
+
+COLOURS = BoardStatesEnum.get_player_colours()
+
+
+def get_new_origins(board: Board, colour: BoardStatesEnum, move: Move) -> set[tuple[int, int]]:
+    """origins the move opens for the colour, found on the board after it as CornerBot did per move"""
+    future_board = board.create_future_board_from_move(move)
+    corners = [idx for idx in move.idxs if future_board._check_if_idx_is_corner_of_colour(idx, colour)]
+    return {origin for corner in corners for origin in future_board._get_valid_origins_from_corner(corner, colour)}
+
+
+def get_corner_score(board: Board, colour: BoardStatesEnum, move: Move) -> float:
+    """score of a move as CornerBot scored a single move"""
+    center = board.dimension // 2
+    distance_from_center = min(((center - row) ** 2 + (center - col) ** 2) ** 0.5 for row, col in move.idxs)
+    rows = [row for row, _ in move.idxs]
+    cols = [col for _, col in move.idxs]
+    span = max(rows) - min(rows) + max(cols) - min(cols)
+    location_multiplier = 1 - (distance_from_center / board.dimension) ** 2
+    span_multiplier = 1 + (span / 10) ** 0.5
+    return (len(get_new_origins(board, colour, move)) + len(move.idxs)) * location_multiplier * span_multiplier
+
+
+def get_moves(board: Board, colour: BoardStatesEnum) -> list[Move]:
+    return list(board.get_valid_moves_for_colour(colour))[:120]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("colour", COLOURS)
+def test_corner_scores_match_per_move_scores(midgame_board, colour):
+    moves = get_moves(midgame_board, colour)
+    player = CornerBot(midgame_board, colour)
+    scores = player._get_scores_from_features(get_move_features(midgame_board, colour, moves))
+
+    expected = [get_corner_score(midgame_board, colour, move) for move in moves]
+    np.testing.assert_allclose(scores, expected)
+    if moves:
+        assert player.select_best_move(moves) in [move for move, score in zip(moves, expected) if score == max(expected)]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("colour", COLOURS)
+def test_features_match_per_move_features(midgame_board, colour):
+    moves = get_moves(midgame_board, colour)
+    features = get_move_features(midgame_board, colour, moves)
+    opponents = [opponent for opponent in COLOURS if opponent != colour]
+    opponent_anchors = [midgame_board.get_anchor_mask(opponent) for opponent in opponents]
+    opponent_ids = {opponent.int_id for opponent in opponents}
+    dimension = midgame_board.dimension
+
+    np.testing.assert_array_equal(get_move_sizes(moves), [len(move.idxs) for move in moves])
+    for move, move_features in zip(moves, features):
+        assert move_features[MoveFeatureEnum.SIZE] == len(move.idxs)
+        assert move_features[MoveFeatureEnum.NEW_ANCHORS] == len(get_new_origins(midgame_board, colour, move))
+
+        center = dimension // 2
+        distances = [((row - center) ** 2 + (col - center) ** 2) ** 0.5 for row, col in move.idxs]
+        assert move_features[MoveFeatureEnum.MEAN_CENTRE_DISTANCE] == pytest.approx(sum(distances) / len(distances))
+
+        blocked = sum(int(anchors[row, col]) for anchors in opponent_anchors for row, col in move.idxs)
+        assert move_features[MoveFeatureEnum.OPPONENT_ANCHORS_BLOCKED] == blocked
+
+        adjacent = sum(
+            any(
+                0 <= row + row_step < dimension
+                and 0 <= col + col_step < dimension
+                and midgame_board.array[row + row_step, col + col_step] in opponent_ids
+                for row_step, col_step in ((-1, 0), (1, 0), (0, -1), (0, 1))
+            )
+            for row, col in move.idxs
+        )
+        assert move_features[MoveFeatureEnum.OPPONENT_ADJACENT_CELLS] == adjacent
@@ -0,0 +1,34 @@
+# Python Imports
+import pytest
+
+# Internal Imports
+from blokus.search.move_ordering import TranspositionTable
+
+
+@pytest.mark.unit
+def test_eviction_at_equal_depth_keeps_the_newest_half():
+    table = TranspositionTable(max_entries=10)
+    for key in range(11):
+        table.store(key, 3, 0.0, TranspositionTable.EXACT, None)
+
+    assert len(table) == 6
+    assert all(table.probe(key) is not None for key in range(5, 11))
+
+
+@pytest.mark.unit
+def test_eviction_drops_the_shallowest_first():
+    table = TranspositionTable(max_entries=4)
+    for key, depth in enumerate([1, 5, 2, 5]):
+        table.store(key, depth, 0.0, TranspositionTable.EXACT, None)
+    table.store(4, 1, 0.0, TranspositionTable.EXACT, None)
+
+    assert [key for key in range(5) if table.probe(key) is not None] == [1, 3, 4]
+
+
+@pytest.mark.unit
+def test_store_keeps_the_deeper_result():
+    table = TranspositionTable()
+    table.store("position", 4, 1.0, TranspositionTable.EXACT, None)
+    table.store("position", 2, -1.0, TranspositionTable.EXACT, None)
+
+    assert table.probe("position").value == 1.0
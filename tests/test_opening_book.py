@@ -0,0 +1,116 @@
+# Python Imports
+import random
+
+import numpy as np
+import pytest
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.bots.bot_enums import BotEnum
+from blokus.opening_book import OpeningBook, OpeningBookBuilder
+from blokus.pieces.piece_set import PieceSet
+from blokus.self_play import SelfPlayRunner
+
+COLOURS = BoardStatesEnum.get_player_colours()
+MAX_PLIES = 10
+
+
+def copy_piece_sets(board: Board, colours=COLOURS) -> dict[BoardStatesEnum, PieceSet]:
+    """piece sets of the board, the piece set of each colour given to the matching colour of `colours`"""
+    return {colours[index]: PieceSet(pieces=list(board.piece_sets[colour].pieces)) for index, colour in enumerate(COLOURS)}
+
+
+def get_book_positions(records) -> list[tuple[Board, BoardStatesEnum]]:
+    """positions of the records in the book once every colour has played, the board is copied"""
+    positions = []
+    for record in records:
+        board = Board()
+        for ply, move in enumerate(record.get_moves()[:MAX_PLIES]):
+            # the first move of each colour is tied to its starting corner, which is not symmetric
+            if ply >= len(COLOURS):
+                positions.append((Board.from_array(board.array.copy(), copy_piece_sets(board)), move.colour))
+            board.play_move(move)
+    return positions
+
+
+@pytest.fixture(scope="module")
+def records():
+    return SelfPlayRunner([BotEnum.RANDOM, BotEnum.GREEDY], seed=3).run(3)
+
+
+@pytest.fixture(scope="module")
+def book(records) -> OpeningBook:
+    builder = OpeningBookBuilder(max_plies=MAX_PLIES, min_count=1)
+    for record in records:
+        builder.add_record(record)
+    return builder.build()
+
+
+@pytest.mark.integration
+def test_runner_draws_bots_without_seeding_random_module():
+    state = random.getstate()
+    runners = [SelfPlayRunner([BotEnum.GREEDY, BotEnum.CORNER], seed=1) for _ in range(2)]
+    assert random.getstate() == state
+
+    # the bots draw from the random module between the games of the runners
+    assert runners[0].play_game().bots == runners[1].play_game().bots
+
+
+@pytest.mark.integration
+def test_records_round_trip(records, tmp_path):
+    path = tmp_path / "records.jsonl"
+    SelfPlayRunner.save_records(records, path)
+
+    assert SelfPlayRunner.load_records(path) == records
+
+
+@pytest.mark.integration
+def test_book_move_is_legal_in_every_book_position(records, book):
+    positions = get_book_positions(records)
+    assert positions
+    for board, colour in positions:
+        move = book.lookup(board, colour)
+        assert move is not None
+        assert move.colour == colour
+        assert board.validate_move(move)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("turns", [1, 2, 3])
+def test_book_move_is_legal_on_rotated_positions(records, book, turns):
+    for board, colour in get_book_positions(records):
+        rotated = Board.from_array(np.rot90(board.array, turns).copy(), copy_piece_sets(board))
+        move = book.lookup(rotated, colour)
+        assert move is not None
+        assert rotated.validate_move(move)
+
+
+@pytest.mark.integration
+def test_book_move_is_legal_on_relabelled_positions(records, book):
+    # every colour takes the place of the next colour in the turn order
+    lookup = np.zeros(len(BoardStatesEnum), dtype=np.uint8)
+    for index, colour in enumerate(COLOURS):
+        lookup[colour.int_id] = COLOURS[(index + 1) % len(COLOURS)].int_id
+    shifted_colours = COLOURS[1:] + COLOURS[:1]
+
+    for board, colour in get_book_positions(records):
+        relabelled = Board.from_array(lookup[board.array], copy_piece_sets(board, shifted_colours))
+        relabelled_colour = shifted_colours[COLOURS.index(colour)]
+        move = book.lookup(relabelled, relabelled_colour)
+        assert move is not None
+        assert move.colour == relabelled_colour
+        assert relabelled.validate_move(move)
+
+
+@pytest.mark.unit
+def test_book_round_trip_and_misses(records, book, tmp_path, random_board):
+    path = tmp_path / "book.npy"
+    book.save(path)
+    loaded = OpeningBook.load(path)
+    assert len(loaded) == len(book)
+
+    for board, colour in get_book_positions(records):
+        assert loaded.lookup(board, colour) == book.lookup(board, colour)
+    assert loaded.lookup(random_board(40), BoardStatesEnum.RED) is None
+    assert OpeningBookBuilder().build().lookup(Board(), BoardStatesEnum.RED) is None
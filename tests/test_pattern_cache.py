@@ -0,0 +1,155 @@
+# Python Imports
+import numpy as np
+import pytest
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.pattern_cache import WINDOW_REACH, PatternCache, get_fitting_piece_masks, get_windows
+from blokus.pieces.catalogue import PIECE_ORDER, decode_move_id, encode_move_id, get_piece_catalogue
+
+COLOURS = BoardStatesEnum.get_player_colours()
+
+
+def get_origins(board: Board, colour: BoardStatesEnum) -> list[tuple[int, int]]:
+    if not (board.array == colour.int_id).any():
+        return [corner for corner in board.corner_idxs if not board.array[corner]]
+    return [tuple(idx) for idx in np.argwhere(board.get_anchor_mask(colour)).tolist()]
+
+
+def find_move_ids(blocked: np.ndarray, piece_mask: int, origin: tuple[int, int]) -> set[int]:
+    """every variant of the remaining pieces placed with its pivot on the origin, see `PieceOrientation`,
+    that covers no blocked cell"""
+    dimension = len(blocked)
+    move_ids = set()
+    for orientation in get_piece_catalogue().orientations:
+        if not piece_mask >> orientation.piece_id & 1:
+            continue
+        for row_offset, col_offset in orientation.pivots.tolist():
+            top, left = origin[0] - row_offset, origin[1] - col_offset
+            cells = orientation.offsets + (top, left)
+            if (cells < 0).any() or (cells >= dimension).any() or blocked[cells[:, 0], cells[:, 1]].any():
+                continue
+            move_ids.add(encode_move_id(orientation.piece_id, orientation.orientation_id, top, left))
+    return move_ids
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("plies", [0, 12, 40, 80])
+def test_cached_moves_match_brute_force(random_board, plies):
+    board = random_board(plies, seed=plies)
+    cache = PatternCache()
+    for colour in COLOURS:
+        blocked = board.get_forbidden_mask(colour)
+        piece_mask = board.piece_sets[colour].to_mask()
+        origins = get_origins(board, colour)
+        windows, _ = get_windows(blocked, origins)
+        for window, origin in zip(windows, origins):
+            move_ids = cache.get_move_ids(window, piece_mask, origin).tolist()
+            assert len(move_ids) == len(set(move_ids))
+            assert set(move_ids) == find_move_ids(blocked, piece_mask, origin)
+
+
+@pytest.mark.unit
+def test_board_moves_are_valid(midgame_board):
+    for colour in COLOURS:
+        moves = midgame_board.get_valid_moves_for_colour(colour)
+        assert all(midgame_board.validate_move(move) for move in moves)
+
+
+@pytest.mark.unit
+def test_moves_are_selected_by_piece_mask(midgame_board):
+    cache = PatternCache()
+    blocked = midgame_board.get_forbidden_mask(BoardStatesEnum.RED)
+    origins = get_origins(midgame_board, BoardStatesEnum.RED)
+    (window,), _ = get_windows(blocked, origins[:1])
+
+    all_move_ids = cache.get_move_ids(window, (1 << 21) - 1, origins[0])
+    for piece_id in set(decode_move_id(all_move_ids)[0].tolist()):
+        move_ids = cache.get_move_ids(window, 1 << piece_id, origins[0])
+        assert len(move_ids) and (decode_move_id(move_ids)[0] == piece_id).all()
+        assert np.isin(move_ids, all_move_ids).all()
+
+
+@pytest.mark.unit
+def test_hits_misses_and_eviction():
+    blocked = np.zeros((20, 20), dtype=bool)
+    origins = [(0, 0), (0, 10), (10, 10)]
+    windows, _ = get_windows(blocked, origins)
+    assert len(set(windows)) == 3
+
+    cache = PatternCache(capacity=2)
+    assert cache.hit_rate == 0.0
+    cache.get_move_ids(windows[0], 1, origins[0])
+    cache.get_move_ids(windows[1], 1, origins[1])
+    cache.get_move_ids(windows[0], 1, origins[0])
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # the least recently used window is evicted
+    cache.get_move_ids(windows[2], 1, origins[2])
+    assert len(cache) == 2
+    cache.get_move_ids(windows[0], 1, origins[0])
+    assert (cache.hits, cache.misses) == (2, 3)
+    cache.get_move_ids(windows[1], 1, origins[1])
+    assert (cache.hits, cache.misses) == (2, 4)
+    assert cache.hit_rate == pytest.approx(2 / 6)
+
+    cache.clear()
+    assert len(cache) == 0 and (cache.hits, cache.misses) == (0, 0)
+
+
+@pytest.mark.unit
+def test_shared_windows_give_the_same_moves_at_any_origin():
+    blocked = np.zeros((20, 20), dtype=bool)
+    windows, _ = get_windows(blocked, [(10, 10), (12, 8)])
+    assert windows[0] == windows[1]
+
+    cache = PatternCache()
+    moves = cache.get_move_ids(windows[0], (1 << 21) - 1, (10, 10))
+    shifted = cache.get_move_ids(windows[1], (1 << 21) - 1, (12, 8))
+    assert cache.hits == 1
+    np.testing.assert_array_equal(shifted - moves, encode_move_id(0, 0, 12, 8) - encode_move_id(0, 0, 10, 10))
+
+
+@pytest.mark.unit
+def test_free_space_of_a_pocket():
+    # a pocket of 3 cells along the top edge, closed off by a wall
+    blocked = np.zeros((20, 20), dtype=bool)
+    blocked[1, :3] = True
+    blocked[0, 3] = True
+    windows, free_spaces = get_windows(blocked, [(0, 0), (0, 2), (10, 10)])
+    assert free_spaces[:2] == [3, 3]
+    assert free_spaces[2] == 2 * WINDOW_REACH * (WINDOW_REACH + 1) + 1
+
+    # free cells cut off from the pocket do not change its window
+    blocked[5:, 5:] = True
+    assert get_windows(blocked, [(0, 0)])[0][0] == windows[0]
+
+    # a blocked origin has no free space
+    assert get_windows(blocked, [(1, 1)])[1] == [0]
+
+
+@pytest.mark.unit
+def test_fitting_piece_masks():
+    fitting_piece_masks = get_fitting_piece_masks()
+    piece_sizes = [get_piece_catalogue().get_orientations(piece_type)[0].size for piece_type in PIECE_ORDER]
+
+    assert fitting_piece_masks[0] == 0
+    assert fitting_piece_masks[-1] == (1 << len(PIECE_ORDER)) - 1
+    for free_space, mask in enumerate(fitting_piece_masks):
+        assert mask == sum(1 << piece_id for piece_id, size in enumerate(piece_sizes) if size <= free_space)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("plies", [24, 60, 80])
+def test_free_space_never_prunes_a_move(random_board, plies):
+    board = random_board(plies, seed=plies)
+    fitting_piece_masks = get_fitting_piece_masks()
+    cache = PatternCache()
+    for colour in COLOURS:
+        origins = get_origins(board, colour)
+        windows, free_spaces = get_windows(board.get_forbidden_mask(colour), origins)
+        for window, free_space, origin in zip(windows, free_spaces, origins):
+            move_ids = cache.get_move_ids(window, (1 << len(PIECE_ORDER)) - 1, origin)
+            pruned = cache.get_move_ids(window, fitting_piece_masks[free_space], origin)
+            np.testing.assert_array_equal(move_ids, pruned)
@@ -0,0 +1,104 @@
+# Python Imports
+import random
+
+import pytest
+
+# Internal Imports
+from blokus.board_states import BoardStatesEnum
+from blokus.bots.greedy_bot import GreedyBot
+from blokus.bots.search_bot import SearchBot
+from blokus.player.api_player import APIPlayer
+from blokus.player.ponder import Ponderer, predict_biggest_move
+
+
+def predict_line(board, colour, seed):
+    """the replies the first line pondered with the seed predicts"""
+    rng = random.Random(seed)
+    board = board.copy()
+    colours = BoardStatesEnum.get_player_colours()
+    line = []
+    for offset in range(1, len(colours)):
+        moves = board.get_valid_moves_for_colour(colours[(colours.index(colour) + offset) % len(colours)])
+        if moves:
+            line.append(predict_biggest_move(moves, rng))
+            board.play_move(line[-1])
+    return line
+
+
+def wait_for(ponderer: Ponderer):
+    ponderer._executor.submit(int).result()
+
+
+@pytest.mark.unit
+def test_copy_for_pondering_keeps_configuration(midgame_board):
+    player = APIPlayer(midgame_board, BoardStatesEnum.RED, "http://127.0.0.1:1/move", deadline=2, retries=0)
+    player.enable_pondering()
+    pondered_board = midgame_board.copy()
+    try:
+        copy = player.copy_for_pondering(pondered_board)
+    finally:
+        player.disable_pondering()
+
+    assert copy.board is pondered_board and player.board is midgame_board
+    assert (copy.address, copy.deadline, copy.retries) == (player.address, player.deadline, player.retries)
+    assert copy.ponderer is None
+
+
+@pytest.mark.unit
+def test_search_bot_ponders_with_its_own_search(midgame_board):
+    player = SearchBot(midgame_board, BoardStatesEnum.RED, time_budget=0.5, max_depth=3)
+    copy = player.copy_for_pondering(midgame_board.copy())
+
+    assert copy.search is not player.search
+    assert copy.search.transposition_table is not player.search.transposition_table
+    assert copy.search.move_orderer is not player.search.move_orderer
+    assert (copy.search.time_budget, copy.search.max_depth) == (0.5, 3)
+
+
+@pytest.mark.unit
+def test_ponder_position_selects_a_valid_move(midgame_board):
+    player = GreedyBot(midgame_board, BoardStatesEnum.RED)
+    board = midgame_board.copy()
+    move = player.ponder_position(board)
+
+    assert move in board.get_valid_moves_for_colour(BoardStatesEnum.RED)
+    assert player.board is midgame_board
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("processes", [False, True])
+def test_pondered_move_is_reused_without_touching_random(midgame_board, processes):
+    player = GreedyBot(midgame_board, BoardStatesEnum.RED)
+    player.enable_pondering(processes=processes, max_lines=1, seed=3)
+    if processes:
+        # the worker process draws from its own random
+        state = random.getstate()
+    try:
+        player.ponderer.start(midgame_board)
+        wait_for(player.ponderer)
+        if processes:
+            assert random.getstate() == state
+
+        for move in predict_line(midgame_board, BoardStatesEnum.RED, seed=3):
+            midgame_board.play_move(move)
+            player.ponderer.notify(move)
+        move = player.ponderer.take(midgame_board.get_valid_moves_for_colour(BoardStatesEnum.RED))
+        hits = player.ponderer.hits
+    finally:
+        player.disable_pondering()
+
+    assert hits == 1
+    assert move in midgame_board.get_valid_moves_for_colour(BoardStatesEnum.RED)
+    assert player.ponderer is None
+
+
+@pytest.mark.unit
+def test_predictions_do_not_draw_from_random(midgame_board):
+    ponderer = Ponderer(BoardStatesEnum.RED, lambda board: None, seed=0)
+    state = random.getstate()
+    try:
+        ponderer.start(midgame_board)
+        wait_for(ponderer)
+    finally:
+        ponderer.close()
+    assert random.getstate() == state
@@ -0,0 +1,119 @@
+# Python Imports
+import time
+
+import numpy as np
+import pytest
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.search.evaluators import ScoreEvaluator
+from blokus.search.multiplayer_search import BaseMultiplayerSearch, MaxNSearch, ParanoidSearch
+from conftest import play_random_moves
+
+COLOURS = BoardStatesEnum.get_player_colours()
+
+# late game positions and the colour to search for, the colour after green is out of moves at 48 plies of seed 3
+POSITIONS = [(3, 48, BoardStatesEnum.RED), (3, 48, BoardStatesEnum.GREEN), (1, 56, BoardStatesEnum.BLUE)]
+
+
+def get_moves(board: Board, side: int) -> tuple[int, list]:
+    """the next side able to move and its moves, colours without moves pass"""
+    for offset in range(len(COLOURS)):
+        next_side = (side + offset) % len(COLOURS)
+        moves = list(board.get_valid_moves_for_colour(COLOURS[next_side]))
+        if moves:
+            return next_side, moves
+    return side, []
+
+
+def get_children(board: Board, moves: list) -> list[Board]:
+    children = []
+    for move in moves:
+        child = board.copy()
+        child.play_move(move)
+        children.append(child)
+    return children
+
+
+def minimax(board: Board, side: int, root_side: int, depth: int) -> float:
+    """paranoid value of the position for the root colour by exhaustive search"""
+    evaluator = ScoreEvaluator()
+    if depth == 0:
+        return evaluator.evaluate(board, COLOURS[root_side])
+    side, moves = get_moves(board, side)
+    if not moves:
+        return evaluator.evaluate(board, COLOURS[root_side])
+    values = [minimax(child, (side + 1) % len(COLOURS), root_side, depth - 1) for child in get_children(board, moves)]
+    return max(values) if side == root_side else min(values)
+
+
+def max_n(board: Board, side: int, depth: int) -> tuple[float, ...]:
+    """max^n value of the position by exhaustive search"""
+    evaluator = ScoreEvaluator()
+    if depth == 0:
+        return evaluator.evaluate_all(board)
+    side, moves = get_moves(board, side)
+    if not moves:
+        return evaluator.evaluate_all(board)
+    values = [max_n(child, (side + 1) % len(COLOURS), depth - 1) for child in get_children(board, moves)]
+    return max(values, key=lambda value: value[side])
+
+
+def get_state(board: Board) -> tuple:
+    return board.array.copy(), [board.piece_sets[colour].to_mask() for colour in COLOURS], len(board.move_list)
+
+
+@pytest.mark.unit
+def test_base_search_is_abstract():
+    with pytest.raises(TypeError):
+        BaseMultiplayerSearch()
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("depth", [1, 2])
+@pytest.mark.parametrize("seed, plies, colour", POSITIONS)
+def test_paranoid_search_matches_minimax(seed, plies, colour, depth):
+    board = play_random_moves(Board(), plies, seed)
+    state = get_state(board)
+    root_side = COLOURS.index(colour)
+    moves = list(board.get_valid_moves_for_colour(colour))
+    values = {move: minimax(child, (root_side + 1) % len(COLOURS), root_side, depth - 1) for move, child in zip(moves, get_children(board, moves))}
+
+    result = ParanoidSearch(ScoreEvaluator(), time_budget=60, max_depth=depth).search(board, colour)
+    assert result.depth == depth
+    assert result.value == max(values.values())
+    assert values[result.best_move] == result.value
+    np.testing.assert_array_equal(get_state(board)[0], state[0])
+    assert get_state(board)[1:] == state[1:]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("depth", [1, 2])
+@pytest.mark.parametrize("seed, plies, colour", POSITIONS)
+def test_max_n_search_matches_max_n(seed, plies, colour, depth):
+    board = play_random_moves(Board(), plies, seed)
+    root_side = COLOURS.index(colour)
+    moves = list(board.get_valid_moves_for_colour(colour))
+    values = {move: max_n(child, (root_side + 1) % len(COLOURS), depth - 1)[root_side] for move, child in zip(moves, get_children(board, moves))}
+
+    result = MaxNSearch(ScoreEvaluator(), time_budget=60, max_depth=depth).search(board, colour)
+    assert result.depth == depth
+    assert result.value == max(values.values())
+    assert values[result.best_move] == result.value
+
+
+@pytest.mark.integration
+def test_iterative_deepening_respects_the_deadline(midgame_board):
+    state = get_state(midgame_board)
+    search = ParanoidSearch(time_budget=0.3, max_depth=20)
+    start = time.perf_counter()
+    result = search.search(midgame_board, BoardStatesEnum.RED)
+    elapsed = time.perf_counter() - start
+
+    # the budget is checked at every node, so it is only overrun by a single node
+    assert elapsed < 0.3 + 0.2
+    assert result.depth < 20
+    assert result.best_move in midgame_board.get_valid_moves_for_colour(BoardStatesEnum.RED)
+    np.testing.assert_array_equal(midgame_board.array, state[0])
+    assert get_state(midgame_board)[1:] == state[1:]
@@ -0,0 +1,66 @@
+# Python Imports
+import pickle
+
+import numpy as np
+import pytest
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+
+
+def assert_same_board(board: Board, other: Board):
+    colours = BoardStatesEnum.get_player_colours()
+    np.testing.assert_array_equal(board.array, other.array)
+    assert other.move_list == board.move_list
+    assert other.latest_move == board.latest_move
+    for colour in colours:
+        assert other.piece_sets[colour].to_mask() == board.piece_sets[colour].to_mask()
+        assert sorted(other.get_valid_moves_for_colour(colour).move_ids.tolist()) == sorted(
+            board.get_valid_moves_for_colour(colour).move_ids.tolist()
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("include_valid_moves", [False, True])
+def test_bytes_round_trip(midgame_board, include_valid_moves):
+    buffer = midgame_board.to_bytes(include_valid_moves)
+    board = Board.from_buffer(buffer)
+    assert_same_board(midgame_board, board)
+    assert board.array.dtype == midgame_board.array.dtype
+
+
+@pytest.mark.unit
+def test_empty_board_round_trip():
+    assert_same_board(Board(), Board.from_buffer(Board().to_bytes()))
+
+
+@pytest.mark.unit
+def test_writable_buffer_is_shared(midgame_board):
+    buffer = bytearray(midgame_board.to_bytes())
+    board = Board.from_buffer(buffer)
+    assert board.array.dtype == np.uint8
+    board.play_move(board.get_valid_moves_for_colour(BoardStatesEnum.RED)[0])
+
+    np.testing.assert_array_equal(Board.from_buffer(bytes(buffer)).array, board.array)
+
+
+@pytest.mark.unit
+def test_malformed_buffer_is_rejected(midgame_board):
+    with pytest.raises(ValueError):
+        Board.from_buffer(b"\x00" * 4)
+    with pytest.raises(ValueError):
+        Board.from_buffer(b"\x00" + midgame_board.to_bytes()[1:])
+
+
+@pytest.mark.unit
+def test_pickle_round_trip(midgame_board):
+    board = pickle.loads(pickle.dumps(midgame_board))
+    assert_same_board(midgame_board, board)
+    assert board.array.dtype == midgame_board.array.dtype
+
+    # the unpickled board keeps playing like the original
+    move = midgame_board.get_valid_moves_for_colour(BoardStatesEnum.GREEN)[0]
+    midgame_board.play_move(move)
+    board.play_move(move)
+    assert_same_board(midgame_board, board)
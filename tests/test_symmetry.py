@@ -0,0 +1,74 @@
+# Python Imports
+import numpy as np
+import pytest
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.pieces.piece_set import PieceSet
+from blokus.symmetry import canonicalise, get_position_key, transform_move
+
+COLOURS = BoardStatesEnum.get_player_colours()
+
+
+def copy_piece_sets(board: Board, colours=COLOURS) -> dict[BoardStatesEnum, PieceSet]:
+    """piece sets of the board, the piece set of each colour given to the matching colour of `colours`"""
+    return {colours[index]: PieceSet(pieces=list(board.piece_sets[colour].pieces)) for index, colour in enumerate(COLOURS)}
+
+
+@pytest.fixture
+def board(random_board):
+    return random_board(40, seed=5)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("transpose", [False, True])
+@pytest.mark.parametrize("turns", [0, 1, 2, 3])
+def test_key_is_invariant_under_board_symmetries(board, turns, transpose):
+    array = np.rot90(board.array.T if transpose else board.array, turns).copy()
+    transformed = Board.from_array(array, copy_piece_sets(board))
+
+    assert get_position_key(transformed, BoardStatesEnum.RED)[0] == get_position_key(board, BoardStatesEnum.RED)[0]
+
+
+@pytest.mark.unit
+def test_key_is_invariant_under_colour_relabelling(board):
+    # every colour takes the place of the next colour in the turn order
+    lookup = np.zeros(len(BoardStatesEnum), dtype=np.uint8)
+    for index, colour in enumerate(COLOURS):
+        lookup[colour.int_id] = COLOURS[(index + 1) % len(COLOURS)].int_id
+    shifted_colours = COLOURS[1:] + COLOURS[:1]
+    relabelled = Board.from_array(lookup[board.array], copy_piece_sets(board, shifted_colours))
+
+    assert get_position_key(relabelled, BoardStatesEnum.BLUE)[0] == get_position_key(board, BoardStatesEnum.RED)[0]
+    assert get_position_key(relabelled, BoardStatesEnum.RED)[0] != get_position_key(board, BoardStatesEnum.RED)[0]
+
+
+@pytest.mark.unit
+def test_key_depends_on_pieces(board):
+    piece_sets = copy_piece_sets(board)
+    piece_sets[BoardStatesEnum.GREEN].pieces.pop()
+    changed = Board.from_array(board.array.copy(), piece_sets)
+
+    assert get_position_key(changed, BoardStatesEnum.RED)[0] != get_position_key(board, BoardStatesEnum.RED)[0]
+
+
+@pytest.mark.unit
+def test_canonical_moves_map_between_symmetric_boards(board):
+    rotated = Board.from_array(np.rot90(board.array).copy(), copy_piece_sets(board))
+    canonical = canonicalise(board, BoardStatesEnum.RED)
+    rotated_canonical = canonicalise(rotated, BoardStatesEnum.RED)
+    np.testing.assert_array_equal(canonical.array, rotated_canonical.array)
+
+    for move in board.get_valid_moves_for_colour(BoardStatesEnum.RED)[:20]:
+        canonical_move = canonical.to_canonical_move(move)
+        assert canonical.from_canonical_move(canonical_move) == move
+        assert rotated.validate_move(rotated_canonical.from_canonical_move(canonical_move))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("transform", range(8))
+def test_transform_move_inverse(board, transform):
+    for move in board.get_valid_moves_for_colour(BoardStatesEnum.RED)[:20]:
+        mapped = transform_move(move, transform, board.dimension)
+        assert transform_move(mapped, transform, board.dimension, inverse=True) == move
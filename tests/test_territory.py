@@ -0,0 +1,59 @@
+# Python Imports
+import random
+
+import numpy as np
+import pytest
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.territory import Territory
+
+COLOURS = BoardStatesEnum.get_player_colours()
+
+
+def assert_matches_recompute(territory: Territory, board: Board):
+    expected = Territory(board)
+    np.testing.assert_array_equal(territory.reachable, expected.reachable)
+    np.testing.assert_array_equal(territory.get_exclusive_counts(), expected.get_exclusive_counts())
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_incremental_updates_match_recompute(seed):
+    rng = random.Random(seed)
+    board = Board()
+    territory = Territory(board)
+    pushed = 0
+    for _ in range(150):
+        # mostly play, sometimes take back a few moves as search does
+        if pushed and rng.random() < 0.2:
+            for _ in range(rng.randint(1, min(pushed, 3))):
+                board.pop_move()
+                pushed -= 1
+        else:
+            moves = board.get_valid_moves_for_colour(COLOURS[len(board.move_list) % len(COLOURS)])
+            if not moves:
+                moves = next((moves for colour in COLOURS if (moves := board.get_valid_moves_for_colour(colour))), None)
+                if moves is None:
+                    break
+            board.push_move(moves[rng.randrange(len(moves))])
+            pushed += 1
+        territory.update(board)
+        assert_matches_recompute(territory, board)
+    assert len(board.move_list) > 30
+
+
+@pytest.mark.unit
+def test_several_moves_in_one_update(random_board, midgame_board):
+    board = Board()
+    territory = Territory(board)
+    for move in midgame_board.move_list:
+        board.play_move(move)
+    territory.update(board)
+    assert_matches_recompute(territory, board)
+
+    # a board that does not continue the tracked one is recomputed
+    other_board = random_board(30, seed=1)
+    territory.update(other_board)
+    assert_matches_recompute(territory, other_board)
@@ -0,0 +1,105 @@
+# Python Imports
+import tracemalloc
+
+import numpy as np
+import pytest
+
+# Internal Imports
+from blokus.board import Board
+from blokus.board_states import BoardStatesEnum
+from blokus.move_order import MoveOrderEnum
+from blokus.pieces.piece_names import PieceNameEnum
+from blokus.pieces.catalogue import decode_move_id, get_piece_catalogue
+from blokus.pieces.piece_set import PieceSet
+from blokus.valid_moves import ValidMoveStore
+from conftest import play_random_moves
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("piece", [PieceNameEnum.I1, PieceNameEnum.Z4, None])
+@pytest.mark.parametrize("size", [None, 4, 5])
+@pytest.mark.parametrize("touching", [None, [(9, 9), (10, 10), (0, 19)]])
+def test_indexed_queries_match_filtering(midgame_board, piece, size, touching):
+    colour = BoardStatesEnum.BLUE
+    expected = [
+        move
+        for move in midgame_board.get_valid_moves_for_colour(colour)
+        if (piece is None or move.piece_type == piece)
+        and (size is None or len(move.idxs) == size)
+        and (touching is None or set(move.idxs) & set(touching))
+    ]
+
+    assert list(midgame_board.valid_moves(colour, piece=piece, size=size, touching=touching)) == expected
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("seed", [0, 1])
+def test_incremental_valid_moves_match_rebuild(seed):
+    colours = BoardStatesEnum.get_player_colours()
+    board = Board()
+    board.enable_verification(1.0, seed=seed)
+    play_random_moves(board, 84, seed)
+
+    assert board.verification_checks > 0
+    assert board.verification_failures == 0
+    piece_sets = {colour: PieceSet(pieces=list(board.piece_sets[colour].pieces)) for colour in colours}
+    rebuilt = Board.from_array(board.array, piece_sets)
+    for colour in colours:
+        assert sorted(board.get_valid_moves_for_colour(colour).move_ids.tolist()) == sorted(
+            rebuilt.get_valid_moves_for_colour(colour).move_ids.tolist()
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("order", list(MoveOrderEnum))
+@pytest.mark.parametrize("released", [False, True])
+@pytest.mark.parametrize("plies", [2, 12, 40])
+def test_iter_valid_moves_match_valid_moves(random_board, order, released, plies):
+    board = random_board(plies)
+    piece_sizes = {orientation.piece_id: orientation.size for orientation in get_piece_catalogue().orientations}
+    for colour in BoardStatesEnum.get_player_colours():
+        valid_moves = board.get_valid_moves_for_colour(colour)
+        iterated = board.copy()
+        if released:
+            iterated.release_valid_moves()
+
+        move_ids = [move.move_id for move in iterated.iter_valid_moves(colour, order)]
+        assert len(move_ids) == len(set(move_ids))
+        assert sorted(move_ids) == sorted(valid_moves.move_ids.tolist())
+        if order == MoveOrderEnum.LARGEST_FIRST:
+            sizes = [piece_sizes[piece_id] for piece_id in decode_move_id(np.array(move_ids, dtype=np.int64))[0].tolist()]
+            assert sizes == sorted(sizes, reverse=True)
+        assert iterated.has_valid_move(colour) == bool(len(valid_moves))
+
+
+@pytest.mark.unit
+def test_store_reuses_freed_slots_and_selects_pieces(midgame_board):
+    move_ids = midgame_board.get_valid_moves_for_colour(BoardStatesEnum.BLUE).move_ids
+    store = ValidMoveStore.from_move_ids(move_ids)
+    piece_ids = decode_move_id(move_ids)[0]
+    removed_piece = int(piece_ids[0])
+
+    store.remove_piece(removed_piece)
+    assert len(store) == (piece_ids != removed_piece).sum()
+    assert not len(store.select([removed_piece]))
+    # ids already held are skipped and freed slots are filled before growing
+    assert store.add(move_ids) == (piece_ids == removed_piece).sum()
+    assert sorted(store.move_ids.tolist()) == sorted(move_ids.tolist())
+    assert store.nbytes == ValidMoveStore.from_move_ids(move_ids).nbytes
+
+    copy = store.copy()
+    store.remove_overlapping(np.ones_like(midgame_board.array, dtype=bool))
+    assert len(store) == 0 and all(not len(store.select([piece_id])) for piece_id in set(piece_ids.tolist()))
+    assert sorted(copy.move_ids.tolist()) == sorted(move_ids.tolist())
+
+
+@pytest.mark.unit
+def test_store_nbytes_is_everything_it_holds(midgame_board):
+    store = ValidMoveStore.from_move_ids(midgame_board.get_valid_moves_for_colour(BoardStatesEnum.RED).move_ids)
+    tracemalloc.start()
+    copy = store.copy()
+    traced = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # only the objects and array headers are held on top of the array data
+    assert store.nbytes <= traced <= store.nbytes + 512
+    assert copy.nbytes == store.nbytes
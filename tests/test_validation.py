@@ -0,0 +1,66 @@
+# Python Imports
+import pytest
+
+# Internal Imports
+from blokus.board import get_validation_pipeline
+from blokus.board_states import BoardStatesEnum
+from blokus.validation import MoveFailureEnum, ValidationPipeline, compile_validators
+
+
+def reject(failure: MoveFailureEnum):
+    return lambda board, move: failure if move == "reject" else MoveFailureEnum.VALID
+
+
+@pytest.mark.unit
+def test_compile_validators_returns_first_failure():
+    validate = compile_validators([reject(MoveFailureEnum.OVERLAP), reject(MoveFailureEnum.EDGE_RELATION)])
+    assert validate(None, "reject") == MoveFailureEnum.OVERLAP
+    assert validate(None, "valid") == MoveFailureEnum.VALID
+    assert compile_validators([])(None, "reject") == MoveFailureEnum.VALID
+
+
+@pytest.mark.unit
+def test_pipeline_reorders_by_rejection_rate():
+    pipeline = ValidationPipeline(
+        {
+            MoveFailureEnum.OUT_OF_BOUNDS: lambda board, move: MoveFailureEnum.VALID,
+            MoveFailureEnum.OVERLAP: lambda board, move: MoveFailureEnum.VALID,
+            MoveFailureEnum.CORNER_RELATION: reject(MoveFailureEnum.CORNER_RELATION),
+        },
+        reorder_interval=10,
+    )
+    for _ in range(9):
+        assert pipeline.check(None, "reject") == MoveFailureEnum.CORNER_RELATION
+    assert pipeline.order == [MoveFailureEnum.OUT_OF_BOUNDS, MoveFailureEnum.OVERLAP, MoveFailureEnum.CORNER_RELATION]
+
+    # the pinned validator stays first
+    pipeline.check(None, "reject")
+    assert pipeline.order == [MoveFailureEnum.OUT_OF_BOUNDS, MoveFailureEnum.CORNER_RELATION, MoveFailureEnum.OVERLAP]
+    assert pipeline.checks == 10
+    assert pipeline.rejection_counts[MoveFailureEnum.CORNER_RELATION] == 10
+
+    # diagnostics keep the supplied order
+    assert pipeline.check_all(None, "reject") == [MoveFailureEnum.CORNER_RELATION]
+
+
+@pytest.mark.unit
+def test_diagnostics_are_ordered_and_not_counted(midgame_board):
+    pipeline = get_validation_pipeline()
+    # replaying a move of red fails several checks
+    move = next(move for move in midgame_board.move_list if move.colour == BoardStatesEnum.RED)
+
+    checks = pipeline.checks
+    order = pipeline.order
+    failures = pipeline.check_all(midgame_board, move)
+    errors = midgame_board.check_move_validity(move, return_at_first_fail=False)
+    assert pipeline.checks == checks
+    assert pipeline.order == order
+
+    initial_order = list(MoveFailureEnum)[1:]
+    assert len(failures) > 1
+    assert failures == sorted(failures, key=initial_order.index)
+    assert len(errors) == len(failures)
+    assert len(midgame_board.check_move_validity(move)) == 1
+
+    assert midgame_board.get_move_failure(move) in failures
+    assert pipeline.checks == checks + 1